@@ -0,0 +1,258 @@
+# Infrastructure/aws/s3/cache.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import xxhash
+from botocore.exceptions import ClientError
+from filelock import FileLock
+
+from Infrastructure.aws.s3.config import get_s3_config
+from Infrastructure.aws.s3.manifest import CHUNK_SIZE
+from Infrastructure.monitoring.metrics import instrument_call
+
+
+@dataclass
+class CacheStats:
+    """
+    Counters describing cache activity in the current process.
+
+    Attributes:
+        hits (int): Requests served from disk (including 304 revalidations).
+        misses (int): Requests that required downloading the object.
+        revalidations (int): Conditional requests answered with 304 Not Modified.
+        evictions (int): Entries removed to stay under the size cap.
+        bytes_downloaded (int): Bytes fetched from S3.
+        bytes_served (int): Bytes served from disk without downloading.
+    """
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    evictions: int = 0
+    bytes_downloaded: int = 0
+    bytes_served: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class S3Cache:
+    """
+    Read-through, content-addressed disk cache for S3 objects.
+
+    Layout under `cache_dir`:
+        objects/<xx>/<xxh3>   file contents, named by their hash (deduplicated)
+        keys/<sha256>.json    index entry of a key: etag, blob, size
+        locks/<sha256>.lock   per-key inter-process lock
+
+    The index file mtime records the last access and drives LRU eviction, so
+    several processes (e.g. API workers) can share one cache directory.
+    """
+
+    def __init__(self, manager, cache_dir: str = None, max_bytes: int = None,
+                 revalidate_after: float = 0.0):
+        """
+        Args:
+            manager (S3Manager): Manager providing the boto3 client and bucket.
+            cache_dir (str): Cache root (defaults to S3_CACHE_DIR).
+            max_bytes (int): Size cap for cached objects (defaults to S3_CACHE_MAX_MB).
+            revalidate_after (float): Seconds during which a cached entry is trusted
+                                      without a conditional request. 0 revalidates
+                                      on every access.
+        """
+        config = get_s3_config()
+        self.manager = manager
+        self.cache_dir = Path(cache_dir or config["cache_dir"]).expanduser()
+        self.max_bytes = max_bytes if max_bytes is not None else config["cache_max_bytes"]
+        self.revalidate_after = revalidate_after
+        self.stats = CacheStats()
+        self._stats_lock = threading.Lock()
+        for sub in ("objects", "keys", "locks"):
+            (self.cache_dir / sub).mkdir(parents=True, exist_ok=True)
+
+    @instrument_call("s3", "cache_get")
+    def get(self, s3_key: str) -> Path:
+        """
+        Returns a local path holding the current content of an S3 object.
+
+        On a cached entry a conditional GET (If-None-Match) is sent; a 304 answer
+        serves the file from disk. Concurrent calls for the same key, from threads
+        or processes, wait on a file lock so the object is downloaded only once.
+
+        Args:
+            s3_key (str): Key of the object (e.g. "models/intent/tokenizer.json").
+
+        Returns:
+            Path: Path to the cached file. Treat it as read-only.
+        """
+        key_id = hashlib.sha256(f"{self.manager.bucket}/{s3_key}".encode()).hexdigest()
+        index_path = self.cache_dir / "keys" / f"{key_id}.json"
+
+        with FileLock(str(self.cache_dir / "locks" / f"{key_id}.lock")):
+            entry = self._read_entry(index_path)
+            blob = self.cache_dir / entry["blob"] if entry else None
+            if blob is not None and blob.exists():
+                if time.time() - index_path.stat().st_mtime < self.revalidate_after:
+                    return self._serve(index_path, blob, revalidated=False)
+                try:
+                    response = self.manager.s3.get_object(
+                        Bucket=self.manager.bucket, Key=s3_key, IfNoneMatch=entry["etag"]
+                    )
+                except ClientError as e:
+                    if e.response["Error"]["Code"] not in ("304", "NotModified"):
+                        raise
+                    return self._serve(index_path, blob, revalidated=True)
+            else:
+                response = self.manager.s3.get_object(Bucket=self.manager.bucket, Key=s3_key)
+
+            tmp, digest = self._download(response)
+            # Blobs are shared between keys: publishing one and indexing it must
+            # be atomic for `_release_blob` and `evict`, which delete unreferenced blobs
+            with FileLock(str(self.cache_dir / "locks" / "evict.lock")):
+                blob = self._publish(tmp, digest)
+                self._write_entry(index_path, {
+                    "key": s3_key,
+                    "etag": response["ETag"],
+                    "blob": str(blob.relative_to(self.cache_dir)),
+                    "size": blob.stat().st_size,
+                })
+                # A changed object leaves its previous version behind: drop it unless shared
+                if entry and entry["blob"] != str(blob.relative_to(self.cache_dir)):
+                    self._release_blob(entry["blob"])
+            with self._stats_lock:
+                self.stats.misses += 1
+                self.stats.bytes_downloaded += blob.stat().st_size
+
+        self.evict(keep=index_path)
+        return blob
+
+    def evict(self, keep: Path = None) -> int:
+        """
+        Removes least-recently-used entries until the cache fits under `max_bytes`.
+
+        Args:
+            keep (Path): (Optional) Index entry that must survive, typically the
+                         one just returned to the caller.
+
+        Returns:
+            int: Number of index entries removed.
+        """
+        with FileLock(str(self.cache_dir / "locks" / "evict.lock")):
+            entries = []
+            for index_path in (self.cache_dir / "keys").glob("*.json"):
+                entry = self._read_entry(index_path)
+                if entry:
+                    entries.append((index_path.stat().st_mtime, index_path, entry))
+            # Blobs are shared by keys with identical content: count them once
+            sizes = {entry["blob"]: entry["size"] for _, _, entry in entries}
+            total = sum(sizes.values())
+            if total <= self.max_bytes:
+                return 0
+
+            entries.sort(key=lambda item: item[0])
+            refs = {}
+            for _, _, entry in entries:
+                refs[entry["blob"]] = refs.get(entry["blob"], 0) + 1
+
+            removed = 0
+            for _, index_path, entry in entries:
+                if total <= self.max_bytes:
+                    break
+                if index_path == keep:
+                    continue
+                index_path.unlink(missing_ok=True)
+                removed += 1
+                refs[entry["blob"]] -= 1
+                if refs[entry["blob"]] == 0:
+                    (self.cache_dir / entry["blob"]).unlink(missing_ok=True)
+                    total -= entry["size"]
+
+        with self._stats_lock:
+            self.stats.evictions += removed
+        return removed
+
+    def metrics(self) -> dict:
+        """
+        Returns cache counters plus the current on-disk footprint.
+
+        Returns:
+            dict: Counters from CacheStats, hit_ratio, entries and size_bytes.
+        """
+        blobs = [p for p in (self.cache_dir / "objects").rglob("*") if p.is_file()]
+        return {
+            **asdict(self.stats),
+            "hit_ratio": round(self.stats.hit_ratio, 4),
+            "entries": sum(1 for _ in (self.cache_dir / "keys").glob("*.json")),
+            "size_bytes": sum(p.stat().st_size for p in blobs),
+        }
+
+    def _release_blob(self, blob: str) -> bool:
+        """
+        Deletes a blob that no index entry points to any more.
+
+        The caller must hold the eviction lock, so that no other process can
+        publish the same blob between the reference scan and the deletion.
+
+        Args:
+            blob (str): Blob path relative to the cache root.
+
+        Returns:
+            bool: True when the blob was deleted.
+        """
+        for index_path in (self.cache_dir / "keys").glob("*.json"):
+            entry = self._read_entry(index_path)
+            if entry and entry["blob"] == blob:
+                return False
+        (self.cache_dir / blob).unlink(missing_ok=True)
+        return True
+
+    def _serve(self, index_path: Path, blob: Path, revalidated: bool) -> Path:
+        """Marks an entry as recently used and records a hit."""
+        os.utime(index_path)
+        with self._stats_lock:
+            self.stats.hits += 1
+            self.stats.revalidations += int(revalidated)
+            self.stats.bytes_served += blob.stat().st_size
+        return blob
+
+    def _download(self, response: dict) -> tuple:
+        """
+        Streams a get_object body to a temp file while hashing it.
+
+        Returns:
+            tuple: (temp file path, xxh3 hex digest of the content)
+        """
+        hasher = xxhash.xxh3_64()
+        tmp = self.cache_dir / "objects" / f".tmp-{os.getpid()}-{threading.get_ident()}"
+        with open(tmp, "wb") as f:
+            for chunk in response["Body"].iter_chunks(CHUNK_SIZE):
+                hasher.update(chunk)
+                f.write(chunk)
+        return tmp, hasher.hexdigest()
+
+    def _publish(self, tmp: Path, digest: str) -> Path:
+        """Moves a downloaded temp file to its content-addressed location."""
+        blob = self.cache_dir / "objects" / digest[:2] / digest
+        blob.parent.mkdir(exist_ok=True)
+        os.replace(tmp, blob)
+        return blob
+
+    @staticmethod
+    def _read_entry(index_path: Path):
+        try:
+            return json.loads(index_path.read_text())
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _write_entry(index_path: Path, entry: dict) -> None:
+        tmp = index_path.with_suffix(".tmp")
+        tmp.write_text(json.dumps(entry))
+        os.replace(tmp, index_path)
@@ -1,10 +1,37 @@
 # Infrastructure/aws/s3/config.py
 
 import os
-from dotenv import load_dotenv
+from functools import lru_cache
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+ENV_PATH = PROJECT_ROOT / "env_folder" / ".env.s3"
+
+MB = 1024 * 1024
+
+# Transfer defaults, tuned for many small artifacts (visuals, CSVs) plus a few
+# large model checkpoints. Each value can be overridden from the .env file.
+DEFAULT_MULTIPART_THRESHOLD_MB = 16
+DEFAULT_MULTIPART_CHUNKSIZE_MB = 16
+DEFAULT_MAX_CONCURRENCY = 8
+DEFAULT_MAX_WORKERS = 16
+
+# Local read-through cache for datasets and model artifacts
+DEFAULT_CACHE_DIR = "~/.cache/fitness-ai/s3"
+DEFAULT_CACHE_MAX_MB = 5120
+
+
+@lru_cache(maxsize=None)
+def load_s3_env():
+    """
+    Loads env_folder/.env.s3 into the environment, once per process.
+
+    Called on first use rather than at import so importing S3 modules stays
+    cheap; variables already set in the environment take precedence.
+    """
+    from dotenv import load_dotenv
+    load_dotenv(dotenv_path=ENV_PATH)
 
-# Load environment variables from the .env file
-load_dotenv(dotenv_path="env_folder/.env.s3")
 
 def get_s3_config():
     """
@@ -16,10 +43,25 @@ def get_s3_config():
             - region (str): AWS region name (e.g., "eu-west-3")
             - access_key (str): AWS access key ID
             - secret_key (str): AWS secret access key
+            - endpoint_url (str | None): Custom endpoint (e.g., a local MinIO)
+            - multipart_threshold (int): Size in bytes above which multipart is used
+            - multipart_chunksize (int): Size in bytes of each multipart part
+            - max_concurrency (int): Threads used per file by multipart transfers
+            - max_workers (int): Files transferred in parallel by directory operations
+            - cache_dir (str): Root of the local S3 object cache
+            - cache_max_bytes (int): Size cap of the local cache in bytes
     """
+    load_s3_env()
     return {
         "bucket": os.getenv("S3_BUCKET"),
         "region": os.getenv("AWS_REGION"),
         "access_key": os.getenv("AWS_ACCESS_KEY_ID"),
         "secret_key": os.getenv("AWS_SECRET_ACCESS_KEY"),
-    }
\ No newline at end of file
+        "endpoint_url": os.getenv("S3_ENDPOINT_URL") or None,
+        "multipart_threshold": int(os.getenv("S3_MULTIPART_THRESHOLD_MB", DEFAULT_MULTIPART_THRESHOLD_MB)) * MB,
+        "multipart_chunksize": int(os.getenv("S3_MULTIPART_CHUNKSIZE_MB", DEFAULT_MULTIPART_CHUNKSIZE_MB)) * MB,
+        "max_concurrency": int(os.getenv("S3_MAX_CONCURRENCY", DEFAULT_MAX_CONCURRENCY)),
+        "max_workers": int(os.getenv("S3_MAX_WORKERS", DEFAULT_MAX_WORKERS)),
+        "cache_dir": os.getenv("S3_CACHE_DIR", DEFAULT_CACHE_DIR),
+        "cache_max_bytes": int(os.getenv("S3_CACHE_MAX_MB", DEFAULT_CACHE_MAX_MB)) * MB,
+    }
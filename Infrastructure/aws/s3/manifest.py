@@ -0,0 +1,182 @@
+# Infrastructure/aws/s3/manifest.py
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+import xxhash
+
+from Infrastructure.aws.s3.utils import walk_files
+
+# File name used both for the local cache and the remote manifest object
+MANIFEST_NAME = ".s3manifest.json"
+MANIFEST_VERSION = 1
+CHUNK_SIZE = 1024 * 1024
+
+
+def hash_file(path, chunk_size: int = CHUNK_SIZE) -> str:
+    """
+    Computes the xxh3-64 digest of a file, streaming it in chunks.
+
+    Args:
+        path (str | Path): File to hash.
+        chunk_size (int): Read size in bytes.
+
+    Returns:
+        str: Hex digest.
+    """
+    hasher = xxhash.xxh3_64()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def md5_file(path, chunk_size: int = CHUNK_SIZE) -> str:
+    """
+    Computes the MD5 hex digest of a file (the ETag of a single-part S3 upload).
+
+    Args:
+        path (str | Path): File to hash.
+        chunk_size (int): Read size in bytes.
+
+    Returns:
+        str: Hex digest.
+    """
+    hasher = hashlib.md5()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def build_manifest(local_dir: str, previous: dict = None) -> dict:
+    """
+    Builds the manifest of a local directory: relative path -> hash, size, mtime.
+
+    Files whose size and mtime match the `previous` manifest reuse its hash,
+    so an unchanged tree is scanned with stat() calls only.
+
+    Args:
+        local_dir (str): Directory to describe.
+        previous (dict): (Optional) Last manifest built for this directory.
+
+    Returns:
+        dict: {relative_path: {"xxh3": str, "size": int, "mtime_ns": int}}
+    """
+    previous = previous or {}
+    manifest = {}
+    for path in walk_files(local_dir):
+        relative = os.path.relpath(path, local_dir).replace(os.sep, "/")
+        if relative == MANIFEST_NAME:
+            continue
+        stat = path.stat()
+        cached = previous.get(relative)
+        if cached and cached["size"] == stat.st_size and cached.get("mtime_ns") == stat.st_mtime_ns:
+            digest = cached["xxh3"]
+        else:
+            digest = hash_file(path)
+        manifest[relative] = {"xxh3": digest, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+    return manifest
+
+
+def diff_manifests(local: dict, remote: dict) -> tuple[list[str], list[str]]:
+    """
+    Compares two manifests by content hash and size.
+
+    Args:
+        local (dict): Manifest of the local directory.
+        remote (dict): Manifest describing what is already stored in S3.
+
+    Returns:
+        tuple[list[str], list[str]]: (paths to upload, remote paths absent locally)
+    """
+    changed = sorted(
+        path for path, entry in local.items()
+        if path not in remote
+        or remote[path]["xxh3"] != entry["xxh3"]
+        or remote[path]["size"] != entry["size"]
+    )
+    removed = sorted(set(remote) - set(local))
+    return changed, removed
+
+
+def load_manifest(path) -> dict:
+    """
+    Reads a manifest file, returning an empty manifest if it is missing or invalid.
+
+    Args:
+        path (str | Path): Manifest location.
+
+    Returns:
+        dict: The "files" section of the manifest.
+    """
+    try:
+        return loads_manifest(Path(path).read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def loads_manifest(raw: bytes) -> dict:
+    """
+    Parses a serialized manifest.
+
+    Args:
+        raw (bytes): JSON document produced by `dumps_manifest`.
+
+    Returns:
+        dict: The "files" section of the manifest.
+    """
+    document = json.loads(raw)
+    if document.get("version") != MANIFEST_VERSION:
+        return {}
+    return document.get("files", {})
+
+
+def dumps_manifest(files: dict) -> bytes:
+    """
+    Serializes a manifest to JSON bytes.
+
+    Args:
+        files (dict): Manifest entries.
+
+    Returns:
+        bytes: JSON document with a version tag.
+    """
+    return json.dumps({"version": MANIFEST_VERSION, "files": files}, indent=1, sort_keys=True).encode()
+
+
+def save_manifest(path, files: dict) -> None:
+    """
+    Writes a manifest atomically (temp file + rename).
+
+    Args:
+        path (str | Path): Destination.
+        files (dict): Manifest entries.
+    """
+    path = Path(path)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(dumps_manifest(files))
+    os.replace(tmp, path)
+
+
+def etag_matches(path, etag: str) -> bool:
+    """
+    Checks a local file against an S3 ETag.
+
+    Only single-part ETags are plain MD5 digests; multipart ETags ("<md5>-<n>")
+    depend on the part size and are treated as a mismatch.
+
+    Args:
+        path (str | Path): Local file.
+        etag (str): ETag returned by S3 (quotes allowed).
+
+    Returns:
+        bool: True when the content is known to be identical.
+    """
+    etag = etag.strip('"')
+    if "-" in etag:
+        return False
+    return md5_file(path) == etag
+
@@ -0,0 +1,209 @@
+# Infrastructure/aws/s3/reader.py
+
+import io
+from urllib.parse import urlparse
+
+import pandas as pd
+
+# Read-ahead used when wrapping ranged reads in a buffer. Parquet footers and
+# column chunks are read in a handful of large ranges, CSV sequentially.
+DEFAULT_BUFFER_SIZE = 1024 * 1024
+
+
+def parse_s3_uri(uri: str) -> tuple[str, str]:
+    """
+    Splits an "s3://bucket/key" URI.
+
+    Args:
+        uri (str): S3 URI.
+
+    Returns:
+        tuple[str, str]: (bucket, key)
+    """
+    parsed = urlparse(uri)
+    if parsed.scheme != "s3" or not parsed.netloc:
+        raise ValueError(f"❌ Not an S3 URI: {uri}")
+    return parsed.netloc, parsed.path.lstrip("/")
+
+
+def resolve_location(manager, uri: str) -> tuple[str, str]:
+    """
+    Resolves an S3 URI, or a bare key relative to the manager's bucket.
+
+    Args:
+        manager (S3Manager): Manager whose bucket is used for bare keys.
+        uri (str): "s3://bucket/key" or "key".
+
+    Returns:
+        tuple[str, str]: (bucket, key)
+    """
+    if uri.startswith("s3://"):
+        return parse_s3_uri(uri)
+    return manager.bucket, uri
+
+
+class S3RangeReader(io.RawIOBase):
+    """
+    Seekable, read-only file object backed by HTTP range requests.
+
+    Nothing is downloaded up front: each read fetches only the requested byte
+    range, which lets pyarrow read a Parquet footer and then only the column
+    chunks it needs.
+
+    Attributes:
+        requests (int): Number of GET requests issued.
+        bytes_fetched (int): Total bytes received from S3.
+    """
+
+    def __init__(self, client, bucket: str, key: str):
+        super().__init__()
+        self.client = client
+        self.bucket = bucket
+        self.key = key
+        self.size = client.head_object(Bucket=bucket, Key=key)["ContentLength"]
+        self.position = 0
+        self.requests = 0
+        self.bytes_fetched = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.position
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            self.position = offset
+        elif whence == io.SEEK_CUR:
+            self.position += offset
+        elif whence == io.SEEK_END:
+            self.position = self.size + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        return self.position
+
+    def readinto(self, buffer) -> int:
+        if self.position >= self.size or len(buffer) == 0:
+            return 0
+        end = min(self.position + len(buffer), self.size) - 1
+        body = self.client.get_object(
+            Bucket=self.bucket, Key=self.key, Range=f"bytes={self.position}-{end}"
+        )["Body"].read()
+        self.requests += 1
+        self.bytes_fetched += len(body)
+        buffer[:len(body)] = body
+        self.position += len(body)
+        return len(body)
+
+
+def open_s3(manager, uri: str, buffer_size: int = DEFAULT_BUFFER_SIZE) -> io.BufferedReader:
+    """
+    Opens an S3 object as a buffered, seekable binary file.
+
+    Args:
+        manager (S3Manager): Manager providing the boto3 client.
+        uri (str): "s3://bucket/key" URI, or a bare key in the manager's bucket.
+        buffer_size (int): Read-ahead size per range request.
+
+    Returns:
+        io.BufferedReader: File object; its `.raw` exposes request counters.
+    """
+    bucket, key = resolve_location(manager, uri)
+    return io.BufferedReader(S3RangeReader(manager.s3, bucket, key), buffer_size=buffer_size)
+
+
+def read_csv_chunks(manager, uri: str, chunksize: int = 100_000, **kwargs):
+    """
+    Streams a CSV object into DataFrames of `chunksize` rows.
+
+    The body is consumed sequentially from a single GET, so memory is bounded
+    by one chunk and no temporary file is written.
+
+    Args:
+        manager (S3Manager): Manager providing the boto3 client.
+        uri (str): "s3://bucket/key" URI, or a bare key in the manager's bucket.
+        chunksize (int): Rows per DataFrame.
+        **kwargs: Forwarded to pandas.read_csv.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of the file.
+    """
+    bucket, key = resolve_location(manager, uri)
+    body = manager.s3.get_object(Bucket=bucket, Key=key)["Body"]
+    try:
+        with pd.read_csv(body, chunksize=chunksize, **kwargs) as reader:
+            yield from reader
+    finally:
+        body.close()
+
+
+def read_csv(manager, uri: str, **kwargs) -> pd.DataFrame:
+    """
+    Reads a whole CSV object into a DataFrame straight from the response stream.
+
+    Args:
+        manager (S3Manager): Manager providing the boto3 client.
+        uri (str): "s3://bucket/key" URI, or a bare key in the manager's bucket.
+        **kwargs: Forwarded to pandas.read_csv.
+
+    Returns:
+        pd.DataFrame: The parsed dataset.
+    """
+    bucket, key = resolve_location(manager, uri)
+    body = manager.s3.get_object(Bucket=bucket, Key=key)["Body"]
+    try:
+        return pd.read_csv(body, **kwargs)
+    finally:
+        body.close()
+
+
+def read_parquet(manager, uri: str, columns: list[str] = None, row_groups: list[int] = None,
+                 buffer_size: int = DEFAULT_BUFFER_SIZE):
+    """
+    Reads selected columns / row groups of a Parquet object with range requests.
+
+    Only the footer and the column chunks of the requested row groups are
+    fetched from S3.
+
+    Args:
+        manager (S3Manager): Manager providing the boto3 client.
+        uri (str): "s3://bucket/key" URI, or a bare key in the manager's bucket.
+        columns (list[str]): (Optional) Columns to read; all by default.
+        row_groups (list[int]): (Optional) Row group indices; all by default.
+        buffer_size (int): Read-ahead size per range request.
+
+    Returns:
+        pyarrow.Table: The selected data. Use `.to_pandas()` for a DataFrame.
+    """
+    import pyarrow.parquet as pq
+
+    with open_s3(manager, uri, buffer_size=buffer_size) as f:
+        parquet = pq.ParquetFile(f)
+        if row_groups is None:
+            return parquet.read(columns=columns)
+        return parquet.read_row_groups(row_groups, columns=columns)
+
+
+def iter_parquet_batches(manager, uri: str, columns: list[str] = None, batch_size: int = 65_536,
+                         buffer_size: int = DEFAULT_BUFFER_SIZE):
+    """
+    Streams a Parquet object as pandas DataFrames, one record batch at a time.
+
+    Args:
+        manager (S3Manager): Manager providing the boto3 client.
+        uri (str): "s3://bucket/key" URI, or a bare key in the manager's bucket.
+        columns (list[str]): (Optional) Columns to read; all by default.
+        batch_size (int): Maximum rows per DataFrame.
+        buffer_size (int): Read-ahead size per range request.
+
+    Yields:
+        pd.DataFrame: Consecutive batches of the file.
+    """
+    import pyarrow.parquet as pq
+
+    with open_s3(manager, uri, buffer_size=buffer_size) as f:
+        for batch in pq.ParquetFile(f).iter_batches(batch_size=batch_size, columns=columns):
+            yield batch.to_pandas()
@@ -1,16 +1,48 @@
 # Infrastructure/aws/s3/s3_manager.py
 
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
 import boto3
-from botocore.exceptions import ClientError, NoCredentialsError
+from boto3.exceptions import S3UploadFailedError
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 from Infrastructure.aws.s3.config import get_s3_config
+from Infrastructure.aws.s3.manifest import (
+    MANIFEST_NAME,
+    build_manifest,
+    diff_manifests,
+    dumps_manifest,
+    etag_matches,
+    load_manifest,
+    loads_manifest,
+    save_manifest,
+)
+from Infrastructure.aws.s3.utils import (
+    ProgressTracker,
+    Timer,
+    TransferResult,
+    batched,
+    folder_prefix,
+    join_key,
+    key_to_relative,
+    walk_files,
+)
+from Infrastructure.monitoring.metrics import instrument_call
+
+# Hard limit of keys accepted by a single DeleteObjects request
+MAX_DELETE_BATCH = 1000
 
 
 class S3Manager:
     """
     A manager class for interacting with an AWS S3 bucket.
 
-    Provides methods for uploading, downloading, listing, and deleting files.
-    Credentials and bucket configuration are automatically loaded from .env.
+    Provides methods for uploading, downloading, listing, and deleting files,
+    plus parallel directory transfers. Credentials, bucket configuration and
+    transfer tuning are automatically loaded from .env.
     """
 
     def __init__(self):
@@ -20,13 +52,25 @@ class S3Manager:
         """
         config = get_s3_config()
         self.bucket = config["bucket"]
+        self.max_workers = config["max_workers"]
+        self.transfer_config = TransferConfig(
+            multipart_threshold=config["multipart_threshold"],
+            multipart_chunksize=config["multipart_chunksize"],
+            max_concurrency=config["max_concurrency"],
+            use_threads=True,
+        )
+        # The connection pool must cover every file worker times its multipart
+        # threads, otherwise botocore blocks waiting for a free connection.
         self.s3 = boto3.client(
             "s3",
             aws_access_key_id=config["access_key"],
             aws_secret_access_key=config["secret_key"],
-            region_name=config["region"]
+            region_name=config["region"],
+            endpoint_url=config["endpoint_url"],
+            config=Config(max_pool_connections=self.max_workers * config["max_concurrency"]),
         )
 
+    @instrument_call("s3")
     def upload(self, local_path: str, s3_key: str):
         """
         Uploads a local file to the S3 bucket.
@@ -46,6 +90,7 @@ class S3Manager:
         except NoCredentialsError:
             print("❌ AWS credentials not found!")
 
+    @instrument_call("s3")
     def download(self, s3_key: str, local_path: str):
         """
         Downloads a file from the S3 bucket to the local filesystem.
@@ -63,10 +108,74 @@ class S3Manager:
         except ClientError as e:
             print(f"❌ Error: {e}")
 
+    def iter_objects(self, prefix: str = ""):
+        """
+        Lazily yields every object under a prefix, following continuation tokens.
+
+        Pages of up to 1000 keys are fetched on demand, so memory stays flat
+        regardless of bucket size.
+
+        Args:
+            prefix (str): (Optional) The S3 folder path to filter files.
+
+        Yields:
+            dict: Object metadata with "Key", "Size", "ETag" and "LastModified".
+        """
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix):
+            yield from page.get("Contents", [])
+
+    def iter_keys(self, prefix: str = ""):
+        """
+        Lazily yields every key under a prefix.
+
+        Args:
+            prefix (str): (Optional) The S3 folder path to filter files.
+
+        Yields:
+            str: Object keys in lexicographic order.
+        """
+        for obj in self.iter_objects(prefix):
+            yield obj["Key"]
+
+    def iter_objects_sharded(self, prefix: str = "", max_workers: int = None):
+        """
+        Lists a large prefix in parallel, one thread per first-level sub-prefix.
+
+        A single delimited request discovers the sub-prefixes ("folders") right
+        under `prefix`; each one is then paginated on its own thread. Objects are
+        yielded shard by shard as soon as a shard finishes, so the order is not
+        lexicographic.
+
+        Args:
+            prefix (str): (Optional) The S3 folder path to list.
+            max_workers (int): Number of shards listed concurrently
+                               (defaults to S3_MAX_WORKERS).
+
+        Yields:
+            dict: Object metadata with "Key", "Size", "ETag" and "LastModified".
+        """
+        prefix = folder_prefix(prefix)
+        shards = []
+        paginator = self.s3.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix, Delimiter="/"):
+            # Objects sitting directly under the prefix are not part of any shard
+            yield from page.get("Contents", [])
+            shards.extend(p["Prefix"] for p in page.get("CommonPrefixes", []))
+
+        with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as pool:
+            futures = [pool.submit(lambda shard: list(self.iter_objects(shard)), shard) for shard in shards]
+            for future in as_completed(futures):
+                yield from future.result()
+
+    @instrument_call("s3")
     def list(self, prefix: str = ""):
         """
         Lists all files (keys) in the S3 bucket under the given prefix.
 
+        Follows continuation tokens, so listings are no longer capped at 1000 keys.
+        Prefer `iter_keys` for large prefixes to avoid building the full list.
+
         Args:
             prefix (str): (Optional) The S3 folder path to filter files.
 
@@ -74,16 +183,14 @@ class S3Manager:
             List[str]: A list of keys (file paths) in the bucket.
         """
         try:
-            response = self.s3.list_objects_v2(Bucket=self.bucket, Prefix=prefix)
-            files = [obj["Key"] for obj in response.get("Contents", [])]
-            print(f"📁 Files in s3://{self.bucket}/{prefix}:")
-            for f in files:
-                print(" -", f)
+            files = list(self.iter_keys(prefix))
+            print(f"📁 {len(files)} files in s3://{self.bucket}/{prefix}")
             return files
         except Exception as e:
             print(f"❌ Error listing files: {e}")
             return []
 
+    @instrument_call("s3")
     def delete(self, s3_key: str):
         """
         Deletes a file from the S3 bucket.
@@ -98,4 +205,267 @@ class S3Manager:
             self.s3.delete_object(Bucket=self.bucket, Key=s3_key)
             print(f"🗑️ Deleted: s3://{self.bucket}/{s3_key}")
         except ClientError as e:
-            print(f"❌ Error deleting file: {e}")
\ No newline at end of file
+            print(f"❌ Error deleting file: {e}")
+
+    @instrument_call("s3")
+    def delete_many(self, keys, batch_size: int = MAX_DELETE_BATCH) -> TransferResult:
+        """
+        Deletes keys in batches through `delete_objects` (one request per 1000 keys).
+
+        Args:
+            keys (Iterable[str]): Keys to delete; may be a lazy generator such as
+                                  `iter_keys(prefix)`.
+            batch_size (int): Keys per request, capped at the S3 limit of 1000.
+
+        Returns:
+            TransferResult: Deleted keys and per-key error messages.
+        """
+        batch_size = min(batch_size, MAX_DELETE_BATCH)
+        result = TransferResult()
+        with Timer() as timer:
+            for batch in batched(keys, batch_size):
+                try:
+                    response = self.s3.delete_objects(
+                        Bucket=self.bucket,
+                        Delete={"Objects": [{"Key": key} for key in batch], "Quiet": True},
+                    )
+                except (ClientError, BotoCoreError) as e:
+                    result.failed.update({key: str(e) for key in batch})
+                    continue
+                errors = {
+                    err["Key"]: f"{err.get('Code')}: {err.get('Message')}"
+                    for err in response.get("Errors", [])
+                }
+                result.failed.update(errors)
+                result.succeeded.extend(key for key in batch if key not in errors)
+        result.elapsed = timer.elapsed
+        return result
+
+    def delete_prefix(self, prefix: str) -> TransferResult:
+        """
+        Deletes every object under a prefix (e.g. an old run folder).
+
+        Keys are listed page by page and removed in batched deletes, so a
+        prefix with N objects costs about 2 * N / 1000 requests.
+
+        Args:
+            prefix (str): S3 folder path to remove. Must not be empty. Only the
+                          folder itself is removed: "runs/1" does not touch
+                          "runs/10/".
+
+        Returns:
+            TransferResult: Deleted keys and per-key error messages.
+        """
+        prefix = folder_prefix(prefix)
+        if not prefix:
+            raise ValueError("❌ Refusing to delete the whole bucket: prefix is empty.")
+        # Materialise the keys first so deletions cannot interfere with pagination
+        return self.delete_many(list(self.iter_keys(prefix)))
+
+    @instrument_call("s3")
+    def upload_dir(self, local_dir: str, prefix: str = "", max_workers: int = None,
+                   progress=None) -> TransferResult:
+        """
+        Uploads every file under a local directory, preserving the relative layout.
+
+        Files are sent concurrently on a bounded thread pool; large files are
+        additionally split into multipart chunks according to the transfer config.
+
+        Args:
+            local_dir (str): Local directory to publish (e.g. "data/processed").
+            prefix (str): Key prefix under which the tree is stored in S3.
+            max_workers (int): Number of files transferred in parallel
+                               (defaults to S3_MAX_WORKERS).
+            progress (callable): Optional callback(bytes_done, bytes_total),
+                                 called from worker threads.
+
+        Returns:
+            TransferResult: Uploaded keys, per-key errors, byte count and duration.
+        """
+        jobs = {
+            join_key(prefix, os.path.relpath(path, local_dir)): path
+            for path in walk_files(local_dir)
+            # The local manifest cache left by sync_dir is not part of the tree
+            if os.path.relpath(path, local_dir) != MANIFEST_NAME
+        }
+        return self._upload_jobs(jobs, max_workers, progress)
+
+    @instrument_call("s3")
+    def download_dir(self, prefix: str, local_dir: str, max_workers: int = None,
+                     progress=None) -> TransferResult:
+        """
+        Downloads every object under a prefix into a local directory.
+
+        Args:
+            prefix (str): S3 folder to mirror locally ("runs/1" does not include "runs/10/").
+            local_dir (str): Destination directory (created if needed).
+            max_workers (int): Number of files transferred in parallel
+                               (defaults to S3_MAX_WORKERS).
+            progress (callable): Optional callback(bytes_done, bytes_total),
+                                 called from worker threads.
+
+        Returns:
+            TransferResult: Downloaded keys, per-key errors, byte count and duration.
+        """
+        prefix = folder_prefix(prefix)
+        objects = {
+            obj["Key"]: obj["Size"]
+            for obj in self.iter_objects(prefix)
+            if not obj["Key"].endswith("/")
+        }
+        jobs = {
+            key: Path(local_dir) / key_to_relative(prefix, key)
+            for key in objects
+        }
+        tracker = ProgressTracker(progress, total=sum(objects.values()))
+
+        def _download(key, path):
+            path.parent.mkdir(parents=True, exist_ok=True)
+            self.s3.download_file(self.bucket, key, str(path),
+                                  Config=self.transfer_config, Callback=tracker)
+            return objects[key]
+
+        return self._run_transfers(_download, jobs, max_workers)
+
+    @instrument_call("s3")
+    def sync_dir(self, local_dir: str, prefix: str = "", delete: bool = False,
+                 max_workers: int = None, progress=None) -> TransferResult:
+        """
+        Uploads only the files that are new or changed since the last sync.
+
+        A local manifest (xxh3 hash, size, mtime) is cached in
+        `<local_dir>/.s3manifest.json` so unchanged files are not re-hashed, and a
+        remote copy is stored at `<prefix>/.s3manifest.json`. Both are compared
+        to decide what to upload. When no remote manifest exists yet, the object
+        listing is used instead (size + single-part ETag/MD5) and the manifest is
+        then created. A sync with no changes costs one GET of the remote manifest.
+
+        Args:
+            local_dir (str): Local directory to publish (e.g. "data/processed").
+            prefix (str): Key prefix under which the tree is stored in S3.
+            delete (bool): Also delete remote files that no longer exist locally.
+            max_workers (int): Number of files uploaded in parallel.
+            progress (callable): Optional callback(bytes_done, bytes_total).
+
+        Returns:
+            TransferResult: Uploaded, skipped and deleted keys plus per-key errors.
+        """
+        cache_path = Path(local_dir) / MANIFEST_NAME
+        local = build_manifest(local_dir, previous=load_manifest(cache_path))
+        save_manifest(cache_path, local)
+
+        manifest_key = join_key(prefix, MANIFEST_NAME)
+        remote = self._get_remote_manifest(manifest_key)
+        has_manifest = remote is not None
+        if not has_manifest:
+            remote = self._manifest_from_listing(local_dir, prefix, local)
+
+        changed, removed = diff_manifests(local, remote)
+        result = self._upload_jobs(
+            {join_key(prefix, rel): Path(local_dir) / rel for rel in changed},
+            max_workers, progress,
+        )
+        result.skipped = sorted(join_key(prefix, rel) for rel in set(local) - set(changed))
+
+        # The new remote manifest only records what actually reached S3
+        updated = dict(remote)
+        for rel in changed:
+            if join_key(prefix, rel) in result.succeeded:
+                updated[rel] = {"xxh3": local[rel]["xxh3"], "size": local[rel]["size"]}
+
+        if delete and removed:
+            deletion = self.delete_many(join_key(prefix, rel) for rel in removed)
+            result.deleted = deletion.succeeded
+            result.failed.update(deletion.failed)
+            for rel in removed:
+                if join_key(prefix, rel) in deletion.succeeded:
+                    updated.pop(rel, None)
+
+        if updated != remote or not has_manifest:
+            self.s3.put_object(Bucket=self.bucket, Key=manifest_key, Body=dumps_manifest(updated))
+        return result
+
+    def _get_remote_manifest(self, manifest_key: str):
+        """
+        Fetches the remote manifest.
+
+        Returns:
+            dict | None: Manifest entries, or None when the object does not exist.
+        """
+        try:
+            body = self.s3.get_object(Bucket=self.bucket, Key=manifest_key)["Body"].read()
+        except ClientError as e:
+            if e.response["Error"]["Code"] in ("NoSuchKey", "404"):
+                return None
+            raise
+        return loads_manifest(body)
+
+    def _manifest_from_listing(self, local_dir: str, prefix: str, local: dict) -> dict:
+        """
+        Reconstructs a remote manifest from the object listing (first sync only).
+
+        Objects whose size and single-part ETag match the local file are
+        considered identical and reuse the local entry; others get no hash so
+        that they are re-uploaded (or deleted if absent locally).
+        """
+        remote = {}
+        prefix = folder_prefix(prefix)
+        for obj in self.iter_objects(prefix):
+            rel = key_to_relative(prefix, obj["Key"])
+            if rel == MANIFEST_NAME or obj["Key"].endswith("/"):
+                continue
+            entry = local.get(rel)
+            if entry and entry["size"] == obj["Size"] and etag_matches(Path(local_dir) / rel, obj["ETag"]):
+                remote[rel] = {"xxh3": entry["xxh3"], "size": entry["size"]}
+            else:
+                remote[rel] = {"xxh3": None, "size": obj["Size"]}
+        return remote
+
+    def _upload_jobs(self, jobs: dict, max_workers: int = None, progress=None) -> TransferResult:
+        """
+        Uploads a set of local files concurrently.
+
+        Args:
+            jobs (dict): S3 key -> local Path.
+            max_workers (int): Pool size (defaults to S3_MAX_WORKERS).
+            progress (callable): Optional callback(bytes_done, bytes_total).
+
+        Returns:
+            TransferResult: Aggregated outcome.
+        """
+        tracker = ProgressTracker(progress, total=sum(p.stat().st_size for p in jobs.values()))
+
+        def _upload(key, path):
+            self.s3.upload_file(str(path), self.bucket, key,
+                                Config=self.transfer_config, Callback=tracker)
+            return path.stat().st_size
+
+        return self._run_transfers(_upload, jobs, max_workers)
+
+    def _run_transfers(self, transfer, jobs: dict, max_workers: int = None) -> TransferResult:
+        """
+        Runs `transfer(key, path)` for every job on a bounded thread pool.
+
+        Args:
+            transfer (callable): Function moving one file and returning its size.
+            jobs (dict): S3 key -> local Path.
+            max_workers (int): Pool size (defaults to S3_MAX_WORKERS).
+
+        Returns:
+            TransferResult: Aggregated outcome; errors are collected per key
+                            instead of aborting the whole batch.
+        """
+        result = TransferResult()
+        with Timer() as timer:
+            with ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as pool:
+                futures = {pool.submit(transfer, key, path): key for key, path in jobs.items()}
+                for future in as_completed(futures):
+                    key = futures[future]
+                    try:
+                        result.bytes_transferred += future.result()
+                        result.succeeded.append(key)
+                    except (ClientError, BotoCoreError, S3UploadFailedError, OSError) as e:
+                        result.failed[key] = str(e)
+        result.elapsed = timer.elapsed
+        result.succeeded.sort()
+        return result
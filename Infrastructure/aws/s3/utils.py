@@ -1 +1,159 @@
-# Infrastructure/aws/s3/utils.py
\ No newline at end of file
+# Infrastructure/aws/s3/utils.py
+
+import os
+import threading
+from itertools import islice
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional
+
+
+@dataclass
+class TransferResult:
+    """
+    Aggregated outcome of a multi-file S3 operation.
+
+    Attributes:
+        succeeded (list[str]): S3 keys that were transferred successfully.
+        failed (dict[str, str]): S3 key -> error message for failed transfers.
+        skipped (list[str]): S3 keys left untouched because they were up to date.
+        deleted (list[str]): S3 keys removed by a sync.
+        bytes_transferred (int): Total number of bytes moved.
+        elapsed (float): Wall-clock duration of the operation in seconds.
+    """
+    succeeded: list = field(default_factory=list)
+    failed: dict = field(default_factory=dict)
+    skipped: list = field(default_factory=list)
+    deleted: list = field(default_factory=list)
+    bytes_transferred: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        """True when every file was transferred."""
+        return not self.failed
+
+    @property
+    def files(self) -> int:
+        """Number of files attempted."""
+        return len(self.succeeded) + len(self.failed)
+
+    @property
+    def throughput(self) -> float:
+        """Average throughput in bytes per second."""
+        return self.bytes_transferred / self.elapsed if self.elapsed else 0.0
+
+
+class ProgressTracker:
+    """
+    Thread-safe byte counter shared by concurrent transfers.
+
+    boto3 invokes transfer callbacks from its worker threads, so every update
+    goes through a lock. The user callback is called under the same lock, so it
+    sees byte counts in increasing order and must stay cheap.
+    """
+
+    def __init__(self, callback: Optional[Callable[[int, int], None]] = None, total: int = 0):
+        self._lock = threading.Lock()
+        self._callback = callback
+        self.total = total
+        self.seen = 0
+
+    def __call__(self, bytes_amount: int):
+        with self._lock:
+            self.seen += bytes_amount
+            if self._callback:
+                self._callback(self.seen, self.total)
+
+
+class Timer:
+    """Context manager measuring wall-clock time in seconds."""
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        self.elapsed = 0.0
+        return self
+
+    def __exit__(self, *exc):
+        self.elapsed = time.perf_counter() - self._start
+        return False
+
+
+def walk_files(local_dir: str) -> list[Path]:
+    """
+    Recursively lists regular files under a directory, sorted for stable ordering.
+
+    Args:
+        local_dir (str): Root directory to scan.
+
+    Returns:
+        list[Path]: Paths of every file found.
+    """
+    return sorted(p for p in Path(local_dir).rglob("*") if p.is_file())
+
+
+def join_key(prefix: str, relative_path: str) -> str:
+    """
+    Builds an S3 key from a prefix and a path relative to a local root.
+
+    Args:
+        prefix (str): Key prefix (with or without trailing slash).
+        relative_path (str): Relative local path, using OS separators.
+
+    Returns:
+        str: Key using forward slashes, e.g. "runs/2025/visuals/Age_hist.png".
+    """
+    relative = relative_path.replace(os.sep, "/").lstrip("/")
+    prefix = prefix.strip("/")
+    return f"{prefix}/{relative}" if prefix else relative
+
+
+def folder_prefix(prefix: str) -> str:
+    """
+    Normalises a folder prefix so that listing it stops at the folder boundary.
+
+    S3 prefixes are plain string prefixes: "runs/1" also matches "runs/10/...".
+    With the trailing slash only the keys inside the folder are listed.
+
+    Args:
+        prefix (str): Key prefix (with or without trailing slash).
+
+    Returns:
+        str: The prefix ending with exactly one "/", or "" for the bucket root.
+    """
+    prefix = prefix.rstrip("/")
+    return f"{prefix}/" if prefix else ""
+
+
+def key_to_relative(prefix: str, key: str) -> str:
+    """
+    Strips a prefix from an S3 key to obtain a relative path.
+
+    Args:
+        prefix (str): Key prefix that was listed.
+        key (str): Full S3 key.
+
+    Returns:
+        str: Key relative to the prefix, without a leading slash.
+    """
+    prefix = prefix.strip("/")
+    if prefix and key.startswith(prefix + "/"):
+        key = key[len(prefix) + 1:]
+    return key.lstrip("/")
+
+
+def batched(iterable, size: int):
+    """
+    Splits any iterable (including generators) into lists of at most `size` items.
+
+    Args:
+        iterable (Iterable): Items to group.
+        size (int): Maximum batch length.
+
+    Yields:
+        list: Consecutive batches.
+    """
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
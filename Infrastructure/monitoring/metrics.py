@@ -0,0 +1,330 @@
+# Infrastructure/monitoring/metrics.py
+"""
+Lightweight instrumentation shared by the pipeline, the database layer, model
+inference and S3 transfers.
+
+Disabled by default: every hook first checks a single module-level flag and
+calls straight through, so the cost when disabled is one attribute lookup.
+
+Enable with FITNESS_METRICS=1 (or `enable()`); set FITNESS_METRICS_MEMORY=1 to
+also record peak Python memory per stage (tracemalloc, noticeably slower) and
+FITNESS_METRICS_REPORT=<path> to write a JSON run report at exit.
+"""
+
+import atexit
+import functools
+import json
+import os
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+from pathlib import Path
+
+# Latency histogram buckets in seconds (Prometheus "le" bounds)
+LATENCY_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+
+class _State:
+    enabled = os.getenv("FITNESS_METRICS", "0") == "1"
+    track_memory = os.getenv("FITNESS_METRICS_MEMORY", "0") == "1"
+
+
+STATE = _State()
+
+
+class Histogram:
+    """Cumulative latency histogram with count, sum, min and max."""
+
+    __slots__ = ("counts", "count", "total", "min", "max")
+
+    def __init__(self):
+        self.counts = [0] * len(LATENCY_BUCKETS)
+        self.count = 0
+        self.total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+
+    def observe(self, seconds: float):
+        self.count += 1
+        self.total += seconds
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        for i, bound in enumerate(LATENCY_BUCKETS):
+            if seconds <= bound:
+                self.counts[i] += 1
+                break
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.count,
+            "sum_s": round(self.total, 6),
+            "mean_s": round(self.total / self.count, 6) if self.count else 0.0,
+            "min_s": round(self.min, 6) if self.count else 0.0,
+            "max_s": round(self.max, 6),
+        }
+
+
+class MetricsRegistry:
+    """
+    Thread-safe store of stage measurements and per-call latency histograms.
+
+    Stages record wall time, CPU time and (optionally) peak traced memory per
+    call. Latencies are grouped by (category, name), e.g. ("db", "SELECT"),
+    ("s3", "upload_dir") or ("model", "parse_user_input").
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self.stages = {}
+        self.latencies = {}
+
+    def reset(self):
+        with self._lock:
+            self.stages = {}
+            self.latencies = {}
+
+    def record_stage(self, name: str, wall: float, cpu: float, peak_bytes: int = None):
+        with self._lock:
+            stage = self.stages.setdefault(name, {"calls": 0, "wall_s": 0.0, "cpu_s": 0.0, "peak_bytes": None})
+            stage["calls"] += 1
+            stage["wall_s"] += wall
+            stage["cpu_s"] += cpu
+            if peak_bytes is not None:
+                stage["peak_bytes"] = max(stage["peak_bytes"] or 0, peak_bytes)
+
+    def observe(self, category: str, name: str, seconds: float):
+        with self._lock:
+            histogram = self.latencies.get((category, name))
+            if histogram is None:
+                histogram = self.latencies[(category, name)] = Histogram()
+            histogram.observe(seconds)
+
+    @contextmanager
+    def stage(self, name: str):
+        """
+        Measures a pipeline stage. Nested stages are supported: a parent's peak
+        memory includes the peaks of its children.
+        """
+        if not STATE.enabled:
+            yield
+            return
+        memory = STATE.track_memory
+        if memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            stack = self._memory_stack()
+            if stack:
+                # reset_peak() below discards the parent's peak so far: fold it in first
+                stack[-1] = max(stack[-1], tracemalloc.get_traced_memory()[1])
+            stack.append(0)
+            tracemalloc.reset_peak()
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield
+        finally:
+            wall, cpu = time.perf_counter() - wall, time.process_time() - cpu
+            peak = None
+            if memory:
+                peak = max(tracemalloc.get_traced_memory()[1], stack.pop())
+                if stack:
+                    stack[-1] = max(stack[-1], peak)
+                tracemalloc.reset_peak()
+            self.record_stage(name, wall, cpu, peak)
+
+    @contextmanager
+    def timed(self, category: str, name: str):
+        """Records the latency of a single call under (category, name)."""
+        if not STATE.enabled:
+            yield
+            return
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(category, name, time.perf_counter() - start)
+
+    def snapshot(self) -> dict:
+        """
+        Returns a JSON-serializable copy of every measurement.
+
+        Returns:
+            dict: {"stages": {...}, "latencies": {category: {name: {...}}}}
+        """
+        with self._lock:
+            stages = {
+                name: {**values, "wall_s": round(values["wall_s"], 6), "cpu_s": round(values["cpu_s"], 6)}
+                for name, values in self.stages.items()
+            }
+            latencies = {}
+            for (category, name), histogram in self.latencies.items():
+                latencies.setdefault(category, {})[name] = histogram.to_dict()
+        return {"stages": stages, "latencies": latencies}
+
+    def write_report(self, path) -> Path:
+        """
+        Writes the snapshot as a JSON run report.
+
+        Args:
+            path (str | Path): Destination file.
+
+        Returns:
+            Path: The written file.
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        report = {"created": time.strftime("%Y-%m-%dT%H:%M:%S"), "pid": os.getpid(), **self.snapshot()}
+        path.write_text(json.dumps(report, indent=2, sort_keys=True))
+        return path
+
+    def render_prometheus(self) -> str:
+        """
+        Renders the measurements in the Prometheus text exposition format (0.0.4).
+
+        Returns:
+            str: Metrics page body.
+        """
+        lines = []
+        with self._lock:
+            stages = {name: dict(values) for name, values in self.stages.items()}
+            latencies = {key: (list(h.counts), h.count, h.total) for key, h in self.latencies.items()}
+
+        if stages:
+            for metric, field, kind, help_text in (
+                ("fitness_stage_calls_total", "calls", "counter", "Number of pipeline stage executions."),
+                ("fitness_stage_wall_seconds_total", "wall_s", "counter", "Wall-clock time spent in pipeline stages."),
+                ("fitness_stage_cpu_seconds_total", "cpu_s", "counter", "CPU time spent in pipeline stages."),
+                ("fitness_stage_peak_memory_bytes", "peak_bytes", "gauge", "Peak traced Python memory of a stage."),
+            ):
+                lines += [f"# HELP {metric} {help_text}", f"# TYPE {metric} {kind}"]
+                for name, values in sorted(stages.items()):
+                    if values[field] is not None:
+                        lines.append(f'{metric}{{stage="{_escape(name)}"}} {values[field]}')
+
+        if latencies:
+            metric = "fitness_call_latency_seconds"
+            lines += [f"# HELP {metric} Latency of database queries, model inference and S3 calls.",
+                      f"# TYPE {metric} histogram"]
+            for (category, name), (counts, count, total) in sorted(latencies.items()):
+                labels = f'category="{_escape(category)}",name="{_escape(name)}"'
+                cumulative = 0
+                for bound, bucket in zip(LATENCY_BUCKETS, counts):
+                    cumulative += bucket
+                    lines.append(f'{metric}_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'{metric}_bucket{{{labels},le="+Inf"}} {count}')
+                lines.append(f"{metric}_sum{{{labels}}} {total}")
+                lines.append(f"{metric}_count{{{labels}}} {count}")
+        return "\n".join(lines) + "\n"
+
+    def _memory_stack(self) -> list:
+        if not hasattr(self._local, "stack"):
+            self._local.stack = []
+        return self._local.stack
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+REGISTRY = MetricsRegistry()
+
+
+def enable(track_memory: bool = False):
+    """Turns instrumentation on for the current process."""
+    STATE.enabled = True
+    STATE.track_memory = track_memory
+
+
+def disable():
+    """Turns instrumentation off; recorded values are kept."""
+    STATE.enabled = False
+    STATE.track_memory = False
+    if tracemalloc.is_tracing():
+        tracemalloc.stop()
+
+
+def instrument_stage(name: str = None):
+    """
+    Decorator recording wall time, CPU time and peak memory of a pipeline stage.
+
+    Args:
+        name (str): Stage name; defaults to "<module>.<function>".
+    """
+    def decorator(fn):
+        stage_name = name or f"{fn.__module__.rsplit('.', 1)[-1]}.{fn.__name__}"
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not STATE.enabled:
+                return fn(*args, **kwargs)
+            with REGISTRY.stage(stage_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument_call(category: str, name: str = None):
+    """
+    Decorator recording the latency of every call (model inference, S3 transfers).
+
+    Args:
+        category (str): Metric category, e.g. "model" or "s3".
+        name (str): Call name; defaults to the function name.
+    """
+    def decorator(fn):
+        call_name = name or fn.__name__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not STATE.enabled:
+                return fn(*args, **kwargs)
+            with REGISTRY.timed(category, call_name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument_engine(engine):
+    """
+    Attaches SQLAlchemy event listeners recording the latency of every query
+    executed through `engine`, grouped by SQL operation (SELECT, INSERT, ...).
+    Failed statements are not recorded.
+
+    Args:
+        engine (sqlalchemy.engine.Engine): Engine to instrument.
+    """
+    from sqlalchemy import event
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before(conn, cursor, statement, parameters, context, executemany):
+        if STATE.enabled:
+            conn.info.setdefault("query_start", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after(conn, cursor, statement, parameters, context, executemany):
+        starts = conn.info.get("query_start")
+        if not starts:
+            return
+        elapsed = time.perf_counter() - starts.pop()
+        operation = statement.lstrip().split(None, 1)[0].upper() if statement.strip() else "UNKNOWN"
+        REGISTRY.observe("db", operation, elapsed)
+
+    @event.listens_for(engine, "handle_error")
+    def _error(context):
+        # Failed statements never reach after_cursor_execute: drop their start time
+        starts = context.connection.info.get("query_start") if context.connection is not None else None
+        if starts:
+            starts.pop()
+
+    return engine
+
+
+def _write_report_at_exit():
+    path = os.getenv("FITNESS_METRICS_REPORT")
+    if path and (REGISTRY.stages or REGISTRY.latencies):
+        REGISTRY.write_report(path)
+        print(f"📈 Metrics report saved to: {path}")
+
+
+atexit.register(_write_report_at_exit)
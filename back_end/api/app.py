@@ -0,0 +1,8 @@
+# back_end/api/app.py
+
+from fastapi import FastAPI
+
+from back_end.api.metrics import router as metrics_router
+
+app = FastAPI(title="Fitness AI backend")
+app.include_router(metrics_router)
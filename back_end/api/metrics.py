@@ -0,0 +1,21 @@
+# back_end/api/metrics.py
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from Infrastructure.monitoring.metrics import REGISTRY
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+router = APIRouter(tags=["monitoring"])
+
+
+@router.get("/metrics", response_class=PlainTextResponse)
+def metrics() -> PlainTextResponse:
+    """
+    Exposes stage timings and DB / model / S3 latency histograms for Prometheus.
+
+    Returns:
+        PlainTextResponse: Metrics in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(REGISTRY.render_prometheus(), media_type=PROMETHEUS_CONTENT_TYPE)
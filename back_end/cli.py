@@ -0,0 +1,147 @@
+# back_end/cli.py
+"""
+Single entry point for the data pipeline, the database and S3 tasks.
+
+Usage:
+    python -m back_end.cli load [--arrow]
+    python -m back_end.cli clean [--input s3://bucket/raw.csv] [--chunksize 100000]
+    python -m back_end.cli analyze
+    python -m back_end.cli cohort-table [--output data/processed/cohort_table]
+    python -m back_end.cli migrate [--cohort-view]
+    python -m back_end.cli seed
+    python -m back_end.cli reset --yes
+    python -m back_end.cli s3 sync models/ artifacts/models [--delete]
+
+Only argparse is imported up front: each command imports its module (pandas,
+SQLAlchemy, boto3, ...) when it runs, so `--help` starts in well under a
+second. Default data paths are anchored to the project root rather than the
+current directory; the project root itself must be importable, i.e. run from it
+or put it on PYTHONPATH:
+
+    cd /tmp && PYTHONPATH=/path/to/project python -m back_end.cli analyze
+"""
+
+import argparse
+import sys
+
+
+def cmd_load(args) -> int:
+    from back_end.data_pipeline.scripts import load_nutrition_dataset
+    load_nutrition_dataset.run(arrow=args.arrow, local_dir=args.local_dir, output_path=args.output)
+    return 0
+
+
+def cmd_clean(args) -> int:
+    from back_end.data_pipeline.scripts import clean_nutrition_data
+    kwargs = {key: value for key, value in (("input_path", args.input), ("output_path", args.output)) if value}
+    clean_nutrition_data.run(chunksize=args.chunksize, **kwargs)
+    return 0
+
+
+def cmd_analyze(args) -> int:
+    from back_end.data_pipeline.scripts import analyze_cleaned_data
+    analyze_cleaned_data.run()
+    return 0
+
+
+def cmd_cohort_table(args) -> int:
+    from back_end.models.regression import cohort_table
+    kwargs = {key: value for key, value in (("input_path", args.input), ("output_dir", args.output)) if value}
+    cohort_table.build_cohort_table(**kwargs)
+    return 0
+
+
+def cmd_migrate(args) -> int:
+    from back_end.database.seed_postgres import get_db_connector
+
+    connector = get_db_connector()
+    connector.execute_schema()
+    if args.cohort_view:
+        from back_end.database.queries.user_queries import create_cohort_summary_view, refresh_cohort_summary
+        with connector.engine.begin() as connection:
+            create_cohort_summary_view(connection)
+            refresh_cohort_summary(connection)
+        print("✅ Cohort summary view created and refreshed.")
+    return 0
+
+
+def cmd_seed(args) -> int:
+    from back_end.database.seed_postgres import run_seed
+    run_seed()
+    return 0
+
+
+def cmd_reset(args) -> int:
+    if not args.yes:
+        print("❌ This drops every table. Re-run with --yes to confirm.")
+        return 1
+    from back_end.database.reset_db import reset_schema
+    reset_schema()
+    return 0
+
+
+def cmd_s3_sync(args) -> int:
+    from Infrastructure.aws.s3.s3_manager import S3Manager
+    result = S3Manager().sync_dir(args.local_dir, args.prefix, delete=args.delete, max_workers=args.workers)
+    print(f"✅ Synced {len(result.succeeded)} files, skipped {len(result.skipped)}, deleted {len(result.deleted)} "
+          f"({result.bytes_transferred / 1e6:.1f} MB in {result.elapsed:.1f}s)")
+    for key, error in result.failed.items():
+        print(f"❌ {key}: {error}")
+    return 0 if result.ok else 1
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="python -m back_end.cli", description=__doc__,
+                                     formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True, metavar="COMMAND")
+
+    load = commands.add_parser("load", help="Download the nutrition dataset and save the raw copy.")
+    load.add_argument("--arrow", action="store_true", help="Zero-copy Arrow path, saves Parquet.")
+    load.add_argument("--local-dir", help="Local dataset directory (offline / cached copy).")
+    load.add_argument("--output", help="Raw output file (default: data/raw/nutrition_raw.csv|.parquet).")
+    load.set_defaults(handler=cmd_load)
+
+    clean = commands.add_parser("clean", help="Clean and validate the raw dataset.")
+    clean.add_argument("--input", help="Local path or S3 URI (default: data/raw/nutrition_raw.csv).")
+    clean.add_argument("--output", help="Cleaned CSV (default: data/processed/nutrition_cleaned.csv).")
+    clean.add_argument("--chunksize", type=int, help="Process the input in chunks of this many rows.")
+    clean.set_defaults(handler=cmd_clean)
+
+    analyze = commands.add_parser("analyze", help="Statistics and plots of the cleaned dataset.")
+    analyze.set_defaults(handler=cmd_analyze)
+
+    cohorts = commands.add_parser("cohort-table", help="Precompute the per-cohort calorie and macro targets.")
+    cohorts.add_argument("--input", help="Cleaned CSV (default: data/processed/nutrition_cleaned.csv).")
+    cohorts.add_argument("--output", help="Table directory (default: data/processed/cohort_table).")
+    cohorts.set_defaults(handler=cmd_cohort_table)
+
+    migrate = commands.add_parser("migrate", help="Apply schema.sql (tables and indexes, idempotent).")
+    migrate.add_argument("--cohort-view", action="store_true",
+                         help="Also create and refresh the cohort_summary materialized view.")
+    migrate.set_defaults(handler=cmd_migrate)
+
+    seed = commands.add_parser("seed", help="Insert the reference labels (idempotent).")
+    seed.set_defaults(handler=cmd_seed)
+
+    reset = commands.add_parser("reset", help="Drop every table.")
+    reset.add_argument("--yes", action="store_true", help="Confirm the drop.")
+    reset.set_defaults(handler=cmd_reset)
+
+    s3 = commands.add_parser("s3", help="S3 transfers.")
+    s3_commands = s3.add_subparsers(dest="s3_command", required=True, metavar="COMMAND")
+    sync = s3_commands.add_parser("sync", help="Upload the files of a directory that changed since the last sync.")
+    sync.add_argument("local_dir")
+    sync.add_argument("prefix", nargs="?", default="")
+    sync.add_argument("--delete", action="store_true", help="Delete remote files missing locally.")
+    sync.add_argument("--workers", type=int, help="Files transferred in parallel.")
+    sync.set_defaults(handler=cmd_s3_sync)
+    return parser
+
+
+def main(argv=None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,33 +1,49 @@
 # back_end/data_pipeline/scripts/analyze_cleaned_data.py
 
 import pandas as pd
-import matplotlib.pyplot as plt
-import seaborn as sns
 import os
-from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+from pathlib import Path
+from Infrastructure.monitoring.metrics import instrument_stage
 
-CLEANED_PATH = "data/processed/nutrition_cleaned.csv"
-STATS_OUTPUT_PATH = "data/processed/cleaned_stats.csv"
-VISUAL_OUTPUT_DIR = "data/processed/visuals"
-NLP_OUTPUT_DIR = "data/processed/nlp_analysis"
+# Paths are anchored to the project, not to the working directory
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DATA_DIR = PROJECT_ROOT / "back_end" / "data_pipeline" / "scripts" / "data"
 
-os.makedirs(VISUAL_OUTPUT_DIR, exist_ok=True)
-os.makedirs(NLP_OUTPUT_DIR, exist_ok=True)
+CLEANED_PATH = str(DATA_DIR / "processed" / "nutrition_cleaned.csv")
+STATS_OUTPUT_PATH = str(DATA_DIR / "processed" / "cleaned_stats.csv")
+VISUAL_OUTPUT_DIR = str(DATA_DIR / "processed" / "visuals")
+NLP_OUTPUT_DIR = str(DATA_DIR / "processed" / "nlp_analysis")
 
+
+def _plotting():
+    """
+    Imports the plotting stack on first use: matplotlib and seaborn take about
+    a second to import and only the plotting steps need them.
+    """
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+    return plt, sns
+
+
+@instrument_stage()
 def load_cleaned_dataset(path: str = CLEANED_PATH) -> pd.DataFrame:
     return pd.read_csv(path)
 
+@instrument_stage()
 def describe_numerical(df: pd.DataFrame) -> pd.DataFrame:
     return df.describe()
 
+@instrument_stage()
 def analyze_unique_categories(df: pd.DataFrame) -> dict:
     return {
         col: df[col].value_counts().to_dict()
         for col in df.select_dtypes(include="object").columns
     }
 
+@instrument_stage()
 def plot_distributions(df: pd.DataFrame):
+    plt, sns = _plotting()
+    os.makedirs(VISUAL_OUTPUT_DIR, exist_ok=True)
     num_cols = ["Age", "Height", "Weight", "Daily Calorie Target", "Protein", "Carbohydrates", "Fat"]
     for col in num_cols:
         plt.figure()
@@ -46,12 +62,17 @@ def plot_distributions(df: pd.DataFrame):
         plt.savefig(os.path.join(VISUAL_OUTPUT_DIR, f"{col}_count.png"))
         plt.close()
 
+@instrument_stage()
 def save_stats_summary(df: pd.DataFrame):
     stats = describe_numerical(df)
+    os.makedirs(os.path.dirname(STATS_OUTPUT_PATH), exist_ok=True)
     stats.to_csv(STATS_OUTPUT_PATH)
     print(f"Descriptive statistics saved to: {STATS_OUTPUT_PATH}")
 
+@instrument_stage()
 def plot_correlation_matrix(df: pd.DataFrame, method="pearson"):
+    plt, sns = _plotting()
+    os.makedirs(VISUAL_OUTPUT_DIR, exist_ok=True)
     plt.figure(figsize=(10, 6))
     numeric_df = df.select_dtypes(include='number')
     corr = numeric_df.corr(method=method)
@@ -61,7 +82,10 @@ def plot_correlation_matrix(df: pd.DataFrame, method="pearson"):
     plt.savefig(os.path.join(VISUAL_OUTPUT_DIR, f"correlation_{method}.png"))
     plt.close()
 
+@instrument_stage()
 def distribution_by_group(df: pd.DataFrame, group_col: str):
+    plt, sns = _plotting()
+    os.makedirs(VISUAL_OUTPUT_DIR, exist_ok=True)
     num_cols = df.select_dtypes(include='number').columns
     for col in num_cols:
         plt.figure()
@@ -71,7 +95,13 @@ def distribution_by_group(df: pd.DataFrame, group_col: str):
         plt.savefig(os.path.join(VISUAL_OUTPUT_DIR, f"{col}_by_{group_col.replace(' ', '_')}.png"))
         plt.close()
 
+@instrument_stage()
 def nlp_analysis(df: pd.DataFrame):
+    plt, sns = _plotting()
+    from sklearn.feature_extraction.text import TfidfVectorizer
+    from sklearn.metrics.pairwise import cosine_similarity
+
+    os.makedirs(NLP_OUTPUT_DIR, exist_ok=True)
     text_cols = ["Breakfast Suggestion", "Lunch Suggestion", "Dinner Suggestion", "Snack Suggestion"]
     for col in text_cols:
         df[f"{col}_length"] = df[col].astype(str).apply(len)
@@ -93,6 +123,7 @@ def nlp_analysis(df: pd.DataFrame):
         plt.savefig(os.path.join(NLP_OUTPUT_DIR, f"similarity_{col.replace(' ', '_')}.png"))
         plt.close()
 
+@instrument_stage()
 def run():
     print("Loading cleaned dataset...")
     df = load_cleaned_dataset()
@@ -1,11 +1,49 @@
 # back_end/data_pipeline/scripts/clean_nutrition_data.py
 import os
+from pathlib import Path
 
 import pandas as pd
-
-INPUT_PATH = "data/raw/nutrition_raw.csv"
-OUTPUT_PATH = "data/processed/nutrition_cleaned.csv"
-
+from Infrastructure.monitoring.metrics import instrument_stage
+from back_end.data_pipeline.utils.quality_rules import (
+    AllowedValuesRule,
+    HeaderEchoRule,
+    NotNullRule,
+    QualityReport,
+    RangeRule,
+    RuleSet,
+    ValidationResult,
+)
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DATA_DIR = PROJECT_ROOT / "back_end" / "data_pipeline" / "scripts" / "data"
+INPUT_PATH = str(DATA_DIR / "raw" / "nutrition_raw.csv")
+OUTPUT_PATH = str(DATA_DIR / "processed" / "nutrition_cleaned.csv")
+QUARANTINE_NAME = "nutrition_quarantine.csv"
+QUALITY_REPORT_NAME = "nutrition_quality_report.json"
+
+NUMERIC_COLUMNS = ["Age", "Height", "Weight", "Daily Calorie Target", "Protein", "Carbohydrates", "Fat"]
+CATEGORICAL_COLUMNS = ["Gender", "Activity Level", "Fitness Goal", "Dietary Preference"]
+
+# Physiologically plausible ranges
+OUTLIER_RULES = [
+    RangeRule("Age", 10, 100),
+    RangeRule("Height", 100, 250),
+    RangeRule("Weight", 30, 250),
+    RangeRule("Daily Calorie Target", 800, 5000),
+]
+
+# Rules every cleaned row satisfies (categories are checked after `normalize_categories`)
+NUTRITION_RULES = RuleSet([
+    HeaderEchoRule(CATEGORICAL_COLUMNS),
+    NotNullRule(NUMERIC_COLUMNS),
+    *OUTLIER_RULES,
+    AllowedValuesRule("Gender", ["Male", "Female"]),
+    AllowedValuesRule("Activity Level", ["Sedentary", "Lightly Active", "Moderately Active", "Very Active"]),
+    AllowedValuesRule("Fitness Goal", ["Weight Loss", "Muscle Gain", "Maintenance"]),
+    AllowedValuesRule("Dietary Preference", ["Omnivore", "Vegetarian", "Vegan"]),
+])
+
+@instrument_stage()
 def convert_numerical_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFrame:
     """
     Converts given columns to numeric type, coercing errors.
@@ -18,10 +56,15 @@ def convert_numerical_columns(df: pd.DataFrame, columns: list[str]) -> pd.DataFr
         pd.DataFrame: Updated dataset with numeric types
     """
     for col in columns:
-        df.loc[:, col] = pd.to_numeric(df[col], errors='coerce')
+        values = pd.to_numeric(df[col], errors='coerce')
+        # Invalid rows are only removed later: keep whole numbers as (nullable) integers despite their NaNs
+        if values.dtype.kind == "f" and (values.dropna() % 1 == 0).all():
+            values = values.astype("Int64")
+        df[col] = values
     return df
 
 
+@instrument_stage()
 def drop_invalid_headers(df: pd.DataFrame) -> pd.DataFrame:
     """
     Removes rows that repeat header labels or contain invalid placeholders.
@@ -29,14 +72,10 @@ def drop_invalid_headers(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Cleaned dataset
     """
-    return df[
-        (df["Gender"].str.lower() != "gender") &
-        (df["Activity Level"].str.lower() != "activity level") &
-        (df["Fitness Goal"].str.lower() != "fitness goal") &
-        (df["Dietary Preference"].str.lower() != "dietary preference")
-        ].copy()
+    return RuleSet([HeaderEchoRule(CATEGORICAL_COLUMNS)]).validate(df).accepted()
 
 
+@instrument_stage()
 def strip_whitespace(df: pd.DataFrame) -> pd.DataFrame:
     """
     Removes leading/trailing spaces in string columns.
@@ -50,6 +89,7 @@ def strip_whitespace(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+@instrument_stage()
 def normalize_categories(df: pd.DataFrame) -> pd.DataFrame:
     """
     Harmonizes categorical fields to avoid redundant classes.
@@ -69,6 +109,7 @@ def normalize_categories(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+@instrument_stage()
 def filter_outliers(df: pd.DataFrame) -> pd.DataFrame:
     """
     Removes physiologically implausible values.
@@ -76,48 +117,129 @@ def filter_outliers(df: pd.DataFrame) -> pd.DataFrame:
     Returns:
         pd.DataFrame: Dataset without extreme outliers
     """
-    return df[
-        (df["Age"].between(10, 100)) &
-        (df["Height"].between(100, 250)) &
-        (df["Weight"].between(30, 250)) &
-        (df["Daily Calorie Target"].between(800, 5000))
-        ].copy()
+    return RuleSet(OUTLIER_RULES).validate(df).accepted()
 
 
-def clean_nutrition_dataset(df: pd.DataFrame) -> pd.DataFrame:
+@instrument_stage()
+def validate_nutrition_dataset(df: pd.DataFrame, rules: RuleSet = NUTRITION_RULES) -> ValidationResult:
     """
-    Cleans the raw nutrition dataset for NLP training and habit tracking.
+    Normalizes the raw dataset and evaluates every quality rule in one pass.
 
     Steps:
-    - Convert numeric fields
-    - Remove header errors
     - Trim whitespace
+    - Convert numeric fields
     - Normalize categories
-    - Remove physiologically impossible values
+    - Evaluate the rule set (header echoes, nulls, ranges, allowed categories)
+
+    Args:
+        df (pd.DataFrame): Raw dataset (or chunk)
+        rules (RuleSet): Quality rules to apply
 
     Returns:
-        pd.DataFrame: Cleaned dataset
+        ValidationResult: Accepted rows, quarantined rows and per-rule counts
     """
     df = strip_whitespace(df)
-    df = drop_invalid_headers(df)
-    df = convert_numerical_columns(df, [
-        "Age", "Height", "Weight", "Daily Calorie Target", "Protein", "Carbohydrates", "Fat"])
+    df = convert_numerical_columns(df, NUMERIC_COLUMNS)
     df = normalize_categories(df)
-    df = filter_outliers(df)
-    return df
+    return rules.validate(df)
+
 
+@instrument_stage()
+def clean_nutrition_dataset(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Cleans the raw nutrition dataset for NLP training and habit tracking.
 
-def run():
-    df = pd.read_csv(INPUT_PATH)
-    print(f"Loaded raw dataset: {df.shape}")
+    Keeps the rows passing every rule of `NUTRITION_RULES`; see
+    `validate_nutrition_dataset` for the rejected rows and violation counts.
 
-    cleaned = clean_nutrition_dataset(df)
-    print(f"Cleaned dataset: {cleaned.shape}")
+    Returns:
+        pd.DataFrame: Cleaned dataset
+    """
+    return validate_nutrition_dataset(df).accepted()
 
-    os.makedirs(os.path.dirname(OUTPUT_PATH), exist_ok=True)
-    cleaned.to_csv(OUTPUT_PATH, index=False)
-    print(f"Cleaned dataset saved to: {OUTPUT_PATH}")
+
+def read_raw_dataset(path: str = INPUT_PATH, chunksize: int = None):
+    """
+    Reads the raw dataset from a local path or straight from S3 ("s3://bucket/key").
+
+    S3 objects are streamed (CSV) or read with range requests (Parquet), so no
+    local copy is written.
+
+    Args:
+        path (str): Local path or S3 URI of a .csv or .parquet file
+        chunksize (int): (Optional) Rows per chunk; returns an iterator of DataFrames
+
+    Returns:
+        pd.DataFrame | Iterator[pd.DataFrame]: Raw dataset, whole or chunked
+    """
+    is_parquet = path.endswith(".parquet")
+    if not path.startswith("s3://"):
+        if is_parquet:
+            if chunksize:
+                import pyarrow.parquet as pq
+                batches = pq.ParquetFile(path).iter_batches(batch_size=chunksize)
+                return (batch.to_pandas() for batch in batches)
+            return pd.read_parquet(path)
+        return pd.read_csv(path, chunksize=chunksize)
+
+    from Infrastructure.aws.s3.reader import iter_parquet_batches, read_csv, read_csv_chunks, read_parquet
+    from Infrastructure.aws.s3.s3_manager import S3Manager
+
+    manager = S3Manager()
+    if is_parquet:
+        if chunksize:
+            return iter_parquet_batches(manager, path, batch_size=chunksize)
+        return read_parquet(manager, path).to_pandas()
+    if chunksize:
+        return read_csv_chunks(manager, path, chunksize=chunksize)
+    return read_csv(manager, path)
+
+
+@instrument_stage()
+def run(input_path: str = INPUT_PATH, output_path: str = OUTPUT_PATH, chunksize: int = None) -> QualityReport:
+    """
+    Cleans the raw dataset and writes the result to CSV.
+
+    Rejected rows are written next to the output (`nutrition_quarantine.csv`,
+    with the broken rules in a `violations` column) together with a JSON
+    quality report of per-rule violation counts.
+
+    Every cleaning step and rule is row-wise, so with `chunksize` the file is
+    processed chunk by chunk with bounded memory; each chunk is validated once
+    and split into cleaned and quarantined rows from the same violation mask.
+
+    Args:
+        input_path (str): Local path or S3 URI of the raw dataset
+        output_path (str): Local CSV destination
+        chunksize (int): (Optional) Rows per chunk
+
+    Returns:
+        QualityReport: Row and per-rule violation counts
+    """
+    output_dir = os.path.dirname(output_path)
+    os.makedirs(output_dir, exist_ok=True)
+    quarantine_path = os.path.join(output_dir, QUARANTINE_NAME)
+    report_path = os.path.join(output_dir, QUALITY_REPORT_NAME)
+
+    chunks = read_raw_dataset(input_path, chunksize=chunksize) if chunksize else [read_raw_dataset(input_path)]
+    report = QualityReport()
+    for i, chunk in enumerate(chunks):
+        result = validate_nutrition_dataset(chunk)
+        report.update(result)
+        mode = "w" if i == 0 else "a"
+        result.accepted().to_csv(output_path, mode=mode, header=i == 0, index=False)
+        result.rejected().to_csv(quarantine_path, mode=mode, header=i == 0, index=False)
+
+    print(f"Cleaned dataset: {report.rows_kept} of {report.rows_in} rows kept")
+    for name, count in report.violations.items():
+        if count:
+            print(f"  - {name}: {count} rows")
+    report.save(report_path)
+
+    print(f"Cleaned dataset saved to: {output_path}")
+    print(f"Rejected rows saved to: {quarantine_path}")
+    return report
 
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()
@@ -1,10 +1,19 @@
 # back_end/data_pipeline/scripts/load_and_inspect.py
 
 import os
+from pathlib import Path
+
 import pandas as pd
-from datasets import load_dataset
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from Infrastructure.monitoring.metrics import instrument_stage
 
-RAW_OUTPUT_PATH = "data/raw/nutrition_raw.csv"
+DATASET_NAME = "sarthak-wiz01/nutrition_dataset"
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+DATA_DIR = PROJECT_ROOT / "back_end" / "data_pipeline" / "scripts" / "data"
+RAW_OUTPUT_PATH = str(DATA_DIR / "raw" / "nutrition_raw.csv")
+RAW_PARQUET_PATH = str(DATA_DIR / "raw" / "nutrition_raw.parquet")
 
 CATEGORICAL_COLUMNS = [
     "Gender",
@@ -14,6 +23,7 @@ CATEGORICAL_COLUMNS = [
 ]
 
 
+@instrument_stage()
 def load_nutrition_dataset():
     """
     Loads the Hugging Face nutrition dataset into a pandas DataFrame.
@@ -21,10 +31,39 @@ def load_nutrition_dataset():
     Returns:
         pd.DataFrame: Raw dataset
     """
-    dataset = load_dataset("sarthak-wiz01/nutrition_dataset", split="train")
+    from datasets import load_dataset  # ~1s to import, only needed here
+
+    dataset = load_dataset(DATASET_NAME, split="train")
     return dataset.to_pandas()
 
 
+@instrument_stage()
+def load_nutrition_table(local_dir: str = None) -> pa.Table:
+    """
+    Loads the nutrition dataset as a memory-mapped Arrow table (no pandas copy).
+
+    If `local_dir` holds a dataset saved with `save_to_disk`, it is opened
+    directly and no network access happens. Otherwise the dataset is fetched
+    from Hugging Face and, when `local_dir` is given, saved there for offline use.
+
+    Parameters:
+        local_dir (str): Optional local dataset directory
+
+    Returns:
+        pa.Table: Arrow table backed by the memory-mapped dataset files
+    """
+    from datasets import load_dataset, load_from_disk
+
+    if local_dir and os.path.exists(os.path.join(local_dir, "state.json")):
+        dataset = load_from_disk(local_dir)
+    else:
+        dataset = load_dataset(DATASET_NAME, split="train")
+        if local_dir:
+            dataset.save_to_disk(local_dir)
+    return dataset.data.table
+
+
+@instrument_stage()
 def inspect_dataset(df: pd.DataFrame) -> dict:
     """
     Inspects the structure and quality of the dataset.
@@ -45,6 +84,7 @@ def inspect_dataset(df: pd.DataFrame) -> dict:
     }
 
 
+@instrument_stage()
 def preview_value_distributions(df: pd.DataFrame) -> dict:
     """
     Shows unique value distributions for key categorical fields.
@@ -62,6 +102,7 @@ def preview_value_distributions(df: pd.DataFrame) -> dict:
     }
 
 
+@instrument_stage()
 def normalize_categorical_values(df: pd.DataFrame) -> pd.DataFrame:
     """
     Applies basic normalization to categorical fields: stripping spaces, title casing.
@@ -78,6 +119,87 @@ def normalize_categorical_values(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
+@instrument_stage()
+def inspect_table(table: pa.Table) -> dict:
+    """
+    Arrow counterpart of `inspect_dataset`, computed without converting to pandas.
+
+    Null counts come from the Arrow validity bitmaps and duplicates from a
+    group-by over every column.
+
+    Parameters:
+        table (pa.Table): The dataset to inspect
+
+    Returns:
+        dict: Summary including shape, nulls, dtypes, duplicates, sample
+    """
+    unique_rows = table.group_by(table.column_names).aggregate([]).num_rows
+    return {
+        "shape": (table.num_rows, table.num_columns),
+        "columns": table.column_names,
+        "dtypes": {field.name: str(field.type) for field in table.schema},
+        "null_values": {name: table.column(name).null_count for name in table.column_names},
+        "duplicated_rows": table.num_rows - unique_rows,
+        "sample_rows": table.slice(0, 5).to_pylist()
+    }
+
+
+@instrument_stage()
+def preview_table_distributions(table: pa.Table) -> dict:
+    """
+    Arrow counterpart of `preview_value_distributions`, using the value_counts kernel.
+
+    Parameters:
+        table (pa.Table): The dataset
+
+    Returns:
+        dict: Column -> value counts dictionary (most frequent first) for each categorical field
+    """
+    distributions = {}
+    for col in CATEGORICAL_COLUMNS:
+        if col not in table.column_names:
+            continue
+        counts = pc.value_counts(table.column(col).drop_null()).to_pylist()
+        counts.sort(key=lambda item: item["counts"], reverse=True)
+        distributions[col] = {item["values"]: item["counts"] for item in counts}
+    return distributions
+
+
+@instrument_stage()
+def normalize_categorical_table(table: pa.Table) -> pa.Table:
+    """
+    Arrow counterpart of `normalize_categorical_values`: strips spaces and title-cases
+    categorical fields with vectorized UTF-8 kernels. Other columns are left untouched
+    (and still memory-mapped).
+
+    Parameters:
+        table (pa.Table): The dataset
+
+    Returns:
+        pa.Table: Dataset with normalized categorical fields
+    """
+    for col in CATEGORICAL_COLUMNS:
+        if col in table.column_names:
+            normalized = pc.utf8_title(pc.utf8_trim_whitespace(table.column(col)))
+            table = table.set_column(table.schema.get_field_index(col), col, normalized)
+    return table
+
+
+@instrument_stage()
+def save_raw_parquet(table: pa.Table, path: str = RAW_PARQUET_PATH) -> None:
+    """
+    Saves the raw snapshot directly from Arrow as Parquet.
+
+    Parameters:
+        table (pa.Table): The dataset to save
+        path (str): File path to save to
+    """
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    pq.write_table(table, path)
+    print(f"Raw dataset saved to: {path}")
+
+
+@instrument_stage()
 def save_raw_copy(df: pd.DataFrame, path: str = RAW_OUTPUT_PATH) -> None:
     """
     Saves a raw copy of the dataset as CSV.
@@ -91,31 +213,46 @@ def save_raw_copy(df: pd.DataFrame, path: str = RAW_OUTPUT_PATH) -> None:
     print(f"Raw dataset saved to: {path}")
 
 
-def run():
+@instrument_stage()
+def run(arrow: bool = False, local_dir: str = None, output_path: str = None):
     """
     Loads, inspects, cleans categorical values, and saves the raw nutrition dataset.
+
+    Parameters:
+        arrow (bool): Keep the dataset as a memory-mapped Arrow table and write
+                      the snapshot to Parquet instead of going through pandas/CSV
+        local_dir (str): Optional local dataset directory for offline runs
+        output_path (str): Optional destination of the raw snapshot
     """
-    print("Loading dataset from Hugging Face...")
-    df = load_nutrition_dataset()
+    if arrow:
+        print("Loading dataset as Arrow table...")
+        data = load_nutrition_table(local_dir)
+        inspect, distributions, normalize, save = (
+            inspect_table, preview_table_distributions, normalize_categorical_table, save_raw_parquet)
+    else:
+        print("Loading dataset from Hugging Face...")
+        data = load_nutrition_dataset()
+        inspect, distributions, normalize, save = (
+            inspect_dataset, preview_value_distributions, normalize_categorical_values, save_raw_copy)
 
     print("Inspecting dataset...")
-    summary = inspect_dataset(df)
+    summary = inspect(data)
     for key, value in summary.items():
         print(f"\n--- {key.upper()} ---\n{value}")
 
     print("Value Distributions (Before Normalization)...")
-    distros = preview_value_distributions(df)
+    distros = distributions(data)
     for col, counts in distros.items():
         print(f"\n{col}:")
         for val, count in counts.items():
             print(f"  - {val}: {count}")
 
     print("Normalizing categorical fields...")
-    df = normalize_categorical_values(df)
+    data = normalize(data)
 
     print("Saving raw copy...")
-    save_raw_copy(df)
+    save(data, output_path or (RAW_PARQUET_PATH if arrow else RAW_OUTPUT_PATH))
 
 
 if __name__ == "__main__":
-    run()
\ No newline at end of file
+    run()
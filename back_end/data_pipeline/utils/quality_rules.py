@@ -0,0 +1,218 @@
+# back_end/data_pipeline/utils/quality_rules.py
+"""
+Declarative data-quality rules evaluated in a single vectorized pass.
+
+A `RuleSet` turns a DataFrame into a boolean violation matrix (one row per
+record, one column per rule). From that matrix come the rows to keep, the
+rows to quarantine (with the names of the rules they broke) and per-rule
+violation counts, without re-scanning the data for each statistic.
+
+Every rule is row-wise, so a rule set can validate a file chunk by chunk; a
+`QualityReport` accumulates the counts across chunks.
+
+Example:
+    rules = RuleSet([
+        HeaderEchoRule(["Gender", "Fitness Goal"]),
+        NotNullRule(["Age"]),
+        RangeRule("Age", 10, 100),
+        AllowedValuesRule("Gender", ["Male", "Female"]),
+    ])
+    result = rules.validate(df)
+    kept, quarantine = result.accepted(), result.rejected()
+"""
+
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+VIOLATIONS_COLUMN = "violations"
+
+
+@dataclass(frozen=True)
+class RangeRule:
+    """
+    Flags numeric values outside [low, high] (bounds included). Missing values
+    are left to `NotNullRule`. The column must already be numeric.
+    """
+    column: str
+    low: float
+    high: float
+
+    @property
+    def name(self) -> str:
+        return f"range:{self.column}"
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        values = df[self.column].to_numpy(dtype=float, na_value=np.nan)
+        with np.errstate(invalid="ignore"):
+            return (values < self.low) | (values > self.high)
+
+
+@dataclass(frozen=True)
+class AllowedValuesRule:
+    """Flags values that are not one of the allowed categories (exact match)."""
+    column: str
+    values: tuple
+
+    def __post_init__(self):
+        object.__setattr__(self, "values", tuple(self.values))
+
+    @property
+    def name(self) -> str:
+        return f"allowed:{self.column}"
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        return ~df[self.column].isin(self.values).to_numpy()
+
+
+@dataclass(frozen=True)
+class HeaderEchoRule:
+    """
+    Flags rows where any of `columns` holds its own column name (a header line
+    repeated inside the file), case-insensitively.
+    """
+    columns: tuple
+
+    def __post_init__(self):
+        object.__setattr__(self, "columns", tuple(self.columns))
+
+    @property
+    def name(self) -> str:
+        return "header_echo"
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        echo = np.zeros(len(df), dtype=bool)
+        for column in self.columns:
+            # Compare the distinct values only, then broadcast back through the codes
+            codes, uniques = pd.factorize(df[column])
+            if len(uniques) == 0:
+                continue
+            matches = np.array([str(value).lower() == column.lower() for value in uniques])
+            echo |= (codes >= 0) & matches[codes]
+        return echo
+
+
+@dataclass(frozen=True)
+class NotNullRule:
+    """Null policy: flags rows with a missing value in any of `columns`."""
+    columns: tuple
+
+    def __post_init__(self):
+        object.__setattr__(self, "columns", tuple(self.columns))
+
+    @property
+    def name(self) -> str:
+        return "not_null"
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        return df[list(self.columns)].isna().to_numpy().any(axis=1)
+
+
+@dataclass
+class ValidationResult:
+    """
+    Outcome of a rule set on one DataFrame.
+
+    Attributes:
+        frame (pd.DataFrame): The validated data.
+        mask (np.ndarray): Boolean violation matrix of shape (rows, rules).
+        rule_names (list[str]): Rule name of each mask column.
+    """
+    frame: pd.DataFrame
+    mask: np.ndarray
+    rule_names: list
+
+    @property
+    def valid(self) -> np.ndarray:
+        """Boolean vector of the rows breaking no rule."""
+        return ~self.mask.any(axis=1)
+
+    @property
+    def counts(self) -> dict:
+        """Violations per rule (a row breaking several rules counts in each)."""
+        return dict(zip(self.rule_names, self.mask.sum(axis=0).tolist()))
+
+    def accepted(self) -> pd.DataFrame:
+        return self.frame[self.valid]
+
+    def rejected(self) -> pd.DataFrame:
+        """
+        Returns the rejected rows with a `violations` column listing the broken
+        rules (";"-separated).
+        """
+        invalid = ~self.valid
+        names = np.array(self.rule_names, dtype=object)
+        quarantine = self.frame[invalid].copy()
+        quarantine[VIOLATIONS_COLUMN] = [";".join(names[row]) for row in self.mask[invalid]]
+        return quarantine
+
+
+class RuleSet:
+    """
+    Ordered collection of rules with unique names.
+
+    Args:
+        rules (list): Rule objects exposing `name` and `evaluate(df) -> np.ndarray`.
+    """
+
+    def __init__(self, rules: list):
+        self.rules = list(rules)
+        names = [rule.name for rule in self.rules]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            raise ValueError(f"Duplicate rule names: {duplicates}")
+
+    @property
+    def names(self) -> list[str]:
+        return [rule.name for rule in self.rules]
+
+    def evaluate(self, df: pd.DataFrame) -> np.ndarray:
+        """
+        Builds the violation matrix.
+
+        Returns:
+            np.ndarray: Boolean array of shape (len(df), len(rules)).
+        """
+        mask = np.zeros((len(df), len(self.rules)), dtype=bool)
+        for i, rule in enumerate(self.rules):
+            mask[:, i] = rule.evaluate(df)
+        return mask
+
+    def validate(self, df: pd.DataFrame) -> ValidationResult:
+        return ValidationResult(frame=df, mask=self.evaluate(df), rule_names=self.names)
+
+
+@dataclass
+class QualityReport:
+    """Row and violation counts accumulated over one or more validated chunks."""
+    rows_in: int = 0
+    rows_kept: int = 0
+    violations: dict = field(default_factory=dict)
+
+    @property
+    def rows_rejected(self) -> int:
+        return self.rows_in - self.rows_kept
+
+    def update(self, result: ValidationResult) -> "QualityReport":
+        self.rows_in += len(result.frame)
+        self.rows_kept += int(result.valid.sum())
+        for name, count in result.counts.items():
+            self.violations[name] = self.violations.get(name, 0) + count
+        return self
+
+    def to_dict(self) -> dict:
+        return {
+            "rows_in": self.rows_in,
+            "rows_kept": self.rows_kept,
+            "rows_rejected": self.rows_rejected,
+            "violations": dict(self.violations),
+        }
+
+    def save(self, path) -> Path:
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2))
+        return path
@@ -0,0 +1,315 @@
+# back_end/data_pipeline/utils/synthetic_data.py
+"""
+Deterministic synthetic data generator for load testing.
+
+Produces, at any size:
+- nutrition rows with the schema of nutrition_raw.csv, following the joint
+  distributions of nutrition_cleaned.csv (optionally with the dirty cases the
+  cleaning stage handles),
+- diary log messages recombined from fitness_diet_diary_1000.txt,
+- labelled intent messages resampled from intent_data_ad_log_pro.csv.
+
+Output is split in fixed-size shards, each generated from its own seed derived
+from the global seed, so the files are identical whatever the number of worker
+processes.
+
+Usage:
+    python -m back_end.data_pipeline.utils.synthetic_data nutrition 10000000 out/nutrition --format parquet
+    python -m back_end.data_pipeline.utils.synthetic_data intents 500000 out/intents --seed 7
+"""
+
+import argparse
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+CLEANED_PATH = PROJECT_ROOT / "back_end" / "data_pipeline" / "scripts" / "data" / "processed" / "nutrition_cleaned.csv"
+DIARY_PATH = PROJECT_ROOT / "datasets" / "fitness_diet_diary_1000.txt"
+INTENT_PATH = PROJECT_ROOT / "datasets" / "intent_data_ad_log_pro.csv"
+
+CATEGORICAL_COLUMNS = ["Gender", "Activity Level", "Fitness Goal", "Dietary Preference"]
+NUMERIC_COLUMNS = ["Age", "Height", "Weight", "Daily Calorie Target", "Protein", "Carbohydrates", "Fat"]
+MEAL_COLUMNS = ["Breakfast Suggestion", "Lunch Suggestion", "Dinner Suggestion", "Snack Suggestion"]
+
+# Rounding step of each numeric column, matching the granularity of the source data
+NUMERIC_STEPS = {"Age": 1, "Height": 1, "Weight": 1, "Daily Calorie Target": 50,
+                 "Protein": 1, "Carbohydrates": 1, "Fat": 1}
+
+# Scale of the correlated noise added around each bootstrapped row
+JITTER_BANDWIDTH = 0.25
+
+# Values outside the ranges enforced by clean_nutrition_data.filter_outliers
+OUTLIER_VALUES = {"Age": [3, 150, 300], "Height": [20, 400], "Weight": [5, 600],
+                  "Daily Calorie Target": [100, 12000]}
+
+DEFAULT_SHARD_ROWS = 1_000_000
+BATCH_ROWS = 250_000
+
+NUMBER_PATTERN = re.compile(r"\d+")
+
+
+class NutritionModel:
+    """
+    Generative model of the nutrition dataset learned from the cleaned CSV.
+
+    Rows are drawn by a smoothed bootstrap: a source row is sampled (keeping
+    the joint distribution of the categorical profile and numeric targets),
+    then its numeric values are perturbed with noise that has the covariance
+    of the data, so correlations (e.g. calories vs. macros) are preserved.
+    Meal suggestions are sampled per column among those observed for the
+    same dietary preference, so vegan rows keep vegan meals.
+    """
+
+    def __init__(self, df: pd.DataFrame):
+        self.columns = df.columns.tolist()
+        self.categories = df[CATEGORICAL_COLUMNS].to_numpy(dtype=object)
+        self.numbers = df[NUMERIC_COLUMNS].to_numpy(dtype=float)
+        self.low = self.numbers.min(axis=0)
+        self.high = self.numbers.max(axis=0)
+        self.noise = np.linalg.cholesky(np.cov(self.numbers, rowvar=False)) * JITTER_BANDWIDTH
+        self.diets = df["Dietary Preference"].to_numpy(dtype=object)
+        self.meals = {
+            diet: {col: group[col].to_numpy(dtype=object) for col in MEAL_COLUMNS}
+            for diet, group in df.groupby("Dietary Preference")
+        }
+
+    @classmethod
+    def from_csv(cls, path=CLEANED_PATH) -> "NutritionModel":
+        return cls(pd.read_csv(path))
+
+    def sample(self, rows: int, rng: np.random.Generator) -> pd.DataFrame:
+        """
+        Draws `rows` clean rows.
+
+        Args:
+            rows (int): Number of rows.
+            rng (np.random.Generator): Random source.
+
+        Returns:
+            pd.DataFrame: Rows with the nutrition dataset columns, in source order.
+        """
+        idx = rng.integers(0, len(self.numbers), rows)
+        numbers = self.numbers[idx] + rng.standard_normal((rows, len(NUMERIC_COLUMNS))) @ self.noise.T
+        numbers = np.clip(numbers, self.low, self.high)
+
+        data = {col: self.categories[idx, i] for i, col in enumerate(CATEGORICAL_COLUMNS)}
+        for i, col in enumerate(NUMERIC_COLUMNS):
+            step = NUMERIC_STEPS[col]
+            data[col] = (np.round(numbers[:, i] / step) * step).astype(np.int64)
+
+        diets = self.diets[idx]
+        for col in MEAL_COLUMNS:
+            values = np.empty(rows, dtype=object)
+            for diet, pools in self.meals.items():
+                mask = diets == diet
+                pool = pools[col]
+                values[mask] = pool[rng.integers(0, len(pool), int(mask.sum()))]
+            data[col] = values
+        return pd.DataFrame(data)[self.columns]
+
+
+def inject_dirty_rows(df: pd.DataFrame, fraction: float, rng: np.random.Generator) -> pd.DataFrame:
+    """
+    Corrupts a fraction of rows with the defects found in the raw dataset:
+    repeated header rows, padded strings and implausible values.
+
+    Args:
+        df (pd.DataFrame): Clean rows (modified in place).
+        fraction (float): Share of rows to corrupt, split evenly between defects.
+        rng (np.random.Generator): Random source.
+
+    Returns:
+        pd.DataFrame: Dataset with object-typed numeric columns, as read from a dirty CSV.
+    """
+    count = int(round(len(df) * fraction))
+    if count == 0:
+        return df
+    df = df.astype({col: object for col in NUMERIC_COLUMNS})
+    rows = rng.choice(len(df), size=count, replace=False)
+    headers, padded, outliers = np.array_split(rows, 3)
+
+    df.iloc[headers, :] = np.array(df.columns, dtype=object)
+    for col in CATEGORICAL_COLUMNS:
+        df.iloc[padded, df.columns.get_loc(col)] = "  " + df.iloc[padded][col].astype(str) + " "
+    for i, row in enumerate(outliers):
+        col = list(OUTLIER_VALUES)[i % len(OUTLIER_VALUES)]
+        df.iloc[row, df.columns.get_loc(col)] = rng.choice(OUTLIER_VALUES[col])
+    return df
+
+
+def _jitter_numbers(text: str, rng: np.random.Generator) -> str:
+    """Replaces every number in a message by a nearby value (±30%)."""
+    return NUMBER_PATTERN.sub(
+        lambda m: str(max(1, int(round(int(m.group()) * rng.uniform(0.7, 1.3))))), text)
+
+
+class TextModel:
+    """
+    Resamples messages from an existing corpus, recombining sentences and
+    varying the quantities they mention.
+    """
+
+    def __init__(self, texts: list[str], labels: list[str] = None):
+        self.texts = np.array(texts, dtype=object)
+        self.labels = np.array(labels, dtype=object) if labels is not None else None
+
+    @classmethod
+    def diary(cls, path=DIARY_PATH) -> "TextModel":
+        lines = [line.strip() for line in Path(path).read_text().splitlines() if line.strip()]
+        return cls(lines)
+
+    @classmethod
+    def intents(cls, path=INTENT_PATH) -> "TextModel":
+        data = pd.read_csv(path)
+        return cls(data["input"].str.strip().tolist(), data["label"].tolist())
+
+    def sample(self, rows: int, rng: np.random.Generator, max_sentences: int = 1) -> pd.DataFrame:
+        """
+        Draws `rows` messages.
+
+        Args:
+            rows (int): Number of messages.
+            rng (np.random.Generator): Random source.
+            max_sentences (int): Sentences joined per message (diary logs only).
+
+        Returns:
+            pd.DataFrame: "input" column, plus "label" for labelled corpora.
+        """
+        idx = rng.integers(0, len(self.texts), rows)
+        if self.labels is None and max_sentences > 1:
+            extra = rng.integers(0, max_sentences, rows)
+            texts = [
+                " ".join([self.texts[i], *self.texts[rng.integers(0, len(self.texts), n)]])
+                for i, n in zip(idx, extra)
+            ]
+        else:
+            texts = self.texts[idx]
+        data = {"input": [_jitter_numbers(text, rng) for text in texts]}
+        if self.labels is not None:
+            data["label"] = self.labels[idx]
+        return pd.DataFrame(data)
+
+
+def generate(kind: str, rows: int, seed: int = 0, dirty_fraction: float = 0.0) -> pd.DataFrame:
+    """
+    Generates a single in-memory dataset (for tests and benchmarks).
+
+    Args:
+        kind (str): "nutrition", "diary" or "intents".
+        rows (int): Number of rows.
+        seed (int): Random seed.
+        dirty_fraction (float): Share of dirty rows (nutrition only).
+
+    Returns:
+        pd.DataFrame: Generated rows.
+    """
+    return _generate_batch(kind, _load_model(kind), rows, np.random.default_rng(seed), dirty_fraction)
+
+
+def write_shards(kind: str, rows: int, out_dir: str, fmt: str = "csv", seed: int = 0,
+                 dirty_fraction: float = 0.0, shard_rows: int = DEFAULT_SHARD_ROWS,
+                 workers: int = None) -> list[Path]:
+    """
+    Generates `rows` rows into `out_dir/part-XXXXX.<fmt>` using worker processes.
+
+    Each shard has its own seed spawned from `seed` and is written in batches,
+    so memory stays bounded and the output does not depend on `workers`.
+
+    Args:
+        kind (str): "nutrition", "diary" or "intents".
+        rows (int): Total number of rows.
+        out_dir (str): Destination directory (created if needed).
+        fmt (str): "csv" or "parquet".
+        seed (int): Global random seed.
+        dirty_fraction (float): Share of dirty rows (nutrition only).
+        shard_rows (int): Rows per output file.
+        workers (int): Worker processes (defaults to the CPU count).
+
+    Returns:
+        list[Path]: Paths of the written shards, in order.
+    """
+    if fmt not in ("csv", "parquet"):
+        raise ValueError(f"❌ Unsupported format: {fmt}")
+    os.makedirs(out_dir, exist_ok=True)
+    shard_sizes = [min(shard_rows, rows - start) for start in range(0, rows, shard_rows)]
+    seeds = np.random.SeedSequence(seed).spawn(len(shard_sizes))
+    jobs = [
+        (kind, size, seeds[i], Path(out_dir) / f"part-{i:05}.{fmt}", fmt, dirty_fraction)
+        for i, size in enumerate(shard_sizes)
+    ]
+    if len(jobs) == 1 or workers == 1:
+        return [_write_shard(*job) for job in jobs]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(_write_shard, *zip(*jobs)))
+
+
+def _load_model(kind: str):
+    if kind == "nutrition":
+        return NutritionModel.from_csv()
+    if kind == "diary":
+        return TextModel.diary()
+    if kind == "intents":
+        return TextModel.intents()
+    raise ValueError(f"❌ Unknown dataset kind: {kind}")
+
+
+def _generate_batch(kind, model, rows, rng, dirty_fraction):
+    if kind == "nutrition":
+        df = model.sample(rows, rng)
+        return inject_dirty_rows(df, dirty_fraction, rng) if dirty_fraction else df
+    if kind == "diary":
+        return model.sample(rows, rng, max_sentences=2)
+    return model.sample(rows, rng)
+
+
+def _write_shard(kind, rows, seed_sequence, path, fmt, dirty_fraction) -> Path:
+    """Generates one shard in batches and streams it to disk."""
+    rng = np.random.default_rng(seed_sequence)
+    model = _load_model(kind)
+    writer = None
+    try:
+        for start in range(0, rows, BATCH_ROWS):
+            batch = _generate_batch(kind, model, min(BATCH_ROWS, rows - start), rng, dirty_fraction)
+            if fmt == "csv":
+                batch.to_csv(path, mode="w" if start == 0 else "a", header=start == 0, index=False)
+            else:
+                import pyarrow as pa
+                import pyarrow.parquet as pq
+
+                # Dirty batches mix text and numbers: store everything as text, like the raw CSV
+                table = pa.Table.from_pandas(batch.astype(str) if dirty_fraction else batch, preserve_index=False)
+                if writer is None:
+                    writer = pq.ParquetWriter(path, table.schema)
+                writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+    return path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("kind", choices=["nutrition", "diary", "intents"])
+    parser.add_argument("rows", type=int)
+    parser.add_argument("out_dir")
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--dirty-fraction", type=float, default=0.0,
+                        help="Share of rows with header echoes, padding or outliers (nutrition only).")
+    parser.add_argument("--shard-rows", type=int, default=DEFAULT_SHARD_ROWS)
+    parser.add_argument("--workers", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    paths = write_shards(args.kind, args.rows, args.out_dir, fmt=args.format, seed=args.seed,
+                         dirty_fraction=args.dirty_fraction, shard_rows=args.shard_rows,
+                         workers=args.workers)
+    print(f"✅ {args.rows} {args.kind} rows written to {len(paths)} shard(s) in {args.out_dir}")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,8 @@ from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker, Session
 from pprint import pprint
 
+from Infrastructure.monitoring.metrics import instrument_engine
+
 
 class DatabaseConnector:
     """
@@ -28,6 +30,7 @@ class DatabaseConnector:
 
         # Create SQLAlchemy engine and session factory
         self.engine = create_engine(self.database_url)
+        instrument_engine(self.engine)
         self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
     def get_session(self) -> Session:
@@ -67,4 +70,21 @@ class DatabaseConnector:
                     if command:
                         connection.execute(text(command))
 
-        print("✅ Schema executed: all tables created (if not exist).")
\ No newline at end of file
+        print("✅ Schema executed: all tables created (if not exist).")
+
+def get_connection(dotenv_path: str = None):
+    """
+    Returns a raw DB-API (psycopg2) connection from the SQLAlchemy engine pool.
+
+    Used by the cursor-based repositories. When no path is given, the default
+    `env_folder/.env.postgre` of the project is loaded.
+
+    Args:
+        dotenv_path (str): Optional path to the .env file.
+
+    Returns:
+        A DB-API connection; call `.close()` to return it to the pool.
+    """
+    if dotenv_path is None:
+        dotenv_path = os.path.join(os.path.dirname(__file__), "..", "..", "env_folder", ".env.postgre")
+    return DatabaseConnector(dotenv_path=dotenv_path).engine.raw_connection()
@@ -0,0 +1,271 @@
+# back_end/database/queries/user_queries.py
+"""
+Read queries behind the dashboard and the API: users by goal, diet type or
+fitness level, cohort counts and a user's full profile with labels.
+
+Listings use keyset pagination: a page is requested with the last `user_id`
+of the previous page (`after`) instead of an OFFSET, so a page never reads the
+rows before the cursor, however deep the client has paged. Selective filters
+are served by the (filter, user_id) indexes declared in `schema.sql`.
+"""
+
+import json
+from dataclasses import dataclass, field
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+COHORT_VIEW = "cohort_summary"
+
+# Columns of a listing row, labels resolved through the reference tables
+_USER_COLUMNS = """
+    u.user_id, u.age, g.label AS gender, u.height, u.weight, u.target_weight,
+    d.label AS diet_type, f.label AS fitness_level
+"""
+
+_LABEL_JOINS = """
+    JOIN genders g ON g.id = u.gender_id
+    JOIN diet_types d ON d.id = u.diet_type_id
+    JOIN fitness_levels f ON f.id = u.fitness_level_id
+"""
+
+# Labels are resolved to ids first (tiny unique lookups): with a literal id the
+# planner uses the column statistics and picks the composite index for
+# selective labels instead of guessing an average selectivity
+USERS_BY_DIET_SQL = f"""
+    SELECT {_USER_COLUMNS}
+    FROM users u {_LABEL_JOINS}
+    WHERE u.diet_type_id = :ref_id
+      AND u.user_id > :after
+    ORDER BY u.user_id
+    LIMIT :limit
+"""
+
+USERS_BY_FITNESS_LEVEL_SQL = f"""
+    SELECT {_USER_COLUMNS}
+    FROM users u {_LABEL_JOINS}
+    WHERE u.fitness_level_id = :ref_id
+      AND u.user_id > :after
+    ORDER BY u.user_id
+    LIMIT :limit
+"""
+
+USERS_BY_GOAL_SQL = f"""
+    SELECT {_USER_COLUMNS}
+    FROM user_goals ug
+    JOIN users u ON u.user_id = ug.user_id {_LABEL_JOINS}
+    WHERE ug.goal_id = :ref_id
+      AND ug.user_id > :after
+    ORDER BY ug.user_id
+    LIMIT :limit
+"""
+
+USER_PROFILE_SQL = f"""
+    SELECT {_USER_COLUMNS},
+           COALESCE(
+               (SELECT array_agg(go.label ORDER BY go.label)
+                FROM user_goals ug JOIN goals go ON go.goal_id = ug.goal_id
+                WHERE ug.user_id = u.user_id),
+               ARRAY[]::text[]
+           ) AS goals
+    FROM users u {_LABEL_JOINS}
+    WHERE u.user_id = :user_id
+"""
+
+# Users without a goal are kept (goal IS NULL) so the cohorts add up to the user count
+COHORT_COUNTS_SQL = """
+    SELECT g.label AS gender, d.label AS diet_type, f.label AS fitness_level,
+           go.label AS goal, COUNT(*) AS user_count
+    FROM users u
+    JOIN genders g ON g.id = u.gender_id
+    JOIN diet_types d ON d.id = u.diet_type_id
+    JOIN fitness_levels f ON f.id = u.fitness_level_id
+    LEFT JOIN user_goals ug ON ug.user_id = u.user_id
+    LEFT JOIN goals go ON go.goal_id = ug.goal_id
+    GROUP BY g.label, d.label, f.label, go.label
+"""
+
+COHORT_VIEW_COUNTS_SQL = f"""
+    SELECT gender, diet_type, fitness_level, goal, user_count
+    FROM {COHORT_VIEW}
+"""
+
+# REFRESH ... CONCURRENTLY needs a unique index covering every row; NULLS NOT
+# DISTINCT (PostgreSQL 15+) makes the goal-less cohorts unique as well
+CREATE_COHORT_VIEW_SQL = [
+    f"CREATE MATERIALIZED VIEW IF NOT EXISTS {COHORT_VIEW} AS {COHORT_COUNTS_SQL}",
+    f"CREATE UNIQUE INDEX IF NOT EXISTS idx_{COHORT_VIEW}_cohort "
+    f"ON {COHORT_VIEW} (gender, diet_type, fitness_level, goal) NULLS NOT DISTINCT",
+]
+
+
+@dataclass
+class Page:
+    """
+    One page of a keyset-paginated listing.
+
+    Attributes:
+        items (list[dict]): Rows of the page, ordered by user_id.
+        next_cursor (int | None): Value to pass as `after` for the next page,
+                                  None on the last page.
+    """
+    items: list = field(default_factory=list)
+    next_cursor: int = None
+
+
+def _page(db: Session, sql: str, table: str, id_col: str, label: str, after: int, limit: int) -> Page:
+    ref_id = db.execute(text(f"SELECT {id_col} FROM {table} WHERE label = :label"), {"label": label}).scalar()
+    if ref_id is None:
+        return Page()
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+    # Fetch one extra row to know whether another page exists without a COUNT
+    rows = db.execute(
+        text(sql), {"ref_id": ref_id, "after": after or 0, "limit": limit + 1}
+    ).mappings().all()
+    items = [dict(row) for row in rows[:limit]]
+    next_cursor = items[-1]["user_id"] if len(rows) > limit else None
+    return Page(items=items, next_cursor=next_cursor)
+
+
+def users_by_goal(db: Session, goal: str, after: int = None, limit: int = DEFAULT_PAGE_SIZE) -> Page:
+    """
+    Lists the users pursuing a goal.
+
+    Args:
+        db (Session): SQLAlchemy session (or connection)
+        goal (str): Goal label, e.g. 'Lose weight'
+        after (int): Cursor returned by the previous page (None for the first page)
+        limit (int): Page size, capped at MAX_PAGE_SIZE
+
+    Returns:
+        Page: Users with their labels and the next cursor
+    """
+    return _page(db, USERS_BY_GOAL_SQL, "goals", "goal_id", goal, after, limit)
+
+
+def users_by_diet(db: Session, diet_type: str, after: int = None, limit: int = DEFAULT_PAGE_SIZE) -> Page:
+    """
+    Lists the users following a diet type.
+
+    Args:
+        db (Session): SQLAlchemy session (or connection)
+        diet_type (str): Diet label, e.g. 'vegan'
+        after (int): Cursor returned by the previous page (None for the first page)
+        limit (int): Page size, capped at MAX_PAGE_SIZE
+
+    Returns:
+        Page: Users with their labels and the next cursor
+    """
+    return _page(db, USERS_BY_DIET_SQL, "diet_types", "id", diet_type, after, limit)
+
+
+def users_by_fitness_level(db: Session, fitness_level: str, after: int = None,
+                           limit: int = DEFAULT_PAGE_SIZE) -> Page:
+    """
+    Lists the users at a fitness level.
+
+    Args:
+        db (Session): SQLAlchemy session (or connection)
+        fitness_level (str): Fitness level label, e.g. 'beginner'
+        after (int): Cursor returned by the previous page (None for the first page)
+        limit (int): Page size, capped at MAX_PAGE_SIZE
+
+    Returns:
+        Page: Users with their labels and the next cursor
+    """
+    return _page(db, USERS_BY_FITNESS_LEVEL_SQL, "fitness_levels", "id", fitness_level, after, limit)
+
+
+def get_user_profile(db: Session, user_id: int) -> dict | None:
+    """
+    Returns a user's full profile with every label and the list of goals.
+
+    Args:
+        db (Session): SQLAlchemy session (or connection)
+        user_id (int): User ID
+
+    Returns:
+        dict | None: The profile, or None if the user does not exist
+    """
+    row = db.execute(text(USER_PROFILE_SQL), {"user_id": user_id}).mappings().first()
+    return dict(row) if row else None
+
+
+def cohort_counts(db: Session, use_view: bool = False) -> list[dict]:
+    """
+    Counts users per Gender x Diet x Fitness level x Goal cohort.
+
+    A user with several goals is counted once in each of their goal cohorts.
+
+    Args:
+        db (Session): SQLAlchemy session (or connection)
+        use_view (bool): Read the precomputed `cohort_summary` materialized view
+                         (see `create_cohort_summary_view`) instead of aggregating
+                         the live tables. The view is as fresh as its last refresh.
+
+    Returns:
+        list[dict]: gender, diet_type, fitness_level, goal and user_count per cohort
+    """
+    sql = COHORT_VIEW_COUNTS_SQL if use_view else COHORT_COUNTS_SQL
+    rows = db.execute(text(sql + " ORDER BY gender, diet_type, fitness_level, goal")).mappings().all()
+    return [dict(row) for row in rows]
+
+
+def create_cohort_summary_view(db: Session):
+    """
+    Creates (if needed) the `cohort_summary` materialized view and its unique index.
+
+    Args:
+        db (Session): SQLAlchemy session (or connection); the caller commits
+    """
+    for statement in CREATE_COHORT_VIEW_SQL:
+        db.execute(text(statement))
+
+
+def refresh_cohort_summary(db: Session, concurrently: bool = True):
+    """
+    Recomputes the `cohort_summary` materialized view.
+
+    A concurrent refresh does not block dashboard reads of the view while it
+    runs; it needs the view to be populated already, which
+    `create_cohort_summary_view` guarantees.
+
+    Args:
+        db (Session): SQLAlchemy session (or connection); the caller commits
+        concurrently (bool): Use REFRESH MATERIALIZED VIEW CONCURRENTLY
+    """
+    mode = "CONCURRENTLY " if concurrently else ""
+    db.execute(text(f"REFRESH MATERIALIZED VIEW {mode}{COHORT_VIEW}"))
+
+
+def explain(db: Session, sql: str, params: dict = None) -> dict:
+    """
+    Returns the planner's chosen plan for a query (EXPLAIN, not executed).
+
+    Args:
+        db (Session): SQLAlchemy session (or connection)
+        sql (str): Query text with :named parameters
+        params (dict): Query parameters
+
+    Returns:
+        dict: Root "Plan" node of EXPLAIN (FORMAT JSON)
+    """
+    result = db.execute(text(f"EXPLAIN (FORMAT JSON) {sql}"), params or {}).scalar()
+    if isinstance(result, str):
+        result = json.loads(result)
+    return result[0]["Plan"]
+
+
+def plan_nodes(plan: dict):
+    """
+    Iterates over a plan tree, yielding every node (depth-first).
+
+    Args:
+        plan (dict): Plan node as returned by `explain`
+    """
+    yield plan
+    for child in plan.get("Plans", []):
+        yield from plan_nodes(child)
@@ -6,15 +6,23 @@ from pathlib import Path
 
 root_path = Path(__file__).resolve().parents[2]
 dotenv_path = root_path / "env_folder" / ".env.postgre"
-db = DatabaseConnector(dotenv_path=str(dotenv_path))
 
-def reset_schema():
+
+def reset_schema(db: DatabaseConnector = None):
+    """
+    Drops every application table (and dependent views such as cohort_summary).
+
+    Args:
+        db (DatabaseConnector): (Optional) Connector to use; defaults to one
+                                built from env_folder/.env.postgre
+    """
+    db = db or DatabaseConnector(dotenv_path=str(dotenv_path))
     print("🧨 Dropping all tables...")
-    with db.engine.connect() as connection:
+    with db.engine.begin() as connection:
         connection.execute(text("""
             DROP TABLE IF EXISTS user_goals, users, genders, diet_types, fitness_levels, goals CASCADE;
         """))
     print("✅ Tables dropped.")
 
 if __name__ == "__main__":
-    reset_schema()
\ No newline at end of file
+    reset_schema()
@@ -48,4 +48,15 @@ CREATE TABLE IF NOT EXISTS user_goals (
     PRIMARY KEY (user_id, goal_id),     -- Prevents duplicates (one user = one goal once)
     FOREIGN KEY (user_id) REFERENCES users(user_id),
     FOREIGN KEY (goal_id) REFERENCES goals(goal_id)
-);
\ No newline at end of file
+);
+
+-- Secondary indexes (foreign keys + keyset pagination)
+
+-- Each index ends with user_id so "WHERE fk = ? AND user_id > ? ORDER BY user_id LIMIT ?"
+-- is answered by a single index range scan without a sort
+CREATE INDEX IF NOT EXISTS idx_users_gender_user ON users (gender_id, user_id);
+CREATE INDEX IF NOT EXISTS idx_users_diet_type_user ON users (diet_type_id, user_id);
+CREATE INDEX IF NOT EXISTS idx_users_fitness_level_user ON users (fitness_level_id, user_id);
+
+-- user_goals is only searchable by user_id through its primary key
+CREATE INDEX IF NOT EXISTS idx_user_goals_goal_user ON user_goals (goal_id, user_id);
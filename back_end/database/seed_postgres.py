@@ -15,7 +15,14 @@ GOALS = ["Lose weight", "Gain muscle", "Improve endurance", "Tone muscles"]
 # Auto-detect .env location
 root_path = Path(__file__).resolve().parents[2]
 dotenv_path = root_path / "env_folder" / ".env.postgre"
-db_connector = DatabaseConnector(dotenv_path=str(dotenv_path))
+
+
+def get_db_connector() -> DatabaseConnector:
+    """
+    Builds the connector on demand, so importing this module needs no database.
+    """
+    return DatabaseConnector(dotenv_path=str(dotenv_path))
+
 
 def insert_unique_values(db: Session, table: str, values: list[str], label_col="label"):
     """
@@ -39,13 +46,17 @@ def insert_unique_values(db: Session, table: str, values: list[str], label_col="
             )
 
 
-def run_seed():
+def run_seed(db_connector: DatabaseConnector = None):
     """
     Seeds PostgreSQL with reference data for genders, diet types, fitness levels, and goals.
+
+    Args:
+        db_connector (DatabaseConnector): (Optional) Connector to use; defaults to
+                                          one built from env_folder/.env.postgre
     """
     print("🌱 Seeding PostgreSQL reference tables...")
 
-    db = db_connector.get_session()
+    db = (db_connector or get_db_connector()).get_session()
     try:
         insert_unique_values(db, "genders", GENDERS)
         insert_unique_values(db, "diet_types", DIET_TYPES)
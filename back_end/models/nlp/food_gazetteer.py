@@ -0,0 +1,368 @@
+# back_end/models/nlp/food_gazetteer.py
+"""
+Food-entity extraction from diary logs with a gazetteer fast path.
+
+Most diary sentences mention foods that already appear in the meal suggestions
+of `nutrition_cleaned.csv` or earlier diary entries. Those are found by a
+word-level Aho-Corasick automaton in a single pass over each sentence; only
+the sentences with no gazetteer match are sent, in batches, to the NER model
+trained in `notebooks/token_classification_task.ipynb`.
+
+Example:
+    gazetteer = build_gazetteer(meal_suggestions(), diary_sentences())
+    result = extract_foods(diary_sentences(), gazetteer, ner=load_ner_pipeline())
+    result.report.to_dict()   # coverage and per-stage throughput
+"""
+
+import os
+import re
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from Infrastructure.monitoring.metrics import instrument_stage
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+NUTRITION_CSV = PROJECT_ROOT / "back_end" / "data_pipeline" / "scripts" / "data" / "processed" / "nutrition_cleaned.csv"
+DIARY_PATH = PROJECT_ROOT / "datasets" / "fitness_diet_diary_1000.txt"
+# Output directory of the notebook's Trainer, overridable for deployed models
+NER_MODEL_DIR = Path(os.getenv("FITNESS_NER_MODEL", PROJECT_ROOT / "notebooks" / "ner-model"))
+
+MEAL_COLUMNS = ["Breakfast Suggestion", "Lunch Suggestion", "Dinner Suggestion", "Snack Suggestion"]
+
+DEFAULT_BATCH_SIZE = 32
+
+# Hyphens split tokens so "whole-wheat bun" and "whole wheat bun" match alike
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+SENTENCE_PATTERN = re.compile(r"[^.!?\n]+[.!?]?")
+# Connectors between the foods of a meal: "Oatmeal with berries and nuts"
+CONNECTOR_PATTERN = re.compile(r",|&|\b(?:with|and|on|or|plus|topped|served|over)\b")
+DIARY_MEAL_PATTERN = re.compile(r"^\s*(?:had|ate|drank)\s+(.+?)\s+for\s+(?:breakfast|lunch|dinner|snacks?)\b",
+                                re.IGNORECASE)
+# Quantities and determiners stripped from the front of a phrase ("a handful of almonds")
+LEADING_WORDS = frozenset({
+    "a", "an", "the", "some", "of", "small", "large", "side", "handful", "piece", "pieces",
+    "cup", "cups", "slice", "slices", "glass", "serving", "servings", "bowl", "plate",
+})
+
+
+@dataclass(frozen=True)
+class FoodEntity:
+    """
+    A food mention in a sentence.
+
+    Attributes:
+        text (str): Mention as written in the sentence.
+        start (int): Start character offset.
+        end (int): End character offset (exclusive).
+        source (str): "gazetteer" or "ner".
+    """
+    text: str
+    start: int
+    end: int
+    source: str
+
+
+def _tokens(text: str) -> list[str]:
+    return TOKEN_PATTERN.findall(text.lower())
+
+
+def food_phrases(text: str) -> list[str]:
+    """
+    Splits a meal description into normalized food phrases.
+
+    Args:
+        text (str): E.g. "1 cup oatmeal with berries and nuts"
+
+    Returns:
+        list[str]: E.g. ["oatmeal", "berries", "nuts"]
+    """
+    phrases = []
+    for part in CONNECTOR_PATTERN.split(text.lower()):
+        tokens = _tokens(part)
+        while tokens and (tokens[0] in LEADING_WORDS or tokens[0].isdigit()):
+            tokens.pop(0)
+        if tokens:
+            phrases.append(" ".join(tokens))
+    return phrases
+
+
+class FoodGazetteer:
+    """
+    Word-level Aho-Corasick automaton over food phrases.
+
+    A sentence is scanned once whatever the number of phrases; overlapping
+    candidates are resolved leftmost-longest ("sweet potato fries" wins over
+    "sweet potato"). Matching works on whole tokens, so "pea" never matches
+    inside "peanut".
+
+    Args:
+        phrases (iterable[str]): Food phrases; normalized with the sentence tokenizer.
+    """
+
+    def __init__(self, phrases):
+        self._goto = [{}]
+        self._fail = [0]
+        self._lengths = [()]  # Token lengths of the phrases ending at each node
+        self.phrases = set()
+        for phrase in phrases:
+            self._add(_tokens(phrase))
+        self._link()
+
+    def __len__(self) -> int:
+        return len(self.phrases)
+
+    def __contains__(self, phrase: str) -> bool:
+        return " ".join(_tokens(phrase)) in self.phrases
+
+    def _add(self, tokens: list[str]):
+        if not tokens:
+            return
+        node = 0
+        for token in tokens:
+            child = self._goto[node].get(token)
+            if child is None:
+                child = len(self._goto)
+                self._goto[node][token] = child
+                self._goto.append({})
+                self._fail.append(0)
+                self._lengths.append(())
+            node = child
+        self._lengths[node] = (len(tokens),)
+        self.phrases.add(" ".join(tokens))
+
+    def _link(self):
+        # Breadth-first, so a node's failure target is final before its children use it
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self._goto[node].items():
+                queue.append(child)
+                fallback = self._fail[node]
+                while fallback and token not in self._goto[fallback]:
+                    fallback = self._fail[fallback]
+                self._fail[child] = self._goto[fallback].get(token, 0)
+                self._lengths[child] = self._lengths[child] + self._lengths[self._fail[child]]
+
+    def find(self, sentence: str) -> list[FoodEntity]:
+        """
+        Returns the non-overlapping food mentions of a sentence, in order.
+
+        Args:
+            sentence (str): Raw sentence
+
+        Returns:
+            list[FoodEntity]: Gazetteer matches
+        """
+        matches = list(TOKEN_PATTERN.finditer(sentence.lower()))
+        spans = [match.span() for match in matches]
+        candidates = []
+        node = 0
+        for i, match in enumerate(matches):
+            token = match.group()
+            while node and token not in self._goto[node]:
+                node = self._fail[node]
+            node = self._goto[node].get(token, 0)
+            for length in self._lengths[node]:
+                candidates.append((i - length + 1, i))
+
+        entities = []
+        next_free = 0
+        for first, last in sorted(candidates, key=lambda c: (c[0], c[0] - c[1])):
+            if first < next_free:
+                continue
+            start, end = spans[first][0], spans[last][1]
+            entities.append(FoodEntity(sentence[start:end], start, end, "gazetteer"))
+            next_free = last + 1
+        return entities
+
+
+def meal_suggestions(path=NUTRITION_CSV) -> list[str]:
+    """
+    Returns the distinct meal suggestions of the cleaned nutrition dataset.
+
+    Args:
+        path (str | Path): Cleaned CSV
+
+    Returns:
+        list[str]: Breakfast, lunch, dinner and snack suggestions
+    """
+    import pandas as pd
+
+    data = pd.read_csv(path, usecols=MEAL_COLUMNS)
+    return sorted(set(data.stack().dropna().astype(str)))
+
+
+def diary_sentences(path=DIARY_PATH) -> list[str]:
+    """
+    Splits the diary corpus into sentences.
+
+    Args:
+        path (str | Path): Text file, one or more sentences per line
+
+    Returns:
+        list[str]: Stripped, non-empty sentences
+    """
+    text = Path(path).read_text(encoding="utf-8")
+    return [match.group().strip() for match in SENTENCE_PATTERN.finditer(text) if match.group().strip()]
+
+
+@instrument_stage()
+def build_gazetteer(meals=(), diary=()) -> FoodGazetteer:
+    """
+    Builds the gazetteer from meal suggestions and diary meal sentences.
+
+    Only diary sentences shaped like "Had <foods> for <meal>." contribute; the
+    foods are split on connectors the same way as the meal suggestions.
+
+    Args:
+        meals (iterable[str]): Meal suggestions, see `meal_suggestions`
+        diary (iterable[str]): Diary sentences, see `diary_sentences`
+
+    Returns:
+        FoodGazetteer: Automaton over every distinct phrase
+    """
+    phrases = set()
+    for meal in set(meals):
+        phrases.update(food_phrases(meal))
+    for sentence in set(diary):
+        match = DIARY_MEAL_PATTERN.match(sentence)
+        if match:
+            phrases.update(food_phrases(match.group(1)))
+    return FoodGazetteer(phrases)
+
+
+def load_ner_pipeline(model_dir=NER_MODEL_DIR, batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Loads the fine-tuned token classifier as a batched NER callable.
+
+    transformers (and torch) are imported here only: the gazetteer path does
+    not need them.
+
+    Args:
+        model_dir (str | Path): Trainer output directory of the NER notebook
+        batch_size (int): Sentences per forward pass
+
+    Returns:
+        callable: list[str] -> list[list[dict]] with HF "entity_group", "start" and "end" keys
+    """
+    from transformers import pipeline
+
+    classifier = pipeline("ner", model=str(model_dir), tokenizer=str(model_dir), aggregation_strategy="simple")
+    return lambda sentences: classifier(list(sentences), batch_size=batch_size)
+
+
+@dataclass
+class ExtractionReport:
+    """
+    Coverage and per-stage throughput of one extraction run.
+
+    Sentence counts are over distinct sentences: repeated diary lines are
+    extracted once.
+    """
+    sentences: int = 0
+    distinct_sentences: int = 0
+    gazetteer_matched: int = 0
+    ner_sentences: int = 0
+    ner_matched: int = 0
+    gazetteer_seconds: float = 0.0
+    ner_seconds: float = 0.0
+
+    @property
+    def unmatched(self) -> int:
+        return self.distinct_sentences - self.gazetteer_matched - self.ner_matched
+
+    def to_dict(self) -> dict:
+        distinct = self.distinct_sentences or 1
+        return {
+            "sentences": self.sentences,
+            "distinct_sentences": self.distinct_sentences,
+            "gazetteer_matched": self.gazetteer_matched,
+            "ner_sentences": self.ner_sentences,
+            "ner_matched": self.ner_matched,
+            "unmatched": self.unmatched,
+            "gazetteer_coverage": round(self.gazetteer_matched / distinct, 4),
+            "coverage": round((self.gazetteer_matched + self.ner_matched) / distinct, 4),
+            "gazetteer_sentences_per_s": _rate(self.distinct_sentences, self.gazetteer_seconds),
+            "ner_sentences_per_s": _rate(self.ner_sentences, self.ner_seconds),
+        }
+
+
+def _rate(count: int, seconds: float) -> float:
+    return round(count / seconds, 1) if seconds > 0 else 0.0
+
+
+@dataclass
+class ExtractionResult:
+    """
+    Attributes:
+        entities (list[list[FoodEntity]]): Food mentions per input sentence, in input order.
+        report (ExtractionReport): Coverage and throughput.
+    """
+    entities: list = field(default_factory=list)
+    report: ExtractionReport = field(default_factory=ExtractionReport)
+
+
+def _ner_entities(sentence: str, predictions: list[dict], labels) -> list[FoodEntity]:
+    entities = []
+    for prediction in predictions:
+        label = prediction.get("entity_group", prediction.get("entity"))
+        if labels is not None and label not in labels:
+            continue
+        start, end = int(prediction["start"]), int(prediction["end"])
+        entities.append(FoodEntity(sentence[start:end], start, end, "ner"))
+    return entities
+
+
+@instrument_stage()
+def extract_foods(sentences, gazetteer: FoodGazetteer, ner=None, batch_size: int = DEFAULT_BATCH_SIZE,
+                  labels=None) -> ExtractionResult:
+    """
+    Extracts food mentions, trying the gazetteer first and the NER model second.
+
+    Args:
+        sentences (iterable[str]): Diary sentences
+        gazetteer (FoodGazetteer): See `build_gazetteer`
+        ner (callable): Batched model, list[str] -> list[list[dict]] (see
+                        `load_ner_pipeline`). None runs the gazetteer only.
+        batch_size (int): Sentences per NER call
+        labels (iterable[str]): NER entity groups kept as foods; None keeps all
+
+    Returns:
+        ExtractionResult: Entities per sentence and the run report
+    """
+    sentences = list(sentences)
+    labels = set(labels) if labels is not None else None
+    distinct = list(dict.fromkeys(sentences))
+    report = ExtractionReport(sentences=len(sentences), distinct_sentences=len(distinct))
+
+    start = time.perf_counter()
+    found = {sentence: gazetteer.find(sentence) for sentence in distinct}
+    report.gazetteer_seconds = time.perf_counter() - start
+    report.gazetteer_matched = sum(1 for entities in found.values() if entities)
+
+    if ner is not None:
+        misses = [sentence for sentence in distinct if not found[sentence]]
+        report.ner_sentences = len(misses)
+        start = time.perf_counter()
+        for i in range(0, len(misses), batch_size):
+            batch = misses[i:i + batch_size]
+            for sentence, predictions in zip(batch, ner(batch)):
+                found[sentence] = _ner_entities(sentence, predictions, labels)
+        report.ner_seconds = time.perf_counter() - start
+        report.ner_matched = sum(1 for sentence in misses if found[sentence])
+
+    return ExtractionResult(entities=[found[sentence] for sentence in sentences], report=report)
+
+
+if __name__ == "__main__":
+    corpus = diary_sentences()
+    food_gazetteer = build_gazetteer(meal_suggestions(), corpus)
+    print(f"🍽️ Gazetteer: {len(food_gazetteer)} food phrases")
+    try:
+        model = load_ner_pipeline()
+    except (ImportError, OSError) as error:
+        print(f"⚠️ NER model unavailable ({error}), running the gazetteer only.")
+        model = None
+    print(extract_foods(corpus, food_gazetteer, ner=model).report.to_dict())
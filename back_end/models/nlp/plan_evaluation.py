@@ -0,0 +1,360 @@
+# back_end/models/nlp/plan_evaluation.py
+"""
+Evaluation harness for the 7-day workout plans of the fitness assistant
+(`notebooks/fitness_plan_generation.ipynb`).
+
+Plans for a whole test split are generated in batches and cached on disk,
+keyed by model, prompt and generation parameters: rescoring, or re-running an
+evaluation after a crash, never regenerates a plan. Each plan is then scored
+against its reference in worker processes: ROUGE-1/2/L plus structure checks
+(weekdays present, "3 sets of 10 reps" parsed on every exercise line).
+
+Usage:
+    python -m back_end.models.nlp.plan_evaluation --batch-size 8 --workers 4
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+
+from Infrastructure.monitoring.metrics import instrument_stage
+
+MODEL_ID = "Soorya03/Llama-3.2-1B-Instruct-FitnessAssistant"
+PLAN_DATASET = "CristiD7/Comprehensive_7Day_Workout_Plans_100"
+PROMPT_COLUMN = "Context"
+REFERENCE_COLUMN = "Response"
+
+# Greedy decoding: a cached plan is then the plan the model would produce again
+DEFAULT_GENERATION_PARAMS = {"max_new_tokens": 512, "do_sample": False}
+DEFAULT_BATCH_SIZE = 8
+DEFAULT_CACHE_DIR = "~/.cache/fitness-ai/generations"
+
+WEEKDAYS = ("monday", "tuesday", "wednesday", "thursday", "friday", "saturday", "sunday")
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+DAY_PATTERN = re.compile(rf"^\W*({'|'.join(WEEKDAYS)})\b", re.IGNORECASE | re.MULTILINE)
+EXERCISE_PATTERN = re.compile(r"^\s*[-*•]\s*(.+)$", re.MULTILINE)
+SETS_REPS_PATTERN = re.compile(r"(\d+)\s*(?:sets?\s*(?:of|x|×)|x|×)\s*(\d+)(?:\s*reps?)?", re.IGNORECASE)
+REST_PATTERN = re.compile(r"\brest\b", re.IGNORECASE)
+
+
+class GenerationCache:
+    """
+    Disk cache of generated texts.
+
+    Layout under `cache_dir`:
+        <xx>/<sha256>.json   model, prompt, params and generation of one entry
+
+    The key hashes the model id, the prompt and the generation parameters
+    (sorted JSON), so changing any of them is a miss. Writes are atomic: a
+    crashed run leaves no partial entry.
+
+    Args:
+        cache_dir (str | Path): Cache root (defaults to PLAN_CACHE_DIR or ~/.cache/fitness-ai/generations).
+    """
+
+    def __init__(self, cache_dir=None):
+        self.cache_dir = Path(cache_dir or os.getenv("PLAN_CACHE_DIR", DEFAULT_CACHE_DIR)).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+    @staticmethod
+    def key(model_id: str, prompt: str, params: dict) -> str:
+        payload = json.dumps({"model": model_id, "prompt": prompt, "params": params}, sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.json"
+
+    def get(self, model_id: str, prompt: str, params: dict):
+        """
+        Returns:
+            str | None: The cached generation, None on a miss
+        """
+        try:
+            return json.loads(self._path(self.key(model_id, prompt, params)).read_text())["generation"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def put(self, model_id: str, prompt: str, params: dict, generation: str):
+        path = self._path(self.key(model_id, prompt, params))
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_suffix(f".tmp-{os.getpid()}")
+        tmp.write_text(json.dumps({"model": model_id, "prompt": prompt, "params": params, "generation": generation}))
+        os.replace(tmp, path)
+
+
+def load_generator(model_id: str = MODEL_ID, batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Loads the plan model as a batched generator.
+
+    transformers is imported here only: scoring cached plans does not need it.
+
+    Args:
+        model_id (str): Hugging Face model id or local directory
+        batch_size (int): Prompts per forward pass
+
+    Returns:
+        callable: (list[str], **params) -> list[str], generated text without the prompt
+    """
+    from transformers import AutoTokenizer, pipeline
+
+    tokenizer = AutoTokenizer.from_pretrained(model_id, padding_side="left")
+    if tokenizer.pad_token is None:
+        tokenizer.pad_token = tokenizer.eos_token
+    pipe = pipeline("text-generation", model=model_id, tokenizer=tokenizer, device_map="auto")
+
+    def generate(prompts, **params):
+        outputs = pipe(list(prompts), batch_size=batch_size, return_full_text=False, **params)
+        return [output[0]["generated_text"] for output in outputs]
+    return generate
+
+
+def load_test_split(dataset_name: str = PLAN_DATASET) -> list[dict]:
+    """
+    Returns the notebook's test split (10% of train, seed 42).
+
+    Returns:
+        list[dict]: {"prompt", "reference"} per example
+    """
+    from datasets import load_dataset
+
+    test = load_dataset(dataset_name)["train"].train_test_split(test_size=0.1, seed=42)["test"]
+    return [{"prompt": row[PROMPT_COLUMN], "reference": row[REFERENCE_COLUMN]} for row in test]
+
+
+@dataclass
+class GenerationStats:
+    """
+    Attributes:
+        cache_hits (int): Prompts served from the cache.
+        generated (int): Prompts sent to the model.
+        batches (int): Generator calls.
+        seconds (float): Time spent in the generator.
+    """
+    cache_hits: int = 0
+    generated: int = 0
+    batches: int = 0
+    seconds: float = 0.0
+
+
+@instrument_stage()
+def generate_plans(prompts, generator, model_id: str = MODEL_ID, params: dict = None,
+                   cache: GenerationCache = None, batch_size: int = DEFAULT_BATCH_SIZE):
+    """
+    Generates a plan per prompt, through the cache.
+
+    Distinct uncached prompts are generated in batches of `batch_size`; each
+    generation is cached as soon as its batch returns.
+
+    Args:
+        prompts (iterable[str]): Prompts, duplicates allowed
+        generator (callable): (list[str], **params) -> list[str], see `load_generator`
+        model_id (str): Model identifier, part of the cache key
+        params (dict): Generation parameters (default DEFAULT_GENERATION_PARAMS)
+        cache (GenerationCache): Disk cache; None disables caching
+        batch_size (int): Prompts per generator call
+
+    Returns:
+        tuple[list[str], GenerationStats]: Plans in prompt order and the run counters
+    """
+    prompts = list(prompts)
+    params = dict(DEFAULT_GENERATION_PARAMS if params is None else params)
+    stats = GenerationStats()
+    plans = {}
+    for prompt in dict.fromkeys(prompts):
+        cached = cache.get(model_id, prompt, params) if cache is not None else None
+        if cached is not None:
+            plans[prompt] = cached
+            stats.cache_hits += 1
+
+    missing = [prompt for prompt in dict.fromkeys(prompts) if prompt not in plans]
+    start = time.perf_counter()
+    for i in range(0, len(missing), batch_size):
+        batch = missing[i:i + batch_size]
+        outputs = generator(batch, **params)
+        if len(outputs) != len(batch):
+            raise ValueError(f"❌ Generator returned {len(outputs)} texts for {len(batch)} prompts")
+        for prompt, plan in zip(batch, outputs):
+            plans[prompt] = plan
+            if cache is not None:
+                cache.put(model_id, prompt, params, plan)
+        stats.batches += 1
+    stats.generated = len(missing)
+    stats.seconds = time.perf_counter() - start
+    return [plans[prompt] for prompt in prompts], stats
+
+
+def _ngrams(tokens: list[str], n: int) -> Counter:
+    return Counter(zip(*(tokens[i:] for i in range(n))))
+
+
+def _f1(overlap: int, predicted: int, expected: int) -> float:
+    if not overlap:
+        return 0.0
+    precision, recall = overlap / predicted, overlap / expected
+    return 2 * precision * recall / (precision + recall)
+
+
+def _lcs_length(a: list[str], b: list[str]) -> int:
+    previous = [0] * (len(b) + 1)
+    for token in a:
+        current = [0]
+        for j, other in enumerate(b):
+            current.append(previous[j] + 1 if token == other else max(previous[j + 1], current[j]))
+        previous = current
+    return previous[-1]
+
+
+def rouge_scores(prediction: str, reference: str) -> dict:
+    """
+    ROUGE-1, ROUGE-2 and ROUGE-L F-measures on lowercase alphanumeric tokens
+    (the rouge_score tokenization, without stemming).
+
+    Returns:
+        dict: {"rouge1", "rouge2", "rougeL"} in [0, 1]
+    """
+    predicted, expected = TOKEN_PATTERN.findall(prediction.lower()), TOKEN_PATTERN.findall(reference.lower())
+    scores = {}
+    for n in (1, 2):
+        pred_ngrams, ref_ngrams = _ngrams(predicted, n), _ngrams(expected, n)
+        overlap = sum((pred_ngrams & ref_ngrams).values())
+        scores[f"rouge{n}"] = _f1(overlap, sum(pred_ngrams.values()), sum(ref_ngrams.values()))
+    scores["rougeL"] = _f1(_lcs_length(predicted, expected), len(predicted), len(expected))
+    return scores
+
+
+def plan_structure(text: str) -> dict:
+    """
+    Structure checks of a 7-day plan.
+
+    Returns:
+        dict: days_present (distinct weekday headings), all_days (every weekday
+              present), rest_days, exercises (bullet lines other than rest),
+              sets_reps_parsed (exercise lines with "N sets of M reps") and
+              sets_reps_rate (their share, 0 without exercises)
+    """
+    days = {match.group(1).lower() for match in DAY_PATTERN.finditer(text)}
+    lines = [match.group(1) for match in EXERCISE_PATTERN.finditer(text)]
+    rest_days = sum(1 for line in lines if REST_PATTERN.search(line))
+    exercises = [line for line in lines if not REST_PATTERN.search(line)]
+    parsed = sum(1 for line in exercises if SETS_REPS_PATTERN.search(line))
+    return {
+        "days_present": len(days),
+        "all_days": len(days) == len(WEEKDAYS),
+        "rest_days": rest_days,
+        "exercises": len(exercises),
+        "sets_reps_parsed": parsed,
+        "sets_reps_rate": parsed / len(exercises) if exercises else 0.0,
+    }
+
+
+def score_plan(prediction: str, reference: str) -> dict:
+    """ROUGE against the reference plus the structure checks of the prediction."""
+    return {**rouge_scores(prediction, reference), **plan_structure(prediction)}
+
+
+@instrument_stage()
+def score_plans(predictions, references, workers: int = None) -> list[dict]:
+    """
+    Scores plans in worker processes.
+
+    Args:
+        predictions (list[str]): Generated plans
+        references (list[str]): Reference plans, same order
+        workers (int): Worker processes (defaults to the CPU count); 1 scores inline
+
+    Returns:
+        list[dict]: `score_plan` of each pair, in order
+    """
+    predictions, references = list(predictions), list(references)
+    if len(predictions) != len(references):
+        raise ValueError(f"❌ {len(predictions)} predictions for {len(references)} references")
+    if workers == 1 or len(predictions) <= 1:
+        return [score_plan(p, r) for p, r in zip(predictions, references)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        chunksize = max(1, len(predictions) // (4 * (workers or os.cpu_count() or 1)))
+        return list(pool.map(score_plan, predictions, references, chunksize=chunksize))
+
+
+@dataclass
+class EvaluationResult:
+    """
+    Attributes:
+        scores (list[dict]): Per-example scores, in example order.
+        summary (dict): Mean of every score plus generation counters and timings.
+        plans (list[str]): Generated plans.
+    """
+    scores: list = field(default_factory=list)
+    summary: dict = field(default_factory=dict)
+    plans: list = field(default_factory=list)
+
+
+def evaluate_plans(examples, generator, model_id: str = MODEL_ID, params: dict = None,
+                   cache: GenerationCache = None, batch_size: int = DEFAULT_BATCH_SIZE,
+                   workers: int = None) -> EvaluationResult:
+    """
+    Generates (or reads from the cache) and scores a plan for every example.
+
+    Args:
+        examples (iterable[dict]): {"prompt", "reference"} per example, see `load_test_split`
+        generator (callable): Batched generator, see `load_generator`
+        model_id (str): Model identifier, part of the cache key
+        params (dict): Generation parameters (default DEFAULT_GENERATION_PARAMS)
+        cache (GenerationCache): Disk cache; None disables caching
+        batch_size (int): Prompts per generator call
+        workers (int): Scoring processes
+
+    Returns:
+        EvaluationResult: Scores, summary and plans
+    """
+    examples = list(examples)
+    plans, stats = generate_plans([e["prompt"] for e in examples], generator, model_id, params, cache, batch_size)
+    start = time.perf_counter()
+    scores = score_plans(plans, [e["reference"] for e in examples], workers)
+    scoring_seconds = time.perf_counter() - start
+
+    summary = {"examples": len(examples)}
+    if scores:
+        for metric in scores[0]:
+            summary[metric] = round(sum(float(s[metric]) for s in scores) / len(scores), 4)
+    summary.update({**asdict(stats), "seconds": round(stats.seconds, 3), "scoring_seconds": round(scoring_seconds, 3)})
+    return EvaluationResult(scores=scores, summary=summary, plans=plans)
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--model", default=MODEL_ID)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--workers", type=int, help="Scoring processes (defaults to the CPU count).")
+    parser.add_argument("--max-new-tokens", type=int, default=DEFAULT_GENERATION_PARAMS["max_new_tokens"])
+    parser.add_argument("--cache-dir", help="Generation cache (default: ~/.cache/fitness-ai/generations).")
+    parser.add_argument("--output", help="Write the per-example scores and the summary as JSON.")
+    args = parser.parse_args(argv)
+
+    params = {**DEFAULT_GENERATION_PARAMS, "max_new_tokens": args.max_new_tokens}
+    # The model is only loaded when a plan is missing from the cache
+    loaded = {}
+
+    def generator(prompts, **kwargs):
+        if "model" not in loaded:
+            loaded["model"] = load_generator(args.model, args.batch_size)
+        return loaded["model"](prompts, **kwargs)
+
+    result = evaluate_plans(load_test_split(), generator, args.model, params, GenerationCache(args.cache_dir),
+                            args.batch_size, args.workers)
+    print(f"📊 {json.dumps(result.summary, indent=2)}")
+    if args.output:
+        Path(args.output).write_text(json.dumps({"summary": result.summary, "scores": result.scores}, indent=2))
+        print(f"✅ Scores saved to: {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,297 @@
+# back_end/models/regression/cohort_table.py
+"""
+Precomputed calorie and macro targets per Gender x Activity Level x Fitness
+Goal x Dietary Preference cohort.
+
+Aggregates (mean and percentiles) live in one dense NumPy array indexed by the
+integer code of each category. Every dimension has an extra "any" slot holding
+the aggregate over all of its categories, so coarser cohorts are precomputed as
+well: a sparse cohort falls back to the same cohort without its diet, then
+without its activity level, and so on. A lookup is a fixed number of array
+reads whatever the dataset size, and a batch of lookups is vectorized.
+
+The table is saved as .npy files plus a JSON header, so it can be loaded
+memory-mapped (shared between API workers, nothing parsed at startup).
+
+Example:
+    table = CohortTable.from_frame(pd.read_csv(NUTRITION_CSV))
+    table.lookup("Female", "Moderately Active", "Weight Loss", "Vegan")["Protein"]["median"]
+"""
+
+import itertools
+import json
+from dataclasses import dataclass
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+PROJECT_ROOT = Path(__file__).resolve().parents[3]
+PROCESSED_DIR = PROJECT_ROOT / "back_end" / "data_pipeline" / "scripts" / "data" / "processed"
+NUTRITION_CSV = PROCESSED_DIR / "nutrition_cleaned.csv"
+TABLE_DIR = PROCESSED_DIR / "cohort_table"
+
+# Category order defines the integer codes; values are those enforced by the cleaning rules
+COHORT_DIMENSIONS = {
+    "Gender": ("Male", "Female"),
+    "Activity Level": ("Sedentary", "Lightly Active", "Moderately Active", "Very Active"),
+    "Fitness Goal": ("Weight Loss", "Muscle Gain", "Maintenance"),
+    "Dietary Preference": ("Omnivore", "Vegetarian", "Vegan"),
+}
+TARGET_COLUMNS = ("Daily Calorie Target", "Protein", "Carbohydrates", "Fat")
+QUANTILES = {"p10": 0.10, "p25": 0.25, "median": 0.50, "p75": 0.75, "p90": 0.90}
+STATISTICS = ("mean", *QUANTILES)
+
+# Dimensions dropped one after the other when a cohort is too small
+FALLBACK_ORDER = ("Dietary Preference", "Activity Level", "Fitness Goal", "Gender")
+DEFAULT_MIN_COUNT = 5
+
+STATS_FILE = "stats.npy"
+COUNTS_FILE = "counts.npy"
+HEADER_FILE = "header.json"
+
+
+@dataclass
+class CohortLookup:
+    """
+    Result of a batched lookup.
+
+    Attributes:
+        values (np.ndarray): Shape (n, targets, statistics).
+        counts (np.ndarray): Rows behind each answer.
+        levels (np.ndarray): Fallback level used (0 = exact cohort; a dimension
+                             given as missing reads its "any" slot at every level).
+        targets (tuple): Target column of each values[:, i].
+        statistics (tuple): Statistic of each values[:, :, j].
+    """
+    values: np.ndarray
+    counts: np.ndarray
+    levels: np.ndarray
+    targets: tuple
+    statistics: tuple
+
+    def to_frame(self) -> pd.DataFrame:
+        """One row per query, one "<target> <statistic>" column per aggregate."""
+        columns = [f"{target} {stat}" for target in self.targets for stat in self.statistics]
+        frame = pd.DataFrame(self.values.reshape(len(self.values), -1), columns=columns)
+        frame.insert(0, "cohort_size", self.counts)
+        frame.insert(1, "fallback_level", self.levels)
+        return frame
+
+
+class CohortTable:
+    """
+    Dense cohort aggregate table.
+
+    Args:
+        stats (np.ndarray): Shape (*[len(categories) + 1 per dimension], targets, statistics);
+                            the last index of each dimension is the "any" slot.
+        counts (np.ndarray): Rows per cell, shape of `stats` without the last two axes.
+        dimensions (dict): Dimension column -> categories, in code order.
+        targets (tuple): Target columns.
+        statistics (tuple): Statistic names.
+        fallback_order (tuple): Dimensions dropped, in order, for sparse cohorts.
+    """
+
+    def __init__(self, stats: np.ndarray, counts: np.ndarray, dimensions: dict = None,
+                 targets=TARGET_COLUMNS, statistics=STATISTICS, fallback_order=FALLBACK_ORDER):
+        self.dimensions = {name: tuple(values) for name, values in (dimensions or COHORT_DIMENSIONS).items()}
+        self.targets = tuple(targets)
+        self.statistics = tuple(statistics)
+        self.fallback_order = tuple(fallback_order)
+        expected = tuple(len(values) + 1 for values in self.dimensions.values())
+        if counts.shape != expected or stats.shape != expected + (len(self.targets), len(self.statistics)):
+            raise ValueError(f"Table shapes {stats.shape} / {counts.shape} do not match the dimensions {expected}")
+        self.stats = stats
+        self.counts = counts
+        names = list(self.dimensions)
+        # Level k replaces the first k dimensions of the fallback order by their "any" slot
+        self._level_masks = np.array(
+            [[name in self.fallback_order[:k] for name in names] for k in range(len(self.fallback_order) + 1)]
+        )
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, dimensions: dict = None, targets=TARGET_COLUMNS,
+                   fallback_order=FALLBACK_ORDER) -> "CohortTable":
+        """
+        Aggregates a cleaned nutrition dataset into every cohort and coarser cohort.
+
+        Args:
+            df (pd.DataFrame): Rows with the dimension and target columns
+            dimensions (dict): Dimension column -> categories (default COHORT_DIMENSIONS)
+            targets (tuple): Columns to aggregate
+            fallback_order (tuple): See CohortTable
+
+        Returns:
+            CohortTable: The populated table; empty cells hold NaN and a count of 0
+        """
+        dimensions = {name: tuple(values) for name, values in (dimensions or COHORT_DIMENSIONS).items()}
+        shape = tuple(len(values) + 1 for values in dimensions.values())
+        codes = np.column_stack([
+            pd.Categorical(df[name], categories=values).codes for name, values in dimensions.items()
+        ])
+        known = (codes >= 0).all(axis=1)
+        codes = codes[known]
+        values = df.loc[known, list(targets)].astype(float).reset_index(drop=True)
+
+        stats = np.full(shape + (len(targets), len(STATISTICS)), np.nan)
+        counts = np.zeros(shape, dtype=np.int64)
+        any_slots = np.array(shape) - 1
+        # One grouped pass per subset of aggregated dimensions (2^4 = 16 passes)
+        for aggregated in itertools.product((False, True), repeat=len(dimensions)):
+            cells = np.where(aggregated, any_slots, codes)
+            flat = pd.Series(np.ravel_multi_index(cells.T, shape), name="cell")
+            groups = values.groupby(flat)
+            index = np.unravel_index(groups.size().index.to_numpy(), shape)
+            counts[index] = groups.size().to_numpy()
+            stats[index + (slice(None), 0)] = groups.mean().to_numpy()
+            quantiles = groups.quantile(list(QUANTILES.values())).unstack()
+            for j, q in enumerate(QUANTILES.values(), start=1):
+                stats[index + (slice(None), j)] = quantiles.xs(q, axis=1, level=1)[list(targets)].to_numpy()
+        return cls(stats, counts, dimensions, targets, STATISTICS, fallback_order)
+
+    def encode(self, queries) -> np.ndarray:
+        """
+        Integer-encodes cohorts; missing labels (None / NaN) map to the "any" slot.
+
+        Args:
+            queries (pd.DataFrame | dict): One sequence of labels per dimension column
+
+        Returns:
+            np.ndarray: Codes of shape (n, dimensions)
+
+        Raises:
+            ValueError: If a label is not one of the dimension's categories
+        """
+        columns = []
+        for name, categories in self.dimensions.items():
+            labels = np.asarray(queries[name], dtype=object)
+            codes = pd.Categorical(labels, categories=categories).codes
+            # A typo must not silently widen the cohort to the whole population
+            unknown = (codes < 0) & pd.notna(labels)
+            if unknown.any():
+                raise ValueError(f"Unknown {name} {list(dict.fromkeys(labels[unknown]))}; expected one of {categories}")
+            columns.append(np.where(codes < 0, len(categories), codes))
+        return np.column_stack(columns).astype(np.intp)
+
+    def lookup_codes(self, codes: np.ndarray, min_count: int = DEFAULT_MIN_COUNT) -> CohortLookup:
+        """
+        Batched lookup of integer-encoded cohorts.
+
+        Each query gets the finest level of the fallback order with at least
+        `min_count` rows; the last level (every dimension aggregated) is used
+        whatever its size.
+
+        Args:
+            codes (np.ndarray): Shape (n, dimensions), see `encode`
+            min_count (int): Smallest cohort trusted as is
+
+        Returns:
+            CohortLookup: Aggregates, cohort sizes and fallback levels
+        """
+        codes = np.asarray(codes, dtype=np.intp)
+        any_slots = np.array(self.counts.shape) - 1
+        # (levels, n, dimensions): the cell of every query at every level
+        cells = np.where(self._level_masks[:, None, :], any_slots, codes[None, :, :])
+        level_counts = self.counts[tuple(np.moveaxis(cells, -1, 0))]
+        enough = level_counts >= min_count
+        enough[-1] = True
+        levels = enough.argmax(axis=0)
+        chosen = cells[levels, np.arange(len(codes))]
+        index = tuple(chosen.T)
+        return CohortLookup(values=np.asarray(self.stats[index]), counts=np.asarray(self.counts[index]),
+                            levels=levels, targets=self.targets, statistics=self.statistics)
+
+    def lookup_batch(self, queries, min_count: int = DEFAULT_MIN_COUNT) -> CohortLookup:
+        """
+        Batched lookup by labels.
+
+        Args:
+            queries (pd.DataFrame | dict): One sequence of labels per dimension column
+            min_count (int): Smallest cohort trusted as is
+
+        Returns:
+            CohortLookup: Aggregates, cohort sizes and fallback levels
+        """
+        return self.lookup_codes(self.encode(queries), min_count)
+
+    def lookup(self, gender: str, activity_level: str, fitness_goal: str, dietary_preference: str,
+               min_count: int = DEFAULT_MIN_COUNT) -> dict:
+        """
+        Typical targets of a single cohort.
+
+        Raises:
+            ValueError: If a label is not one of its dimension's categories
+
+        Returns:
+            dict: {"cohort_size", "fallback_level", "<target>": {"<statistic>": value}}
+        """
+        labels = (gender, activity_level, fitness_goal, dietary_preference)
+        result = self.lookup_batch({name: [label] for name, label in zip(self.dimensions, labels)}, min_count)
+        answer = {"cohort_size": int(result.counts[0]), "fallback_level": int(result.levels[0])}
+        for i, target in enumerate(self.targets):
+            answer[target] = {stat: float(result.values[0, i, j]) for j, stat in enumerate(self.statistics)}
+        return answer
+
+    def save(self, directory=TABLE_DIR) -> Path:
+        """
+        Writes the arrays as .npy files and the layout as a JSON header.
+
+        Args:
+            directory (str | Path): Destination directory
+
+        Returns:
+            Path: The directory
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / STATS_FILE, np.ascontiguousarray(self.stats))
+        np.save(directory / COUNTS_FILE, np.ascontiguousarray(self.counts))
+        header = {
+            "dimensions": {name: list(values) for name, values in self.dimensions.items()},
+            "targets": list(self.targets),
+            "statistics": list(self.statistics),
+            "fallback_order": list(self.fallback_order),
+        }
+        (directory / HEADER_FILE).write_text(json.dumps(header, indent=2))
+        return directory
+
+    @classmethod
+    def load(cls, directory=TABLE_DIR, mmap: bool = True) -> "CohortTable":
+        """
+        Loads a saved table.
+
+        Args:
+            directory (str | Path): Directory written by `save`
+            mmap (bool): Memory-map the arrays (read-only) instead of reading them
+
+        Returns:
+            CohortTable: The table
+        """
+        directory = Path(directory)
+        header = json.loads((directory / HEADER_FILE).read_text())
+        mode = "r" if mmap else None
+        return cls(
+            np.load(directory / STATS_FILE, mmap_mode=mode),
+            np.load(directory / COUNTS_FILE, mmap_mode=mode),
+            header["dimensions"], header["targets"], header["statistics"], header["fallback_order"],
+        )
+
+
+def build_cohort_table(input_path=NUTRITION_CSV, output_dir=TABLE_DIR) -> CohortTable:
+    """
+    Builds the table from the cleaned CSV and saves it.
+
+    Args:
+        input_path (str | Path): Cleaned nutrition CSV
+        output_dir (str | Path): Destination directory
+
+    Returns:
+        CohortTable: The saved table
+    """
+    columns = [*COHORT_DIMENSIONS, *TARGET_COLUMNS]
+    table = CohortTable.from_frame(pd.read_csv(input_path, usecols=columns))
+    table.save(output_dir)
+    populated = int((table.counts[(slice(-1),) * table.counts.ndim] > 0).sum())
+    print(f"✅ Cohort table saved to: {output_dir} ({populated} populated cohorts)")
+    return table
@@ -0,0 +1,39 @@
+# benchmarks/bench_cli.py
+"""
+Cold-start benchmarks of the command line: each run is a fresh interpreter,
+so the time includes Python startup and every module-level import.
+"""
+
+import subprocess
+import sys
+from pathlib import Path
+
+from benchmarks.harness import measure
+
+PROJECT_ROOT = Path(__file__).resolve().parents[1]
+
+COMMANDS = {
+    "cli_help_cold_start": ["-m", "back_end.cli", "--help"],
+    "cli_clean_help_cold_start": ["-m", "back_end.cli", "clean", "--help"],
+    # Reference point: interpreter startup alone
+    "python_startup": ["-c", "pass"],
+}
+
+
+def run(repeat: int = 10) -> dict:
+    """
+    Runs the CLI cold-start benchmarks.
+
+    Args:
+        repeat (int): Timed runs per benchmark.
+
+    Returns:
+        dict: Benchmark name -> measurement.
+    """
+    results = {}
+    for name, args in COMMANDS.items():
+        command = [sys.executable, *args]
+        results[name] = measure(
+            lambda: subprocess.run(command, cwd=PROJECT_ROOT, stdout=subprocess.DEVNULL, check=True),
+            repeat=repeat, warmup=1)
+    return results
@@ -0,0 +1,55 @@
+# benchmarks/bench_nlp.py
+"""
+Benchmarks of the rule-based NLP hot paths: the profile parser and the
+calorie calculator, run over the "user_profile" messages of the intent dataset,
+and the food gazetteer over the diary corpus.
+"""
+
+from pathlib import Path
+
+import pandas as pd
+
+from back_end.models.model_utils.calories_calculator import calculate_caloric_needs, parse_user_input
+from back_end.models.nlp.food_gazetteer import build_gazetteer, diary_sentences, meal_suggestions
+from benchmarks.harness import measure
+
+INTENT_CSV = Path(__file__).resolve().parents[1] / "datasets" / "intent_data_ad_log_pro.csv"
+
+
+def load_profile_messages() -> list[str]:
+    """Returns every "user_profile" message of the intent dataset."""
+    data = pd.read_csv(INTENT_CSV)
+    return data.loc[data["label"] == "user_profile", "input"].tolist()
+
+
+def _safe_calculate(profile: dict):
+    # Profiles without a duration are rejected by design; they still cost a call
+    try:
+        return calculate_caloric_needs(**profile)
+    except ValueError:
+        return None
+
+
+def run(repeat: int = 10) -> dict:
+    """
+    Runs the NLP benchmarks.
+
+    Args:
+        repeat (int): Timed runs per benchmark.
+
+    Returns:
+        dict: Benchmark name -> measurement.
+    """
+    messages = load_profile_messages()
+    profiles = [parse_user_input(text) for text in messages]
+    diary = diary_sentences()
+    gazetteer = build_gazetteer(meal_suggestions(), diary)
+    return {
+        "parse_user_input": measure(
+            lambda: [parse_user_input(text) for text in messages], repeat=repeat, items=len(messages)),
+        "calculate_caloric_needs": measure(
+            lambda: [_safe_calculate(p) for p in profiles], repeat=repeat, items=len(profiles)),
+        # Every line, not the distinct ones: the raw automaton cost per sentence
+        "food_gazetteer_find": measure(
+            lambda: [gazetteer.find(sentence) for sentence in diary], repeat=repeat, items=len(diary)),
+    }
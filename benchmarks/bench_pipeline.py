@@ -0,0 +1,42 @@
+# benchmarks/bench_pipeline.py
+"""
+Benchmarks of the cleaning stage and the analysis statistics on synthetic
+nutrition datasets of increasing size.
+"""
+
+from back_end.data_pipeline.scripts.analyze_cleaned_data import analyze_unique_categories, describe_numerical
+from back_end.data_pipeline.scripts.clean_nutrition_data import clean_nutrition_dataset
+from back_end.data_pipeline.utils.synthetic_data import generate
+from benchmarks.harness import measure
+
+NUMERIC_COLUMNS = ["Age", "Height", "Weight", "Daily Calorie Target", "Protein", "Carbohydrates", "Fat"]
+
+# Share of raw-looking defects (header echoes, padding, outliers) in the input
+DIRTY_FRACTION = 0.01
+
+
+def run(sizes: list[int], repeat: int = 5) -> dict:
+    """
+    Runs the pipeline benchmarks.
+
+    Args:
+        sizes (list[int]): Dataset sizes in rows.
+        repeat (int): Timed runs per benchmark (1 for sizes above 1M rows).
+
+    Returns:
+        dict: Benchmark name -> measurement.
+    """
+    results = {}
+    for rows in sizes:
+        runs = repeat if rows <= 1_000_000 else 1
+        raw = generate("nutrition", rows, seed=0, dirty_fraction=DIRTY_FRACTION)
+        results[f"clean_nutrition_dataset[{rows}]"] = measure(
+            lambda: clean_nutrition_dataset(raw.copy()), repeat=runs, warmup=0, items=rows)
+
+        cleaned = clean_nutrition_dataset(raw.copy()).astype({col: "float64" for col in NUMERIC_COLUMNS})
+        results[f"describe_numerical[{rows}]"] = measure(
+            lambda: describe_numerical(cleaned), repeat=runs, warmup=0, items=rows)
+        results[f"analyze_unique_categories[{rows}]"] = measure(
+            lambda: analyze_unique_categories(cleaned), repeat=runs, warmup=0, items=rows)
+        del raw, cleaned
+    return results
@@ -0,0 +1,64 @@
+# benchmarks/bench_repository.py
+"""
+Benchmarks of the UserRepository insert paths against the local PostgreSQL
+container (docker-compose / env_folder/.env.postgre).
+
+Inserted users are deleted afterwards; reference labels are left in place.
+"""
+
+from pathlib import Path
+
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from benchmarks.harness import measure
+
+DOTENV_PATH = Path(__file__).resolve().parents[1] / "env_folder" / ".env.postgre"
+
+USER = {
+    "age": 29, "gender": "female", "height": 163.0, "weight": 56.0, "target_weight": 54.0,
+    "diet_type": "vegetarian", "fitness_level": "intermediate",
+    "goals": ["Lose weight", "Improve endurance"],
+}
+
+
+def run(users: int = 200, repeat: int = 5) -> dict:
+    """
+    Runs the repository benchmarks.
+
+    Args:
+        users (int): Users inserted per timed run.
+        repeat (int): Timed runs per benchmark.
+
+    Returns:
+        dict: Benchmark name -> measurement, or {} when PostgreSQL is unreachable.
+    """
+    from back_end.database.connect import DatabaseConnector
+    from back_end.database.repository.user_repository import UserRepository
+
+    try:
+        connector = DatabaseConnector(dotenv_path=str(DOTENV_PATH))
+        connector.execute_schema()
+        repo = UserRepository()
+    except (OperationalError, ValueError) as e:
+        print(f"⚠️ Skipping repository benchmarks: {e}")
+        return {}
+
+    inserted = []
+    try:
+        results = {
+            "user_repository.insert_user": measure(
+                lambda: inserted.extend(repo.insert_user(**USER) for _ in range(users)),
+                repeat=repeat, items=users),
+            "user_repository.get_or_create_label_id": measure(
+                lambda: [repo.get_or_create_label_id("diet_types", "vegetarian") for _ in range(users)],
+                repeat=repeat, items=users),
+        }
+    finally:
+        repo.conn.rollback()
+        repo.close()
+        with connector.engine.begin() as conn:
+            conn.execute(text("DELETE FROM user_goals WHERE user_id = ANY(:ids)"), {"ids": inserted})
+            conn.execute(text("DELETE FROM users WHERE user_id = ANY(:ids)"), {"ids": inserted})
+    return results
+
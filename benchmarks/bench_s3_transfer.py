@@ -0,0 +1,129 @@
+# benchmarks/bench_s3_transfer.py
+"""
+Benchmarks S3Manager directory transfers against a local S3 stand-in.
+
+Compares the sequential per-file `upload`/`download` calls with the parallel
+`upload_dir`/`download_dir` for two workloads: many small files (visuals,
+CSVs) and a few large ones (model checkpoints).
+
+By default an in-process moto server is used. It shares the benchmark's GIL,
+so it understates the gain on many small files; pass --endpoint-url to target
+an out-of-process stand-in such as MinIO (http://localhost:9000).
+
+Usage:
+    python -m benchmarks.bench_s3_transfer
+    python -m benchmarks.bench_s3_transfer --endpoint-url http://localhost:9000 --bucket bench
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import tempfile
+from pathlib import Path
+
+import boto3
+
+from Infrastructure.aws.s3.utils import Timer, join_key, walk_files
+
+WORKLOADS = {
+    "many_small": {"files": 500, "size": 32 * 1024},
+    "few_large": {"files": 4, "size": 64 * 1024 * 1024},
+}
+
+
+def make_workload(root: Path, files: int, size: int) -> Path:
+    """Writes `files` random files of `size` bytes into a nested tree."""
+    for i in range(files):
+        path = root / f"part_{i % 10}" / f"file_{i:05}.bin"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(os.urandom(size))
+    return root
+
+
+def run_sequential(manager, local_dir: Path, prefix: str) -> float:
+    """Uploads then downloads each file one at a time with the legacy methods."""
+    with Timer() as timer, contextlib.redirect_stdout(io.StringIO()):
+        for path in walk_files(local_dir):
+            manager.upload(str(path), join_key(prefix, str(path.relative_to(local_dir))))
+        for path in walk_files(local_dir):
+            target = local_dir.parent / "seq_out" / path.relative_to(local_dir)
+            target.parent.mkdir(parents=True, exist_ok=True)
+            manager.download(join_key(prefix, str(path.relative_to(local_dir))), str(target))
+    return timer.elapsed
+
+
+def run_parallel(manager, local_dir: Path, prefix: str) -> float:
+    """Uploads then downloads the whole tree with the thread-pooled directory methods."""
+    with Timer() as timer:
+        up = manager.upload_dir(str(local_dir), prefix=prefix)
+        down = manager.download_dir(prefix, str(local_dir.parent / "par_out"))
+    assert up.ok and down.ok, (up.failed, down.failed)
+    return timer.elapsed
+
+
+def benchmark(workloads: dict) -> dict:
+    """Runs every workload in both modes and returns timings in seconds."""
+    from Infrastructure.aws.s3.s3_manager import S3Manager
+
+    manager = S3Manager()
+    results = {}
+    for name, spec in workloads.items():
+        with tempfile.TemporaryDirectory() as tmp:
+            src = make_workload(Path(tmp) / "src", spec["files"], spec["size"])
+            total_mb = spec["files"] * spec["size"] / (1024 * 1024)
+            sequential = run_sequential(manager, src, f"bench/{name}/seq")
+            parallel = run_parallel(manager, src, f"bench/{name}/par")
+            results[name] = {
+                "files": spec["files"],
+                "total_mb": round(total_mb, 1),
+                "sequential_s": round(sequential, 3),
+                "parallel_s": round(parallel, 3),
+                "speedup": round(sequential / parallel, 2) if parallel else None,
+            }
+            print(f"⏱️ {name}: sequential {sequential:.2f}s | parallel {parallel:.2f}s")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--endpoint-url", help="Local S3 endpoint (e.g. MinIO). Defaults to an in-process moto server.")
+    parser.add_argument("--bucket", default="bench-bucket")
+    parser.add_argument("--small-files", type=int, default=WORKLOADS["many_small"]["files"])
+    parser.add_argument("--large-mb", type=int, default=WORKLOADS["few_large"]["size"] // (1024 * 1024))
+    args = parser.parse_args()
+
+    workloads = {
+        "many_small": {**WORKLOADS["many_small"], "files": args.small_files},
+        "few_large": {**WORKLOADS["few_large"], "size": args.large_mb * 1024 * 1024},
+    }
+
+    os.environ["S3_BUCKET"] = args.bucket
+    os.environ.setdefault("AWS_REGION", "us-east-1")
+    os.environ.setdefault("AWS_ACCESS_KEY_ID", "testing")
+    os.environ.setdefault("AWS_SECRET_ACCESS_KEY", "testing")
+
+    server = None
+    if args.endpoint_url:
+        endpoint = args.endpoint_url
+    else:
+        from moto.server import ThreadedMotoServer
+        server = ThreadedMotoServer(ip_address="127.0.0.1", port=0, verbose=False)
+        server.start()
+        host, port = server.get_host_and_port()
+        endpoint = f"http://{host}:{port}"
+    os.environ["S3_ENDPOINT_URL"] = endpoint
+
+    try:
+        client = boto3.client("s3", endpoint_url=endpoint, region_name=os.environ["AWS_REGION"])
+        with contextlib.suppress(client.exceptions.BucketAlreadyOwnedByYou):
+            client.create_bucket(Bucket=args.bucket)
+        print(json.dumps(benchmark(workloads), indent=2))
+    finally:
+        if server:
+            server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+# benchmarks/harness.py
+"""
+Timing and baseline-comparison helpers shared by the benchmark suites.
+
+A result document has the shape:
+    {"meta": {...}, "benchmarks": {name: {"median_s": float, ...}}}
+
+A baseline is a committed result document, optionally with a "thresholds"
+section mapping benchmark names to their own allowed slowdown.
+
+Absolute timings vary from one machine (or one moment) to the next, so every
+run also times a fixed pure-Python calibration loop and stores each
+benchmark's min and median in calibration units ("min_units",
+"median_units"): a machine that is uniformly 40% slower does not report
+regressions. The current best run is compared with the baseline's typical
+(median) run, so one lucky fast run recorded in the baseline cannot turn into
+a permanent false alarm.
+"""
+
+import json
+import platform
+import statistics
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+DEFAULT_THRESHOLD = 0.25  # fail when a benchmark is more than 25% slower
+
+CALIBRATION_LOOPS = 300_000
+# Metadata fields that must match for timings to be comparable at all
+ENVIRONMENT_FIELDS = ("platform", "processor", "python")
+
+
+def measure(fn, repeat: int = 5, warmup: int = 1, items: int = None) -> dict:
+    """
+    Times a zero-argument callable.
+
+    Args:
+        fn (callable): Code under test.
+        repeat (int): Number of timed runs.
+        warmup (int): Untimed runs executed first (imports, caches).
+        items (int): (Optional) Units processed per run, to report throughput.
+
+    Returns:
+        dict: median_s, min_s, mean_s, repeat and, if `items` is given,
+              items and items_per_s (based on the median).
+    """
+    for _ in range(warmup):
+        fn()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+
+    median = statistics.median(timings)
+    result = {
+        "median_s": round(median, 6),
+        "min_s": round(min(timings), 6),
+        "mean_s": round(statistics.fmean(timings), 6),
+        "repeat": repeat,
+    }
+    if items:
+        result["items"] = items
+        result["items_per_s"] = round(items / median, 1) if median else None
+    return result
+
+
+def _calibration_workload() -> int:
+    total = 0
+    for i in range(CALIBRATION_LOOPS):
+        total += i * i % 7
+    return total
+
+
+def calibrate(repeat: int = 15) -> float:
+    """
+    Times the fixed calibration loop (about 20 ms on a laptop).
+
+    Returns:
+        float: Fastest run in seconds.
+    """
+    return measure(_calibration_workload, repeat=repeat, warmup=2)["min_s"]
+
+
+def normalize(benchmarks: dict, calibration_s: float) -> dict:
+    """
+    Adds "min_units" and "median_units" (seconds / calibration_s) to every
+    measurement, in place.
+
+    Args:
+        benchmarks (dict): Benchmark name -> measurement.
+        calibration_s (float): Result of `calibrate` for the same run.
+
+    Returns:
+        dict: The same mapping.
+    """
+    for result in benchmarks.values():
+        result["min_units"] = round(result["min_s"] / calibration_s, 4)
+        result["median_units"] = round(result["median_s"] / calibration_s, 4)
+    return benchmarks
+
+
+def environment_mismatch(meta: dict, baseline_meta: dict) -> dict:
+    """
+    Lists the environment fields that differ from the baseline.
+
+    Returns:
+        dict: field -> {"baseline": ..., "current": ...}; empty when comparable
+    """
+    return {
+        field: {"baseline": baseline_meta.get(field), "current": meta.get(field)}
+        for field in ENVIRONMENT_FIELDS
+        if baseline_meta.get(field) is not None and baseline_meta.get(field) != meta.get(field)
+    }
+
+
+def metadata() -> dict:
+    """Describes the machine and interpreter the results were produced on."""
+    return {
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "processor": platform.processor() or platform.machine(),
+    }
+
+
+def compare(results: dict, baseline: dict, threshold: float = DEFAULT_THRESHOLD) -> list[dict]:
+    """
+    Compares results against a baseline and lists the regressions.
+
+    Only benchmarks present in both documents are compared, see `slowdown`.
+
+    Args:
+        results (dict): Current result document.
+        baseline (dict): Baseline document (may contain per-benchmark "thresholds").
+        threshold (float): Default allowed relative slowdown (0.25 = +25%).
+
+    Returns:
+        list[dict]: One entry per regression with name, baseline_s, current_s,
+                    ratio and threshold.
+    """
+    overrides = baseline.get("thresholds", {})
+    regressions = []
+    for name, current in results.get("benchmarks", {}).items():
+        reference = baseline.get("benchmarks", {}).get(name)
+        if not reference or not reference.get("min_s"):
+            continue
+        allowed = overrides.get(name, threshold)
+        ratio = slowdown(current, reference)
+        if ratio > 1 + allowed:
+            regressions.append({
+                "name": name,
+                "baseline_s": reference["min_s"],
+                "current_s": current["min_s"],
+                "ratio": round(ratio, 3),
+                "threshold": allowed,
+            })
+    return regressions
+
+
+def slowdown(current: dict, reference: dict) -> float:
+    """
+    Relative time of one benchmark against its baseline.
+
+    Calibrated documents compare the current minimum with the baseline
+    median, in calibration units; older ones compare raw minimums.
+
+    Returns:
+        float: 1.0 = as fast as the baseline, 1.3 = 30% slower
+    """
+    if current.get("min_units") and reference.get("median_units"):
+        return current["min_units"] / reference["median_units"]
+    return current["min_s"] / reference["min_s"]
+
+
+def load_json(path) -> dict:
+    """Reads a result or baseline document; a missing file gives an empty one."""
+    path = Path(path)
+    if not path.exists():
+        return {}
+    return json.loads(path.read_text())
+
+
+def save_json(path, document: dict) -> None:
+    """Writes a result document with stable key ordering for readable diffs."""
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(document, indent=2, sort_keys=True) + "\n")
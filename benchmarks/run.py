@@ -0,0 +1,165 @@
+# benchmarks/run.py
+"""
+Runs the benchmark suite and compares it with the committed baseline.
+
+Exit code is 1 when any benchmark is slower than its baseline by more than
+the allowed threshold, so CI fails loudly on hot-path regressions.
+
+Usage:
+    python -m benchmarks.run                        # quick profile (1k, 100k rows)
+    python -m benchmarks.run --profile full         # adds 10M rows
+    python -m benchmarks.run --suite nlp --threshold 0.1
+    python -m benchmarks.run --update-baseline      # accept current numbers
+    python -m benchmarks.run --strict-environment   # refuse a baseline from another machine
+
+Timings are compared in units of a calibration loop timed before and after the
+suites, so a uniformly slower machine does not fail the gate. Suites with a
+regression are re-run (--retries) and only regressions seen on every attempt
+fail, so a burst of background load does not either.
+"""
+
+import argparse
+import sys
+from pathlib import Path
+
+from benchmarks.harness import (
+    DEFAULT_THRESHOLD,
+    calibrate,
+    compare,
+    environment_mismatch,
+    load_json,
+    metadata,
+    normalize,
+    save_json,
+    slowdown,
+)
+
+BENCH_DIR = Path(__file__).resolve().parent
+BASELINE_PATH = BENCH_DIR / "baseline.json"
+RESULTS_PATH = BENCH_DIR / "results" / "latest.json"
+
+PROFILES = {
+    "quick": [1_000, 100_000],
+    "full": [1_000, 100_000, 10_000_000],
+}
+SUITES = ("pipeline", "nlp", "repository", "cli")
+
+
+def run_suites(suites, sizes: list[int]) -> dict:
+    """Runs the selected suites and merges their measurements (un-normalized)."""
+    benchmarks = {}
+    if "pipeline" in suites:
+        from benchmarks import bench_pipeline
+        benchmarks.update(bench_pipeline.run(sizes))
+    if "nlp" in suites:
+        from benchmarks import bench_nlp
+        benchmarks.update(bench_nlp.run())
+    if "repository" in suites:
+        from benchmarks import bench_repository
+        benchmarks.update(bench_repository.run())
+    if "cli" in suites:
+        from benchmarks import bench_cli
+        benchmarks.update(bench_cli.run())
+    return benchmarks
+
+
+def measure_suites(suites, sizes: list[int]) -> dict:
+    """
+    Runs suites between two calibrations and normalizes their measurements.
+
+    Returns:
+        tuple: ({suite: {benchmark name: measurement}}, calibration time in seconds)
+    """
+    # Calibrated on both sides of the suites: the faster run is the machine's actual speed
+    calibration_s = calibrate()
+    measured = {suite: run_suites([suite], sizes) for suite in suites}
+    calibration_s = min(calibration_s, calibrate())
+    for benchmarks in measured.values():
+        normalize(benchmarks, calibration_s)
+    return measured, calibration_s
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--suite", action="append", choices=SUITES,
+                        help="Suite to run (repeatable). Defaults to all.")
+    parser.add_argument("--profile", choices=PROFILES, default="quick")
+    parser.add_argument("--sizes", type=int, nargs="+", help="Override dataset sizes in rows.")
+    parser.add_argument("--output", default=str(RESULTS_PATH), help="Where to write the JSON results.")
+    parser.add_argument("--baseline", default=str(BASELINE_PATH))
+    parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                        help="Allowed relative slowdown (0.25 = +25%%).")
+    parser.add_argument("--update-baseline", action="store_true",
+                        help="Write the results as the new baseline instead of comparing.")
+    parser.add_argument("--retries", type=int, default=2,
+                        help="Re-runs of the suites with a regression before failing.")
+    parser.add_argument("--strict-environment", action="store_true",
+                        help="Exit 2 instead of warning when the baseline comes from another platform/Python.")
+    args = parser.parse_args(argv)
+
+    suites = args.suite or SUITES
+    sizes = args.sizes or PROFILES[args.profile]
+    by_suite, calibration_s = measure_suites(suites, sizes)
+    results = {
+        "meta": {**metadata(), "profile": args.profile, "calibration_s": calibration_s},
+        "benchmarks": {name: result for measured in by_suite.values() for name, result in measured.items()},
+    }
+    baseline = load_json(args.baseline)
+    mismatch = environment_mismatch(results["meta"], baseline.get("meta", {}))
+
+    if args.update_baseline:
+        save_json(args.output, results)
+        print(f"📊 Results saved to: {args.output}")
+        # A partial run (--suite) only refreshes its own entries; hand-tuned
+        # per-benchmark thresholds are always kept
+        previous = baseline
+        baseline = {"benchmarks": previous.get("benchmarks", {}) if args.suite else {}}
+        baseline["benchmarks"].update(results["benchmarks"])
+        baseline["meta"] = results["meta"]
+        if previous.get("thresholds"):
+            baseline["thresholds"] = previous["thresholds"]
+        save_json(args.baseline, baseline)
+        print(f"✅ Baseline updated: {args.baseline}")
+        return 0
+
+    if mismatch:
+        results["meta"]["baseline_mismatch"] = mismatch
+        details = ", ".join(f"{field}: {v['baseline']} → {v['current']}" for field, v in mismatch.items())
+        print(f"⚠️ Baseline recorded in another environment ({details}).")
+        if args.strict_environment:
+            save_json(args.output, results)
+            print("❌ Refusing to compare; re-record it here with --update-baseline.")
+            return 2
+        print("   Timings are calibrated but may still not be comparable.")
+
+    regressions = compare(results, baseline, threshold=args.threshold)
+    for attempt in range(1, args.retries + 1):
+        if not regressions:
+            break
+        flagged = {reg["name"] for reg in regressions}
+        print(f"🔁 Attempt {attempt + 1}: re-running {len(flagged)} suspected regression(s)...")
+        fresh, _ = measure_suites([suite for suite in suites if flagged & set(by_suite[suite])], sizes)
+        # Keep each benchmark's best attempt: noise only ever makes a run slower
+        for name, result in ((n, r) for measured in fresh.values() for n, r in measured.items()):
+            if result["min_units"] < results["benchmarks"][name]["min_units"]:
+                results["benchmarks"][name] = result
+        regressions = compare(results, baseline, threshold=args.threshold)
+
+    save_json(args.output, results)
+    print(f"📊 Results saved to: {args.output}")
+    for name, current in sorted(results["benchmarks"].items()):
+        reference = baseline.get("benchmarks", {}).get(name)
+        delta = f"{slowdown(current, reference) - 1:+.1%}" if reference and reference.get("min_s") else "new"
+        print(f"  {name:<45} {current['min_s']:>10.4f}s  {delta}")
+
+    for reg in regressions:
+        print(f"❌ {reg['name']}: {reg['baseline_s']:.4f}s → {reg['current_s']:.4f}s "
+              f"(x{reg['ratio']}, allowed +{reg['threshold']:.0%})")
+    if regressions:
+        return 1
+    print("✅ No regression beyond threshold.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+# tests/Infrastructure/aws/s3/test_cache.py
+
+import threading
+
+import boto3
+import pytest
+from moto import mock_aws
+from Infrastructure.aws.s3.cache import S3Cache
+from Infrastructure.aws.s3.s3_manager import S3Manager
+
+TEST_BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def s3_manager(monkeypatch):
+    """
+    Provides an S3Manager bound to an in-memory moto bucket.
+
+    Returns:
+        S3Manager: Manager instance pointing at the empty test bucket.
+    """
+    monkeypatch.setenv("S3_BUCKET", TEST_BUCKET)
+    monkeypatch.setenv("AWS_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("S3_ENDPOINT_URL", raising=False)
+
+    with mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=TEST_BUCKET)
+        yield S3Manager()
+
+
+def _put(s3_manager, key, body):
+    s3_manager.s3.put_object(Bucket=s3_manager.bucket, Key=key, Body=body)
+
+
+def test_cache_hit_after_first_download(s3_manager, tmp_path):
+    """
+    Test that the second access is answered by a 304 revalidation and served from disk.
+    """
+    _put(s3_manager, "models/vocab.txt", b"[PAD]\n[UNK]\n")
+    cache = S3Cache(s3_manager, cache_dir=str(tmp_path))
+
+    first = cache.get("models/vocab.txt")
+    second = cache.get("models/vocab.txt")
+
+    assert first == second
+    assert second.read_bytes() == b"[PAD]\n[UNK]\n"
+    metrics = cache.metrics()
+    assert (metrics["hits"], metrics["misses"], metrics["revalidations"]) == (1, 1, 1)
+    assert metrics["bytes_downloaded"] == metrics["bytes_served"] == 12
+
+
+def test_cache_refreshes_changed_object(s3_manager, tmp_path):
+    """
+    Test that an object updated in S3 is downloaded again (ETag mismatch).
+    """
+    _put(s3_manager, "datasets/nutrition.csv", b"v1")
+    cache = S3Cache(s3_manager, cache_dir=str(tmp_path))
+    cache.get("datasets/nutrition.csv")
+
+    _put(s3_manager, "datasets/nutrition.csv", b"version 2")
+
+    assert cache.get("datasets/nutrition.csv").read_bytes() == b"version 2"
+    assert cache.stats.misses == 2
+
+
+def test_cache_downloads_once_under_concurrency(s3_manager, tmp_path, monkeypatch):
+    """
+    Test that concurrent requests for the same key trigger a single full download.
+    """
+    _put(s3_manager, "models/tokenizer.json", b"{}" * 1000)
+    cache = S3Cache(s3_manager, cache_dir=str(tmp_path))
+    full_gets = []
+    original = s3_manager.s3.get_object
+
+    def counting_get_object(**kwargs):
+        if "IfNoneMatch" not in kwargs:
+            full_gets.append(kwargs)
+        return original(**kwargs)
+
+    monkeypatch.setattr(s3_manager.s3, "get_object", counting_get_object)
+
+    threads = [threading.Thread(target=cache.get, args=("models/tokenizer.json",)) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert len(full_gets) == 1
+    assert cache.stats.misses == 1
+    assert cache.stats.hits == 7
+
+
+def test_cache_evicts_least_recently_used(s3_manager, tmp_path):
+    """
+    Test that the oldest entry is evicted once the size cap is exceeded.
+    """
+    for name in ("a", "b", "c"):
+        _put(s3_manager, f"ckpt/{name}.bin", name.encode() * 100)
+    cache = S3Cache(s3_manager, cache_dir=str(tmp_path), max_bytes=250)
+
+    cache.get("ckpt/a.bin")
+    cache.get("ckpt/b.bin")
+    cache.get("ckpt/a.bin")  # a becomes most recently used
+    cache.get("ckpt/c.bin")
+
+    metrics = cache.metrics()
+    assert metrics["evictions"] == 1
+    assert metrics["entries"] == 2
+    assert metrics["size_bytes"] == 200
+
+
+def test_cache_removes_previous_versions_of_rewritten_key(s3_manager, tmp_path):
+    """
+    Test that rewriting a key keeps a single blob on disk, under the size cap,
+    while a blob shared with another key survives.
+    """
+    cache = S3Cache(s3_manager, cache_dir=str(tmp_path), max_bytes=150)
+    _put(s3_manager, "ckpt/shared.bin", b"0" * 100)
+    cache.get("ckpt/shared.bin")
+    cache.max_bytes = 250
+
+    for version in range(5):
+        _put(s3_manager, "ckpt/model.bin", str(version).encode() * 100)
+        cache.get("ckpt/model.bin")
+
+    metrics = cache.metrics()
+    assert metrics["entries"] == 2
+    assert metrics["size_bytes"] == 200
+    assert cache.get("ckpt/shared.bin").read_bytes() == b"0" * 100
+
+
+def test_shared_blob_survives_concurrent_release(s3_manager, tmp_path):
+    """
+    Test that a worker refreshing a key cannot delete a blob that another
+    worker has just published for a different key with the same content.
+    """
+    _put(s3_manager, "models/v1.bin", b"weights")
+    _put(s3_manager, "models/latest.bin", b"weights")
+    worker_a = S3Cache(s3_manager, cache_dir=str(tmp_path))
+    worker_b = S3Cache(s3_manager, cache_dir=str(tmp_path))
+    worker_b.get("models/latest.bin")
+    _put(s3_manager, "models/latest.bin", b"weights v2")
+
+    # Worker B refreshes "latest" (releasing the shared blob) while worker A is
+    # between publishing that blob for "v1" and indexing it
+    refresh = threading.Thread(target=worker_b.get, args=("models/latest.bin",))
+    write_entry = worker_a._write_entry
+
+    def interleaved_write(index_path, entry):
+        refresh.start()
+        refresh.join(timeout=1)
+        write_entry(index_path, entry)
+
+    worker_a._write_entry = interleaved_write
+    path = worker_a.get("models/v1.bin")
+    refresh.join()
+
+    assert path.read_bytes() == b"weights"
+    assert worker_b.get("models/latest.bin").read_bytes() == b"weights v2"
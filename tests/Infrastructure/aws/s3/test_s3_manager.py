@@ -0,0 +1,279 @@
+# tests/Infrastructure/aws/s3/test_s3_manager.py
+
+import os
+
+import boto3
+import pytest
+from moto import mock_aws
+from Infrastructure.aws.s3.s3_manager import S3Manager
+
+TEST_BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def s3_manager(monkeypatch):
+    """
+    Provides an S3Manager bound to an in-memory moto bucket.
+
+    Environment variables are patched so that get_s3_config() resolves to the
+    fake bucket and no real AWS credentials are ever used.
+
+    Returns:
+        S3Manager: Manager instance pointing at the empty test bucket.
+    """
+    monkeypatch.setenv("S3_BUCKET", TEST_BUCKET)
+    monkeypatch.setenv("AWS_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("S3_ENDPOINT_URL", raising=False)
+
+    with mock_aws():
+        boto3.client("s3", region_name="us-east-1").create_bucket(Bucket=TEST_BUCKET)
+        yield S3Manager()
+
+
+def _make_tree(root):
+    """Creates a small nested directory mimicking data/processed."""
+    (root / "visuals").mkdir(parents=True)
+    (root / "nutrition_cleaned.csv").write_text("Age,Gender\n25,Male\n")
+    (root / "visuals" / "Age_hist.png").write_bytes(os.urandom(2048))
+    (root / "visuals" / "Fat_hist.png").write_bytes(os.urandom(4096))
+    return root
+
+
+def test_upload_dir_preserves_layout(s3_manager, tmp_path):
+    """
+    Test that upload_dir() publishes every file under the prefix with relative keys
+    and reports the aggregated byte count.
+    """
+    src = _make_tree(tmp_path / "processed")
+
+    result = s3_manager.upload_dir(str(src), prefix="runs/001")
+
+    assert result.ok
+    assert result.succeeded == [
+        "runs/001/nutrition_cleaned.csv",
+        "runs/001/visuals/Age_hist.png",
+        "runs/001/visuals/Fat_hist.png",
+    ]
+    assert result.bytes_transferred == sum(
+        p.stat().st_size for p in src.rglob("*") if p.is_file()
+    )
+
+
+def test_download_dir_round_trip(s3_manager, tmp_path):
+    """
+    Test that download_dir() mirrors an uploaded prefix byte-for-byte and
+    reports progress up to the total size.
+    """
+    src = _make_tree(tmp_path / "processed")
+    s3_manager.upload_dir(str(src), prefix="runs/001")
+
+    seen = []
+    dst = tmp_path / "restored"
+    result = s3_manager.download_dir("runs/001", str(dst), progress=lambda done, total: seen.append((done, total)))
+
+    assert result.ok
+    assert result.files == 3
+    for path in src.rglob("*"):
+        if path.is_file():
+            assert (dst / path.relative_to(src)).read_bytes() == path.read_bytes()
+    assert seen[-1][0] == seen[-1][1] == result.bytes_transferred
+    assert [done for done, _ in seen] == sorted(done for done, _ in seen)
+
+
+def test_download_dir_stops_at_folder_boundary(s3_manager, tmp_path):
+    """
+    Test that downloading "runs/1" does not pull the sibling folders "runs/10" and "runs/11".
+    """
+    _put_keys(s3_manager, ["runs/1/a.csv", "runs/10/b.csv", "runs/11/c.csv"])
+    dst = tmp_path / "restored"
+
+    result = s3_manager.download_dir("runs/1", str(dst))
+
+    assert result.succeeded == ["runs/1/a.csv"]
+    assert sorted(p.relative_to(dst).as_posix() for p in dst.rglob("*") if p.is_file()) == ["a.csv"]
+
+
+def test_upload_dir_collects_errors(s3_manager, tmp_path):
+    """
+    Test that failures are recorded per key instead of aborting the batch.
+    """
+    src = _make_tree(tmp_path / "processed")
+    s3_manager.bucket = "missing-bucket"
+
+    result = s3_manager.upload_dir(str(src))
+
+    assert not result.ok
+    assert set(result.failed) == {
+        "nutrition_cleaned.csv", "visuals/Age_hist.png", "visuals/Fat_hist.png"
+    }
+    assert result.succeeded == []
+
+
+def _put_keys(s3_manager, keys):
+    """Writes empty objects for each key."""
+    for key in keys:
+        s3_manager.s3.put_object(Bucket=s3_manager.bucket, Key=key, Body=b"")
+
+
+def test_iter_keys_follows_pagination(s3_manager):
+    """
+    Test that listing is not truncated at the 1000-key page limit.
+    """
+    keys = [f"runs/old/file_{i:05}.csv" for i in range(1200)]
+    _put_keys(s3_manager, keys)
+
+    assert list(s3_manager.iter_keys("runs/old/")) == keys
+    assert len(s3_manager.list("runs/")) == 1200
+
+
+def test_iter_objects_sharded_covers_every_key(s3_manager):
+    """
+    Test that the sharded listing returns the same keys as the sequential one,
+    including objects sitting directly under the prefix.
+    """
+    keys = ["runs/manifest.json"] + [f"runs/{shard}/file_{i}.png" for shard in "abcd" for i in range(30)]
+    _put_keys(s3_manager, keys)
+
+    sharded = [obj["Key"] for obj in s3_manager.iter_objects_sharded("runs", max_workers=3)]
+
+    assert sorted(sharded) == sorted(keys)
+
+
+def test_delete_prefix_batches_requests(s3_manager, monkeypatch):
+    """
+    Test that delete_prefix() removes 2500 keys in three delete_objects calls.
+    """
+    _put_keys(s3_manager, [f"runs/old/{i}.bin" for i in range(2500)] + ["runs/keep.bin"])
+    calls = []
+    original = s3_manager.s3.delete_objects
+    monkeypatch.setattr(s3_manager.s3, "delete_objects", lambda **kw: calls.append(kw) or original(**kw))
+
+    result = s3_manager.delete_prefix("runs/old/")
+
+    assert result.ok
+    assert len(result.succeeded) == 2500
+    assert [len(c["Delete"]["Objects"]) for c in calls] == [1000, 1000, 500]
+    assert list(s3_manager.iter_keys("runs/")) == ["runs/keep.bin"]
+
+
+def test_delete_prefix_stops_at_folder_boundary(s3_manager):
+    """
+    Test that deleting "runs/1" leaves the sibling folders "runs/10" and "runs/11" alone.
+    """
+    _put_keys(s3_manager, ["runs/1/a.csv", "runs/1/sub/b.csv", "runs/10/b.csv", "runs/11/c.csv", "runs/1.csv"])
+
+    result = s3_manager.delete_prefix("runs/1")
+
+    assert result.succeeded == ["runs/1/a.csv", "runs/1/sub/b.csv"]
+    assert list(s3_manager.iter_keys("runs/")) == ["runs/1.csv", "runs/10/b.csv", "runs/11/c.csv"]
+    with pytest.raises(ValueError):
+        s3_manager.delete_prefix("/")
+
+
+def test_delete_many_reports_per_key_errors(s3_manager, monkeypatch):
+    """
+    Test that per-key errors returned by S3 are surfaced in the result.
+    """
+    monkeypatch.setattr(s3_manager.s3, "delete_objects", lambda **kw: {
+        "Errors": [{"Key": "b", "Code": "AccessDenied", "Message": "Access Denied"}]
+    })
+
+    result = s3_manager.delete_many(iter(["a", "b", "c"]))
+
+    assert result.succeeded == ["a", "c"]
+    assert result.failed == {"b": "AccessDenied: Access Denied"}
+
+
+def test_sync_dir_uploads_only_changes(s3_manager, tmp_path, monkeypatch):
+    """
+    Test that a second sync with no local change uploads nothing, and that
+    only the modified file is re-uploaded afterwards.
+    """
+    src = _make_tree(tmp_path / "processed")
+
+    first = s3_manager.sync_dir(str(src), prefix="latest")
+    assert sorted(first.succeeded) == [
+        "latest/nutrition_cleaned.csv", "latest/visuals/Age_hist.png", "latest/visuals/Fat_hist.png"
+    ]
+
+    calls = []
+    for method in ("upload_file", "put_object"):
+        original = getattr(s3_manager.s3, method)
+        monkeypatch.setattr(s3_manager.s3, method,
+                            lambda *a, _m=method, _o=original, **kw: calls.append(_m) or _o(*a, **kw))
+
+    unchanged = s3_manager.sync_dir(str(src), prefix="latest")
+    assert unchanged.succeeded == []
+    assert len(unchanged.skipped) == 3
+    assert calls == []
+
+    (src / "visuals" / "Age_hist.png").write_bytes(os.urandom(1000))
+    changed = s3_manager.sync_dir(str(src), prefix="latest")
+    assert changed.succeeded == ["latest/visuals/Age_hist.png"]
+    assert calls.count("upload_file") == 1
+
+
+def test_sync_dir_without_manifest_uses_etags(s3_manager, tmp_path):
+    """
+    Test that identical objects uploaded before the first sync are detected
+    through their ETag and not uploaded again.
+    """
+    src = _make_tree(tmp_path / "processed")
+    s3_manager.upload_dir(str(src), prefix="latest")
+    (src / "nutrition_cleaned.csv").write_text("Age,Gender\n30,Female\n")
+
+    result = s3_manager.sync_dir(str(src), prefix="latest")
+
+    assert result.succeeded == ["latest/nutrition_cleaned.csv"]
+    assert len(result.skipped) == 2
+
+
+def test_sync_dir_optional_delete(s3_manager, tmp_path):
+    """
+    Test that remote files removed locally are kept by default and deleted
+    only when delete=True.
+    """
+    src = _make_tree(tmp_path / "processed")
+    s3_manager.sync_dir(str(src), prefix="latest")
+    (src / "visuals" / "Fat_hist.png").unlink()
+
+    kept = s3_manager.sync_dir(str(src), prefix="latest")
+    assert kept.deleted == []
+    assert "latest/visuals/Fat_hist.png" in s3_manager.iter_keys("latest/")
+
+    pruned = s3_manager.sync_dir(str(src), prefix="latest", delete=True)
+    assert pruned.deleted == ["latest/visuals/Fat_hist.png"]
+    assert "latest/visuals/Fat_hist.png" not in s3_manager.iter_keys("latest/")
+
+
+def test_first_sync_ignores_sibling_prefixes(s3_manager, tmp_path):
+    """
+    Test that objects under "latest2/" neither enter the manifest of "latest"
+    nor get deleted by a first sync with delete=True.
+    """
+    _put_keys(s3_manager, ["latest2/x", "latest/stale.csv"])
+    src = _make_tree(tmp_path / "processed")
+
+    result = s3_manager.sync_dir(str(src), prefix="latest", delete=True)
+
+    assert result.ok
+    assert result.deleted == ["latest/stale.csv"]
+    manifest = s3_manager.s3.get_object(Bucket=s3_manager.bucket, Key="latest/.s3manifest.json")["Body"].read()
+    assert b"latest2" not in manifest
+    assert "latest2/x" in s3_manager.iter_keys("latest2/")
+
+
+def test_upload_dir_skips_local_manifest_cache(s3_manager, tmp_path):
+    """
+    Test that the .s3manifest.json cache written by sync_dir is not published by upload_dir.
+    """
+    src = _make_tree(tmp_path / "processed")
+    s3_manager.sync_dir(str(src), prefix="latest")
+
+    result = s3_manager.upload_dir(str(src), prefix="copy")
+
+    assert (src / ".s3manifest.json").exists()
+    assert result.files == 3
+    assert "copy/.s3manifest.json" not in s3_manager.iter_keys("copy/")
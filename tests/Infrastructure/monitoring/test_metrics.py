@@ -0,0 +1,162 @@
+# tests/Infrastructure/monitoring/test_metrics.py
+
+import json
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+
+from Infrastructure.monitoring import metrics
+from Infrastructure.monitoring.metrics import REGISTRY, instrument_call, instrument_engine, instrument_stage
+
+
+@pytest.fixture
+def enabled_metrics():
+    """
+    Enables instrumentation on a clean registry and restores the disabled state.
+    """
+    REGISTRY.reset()
+    metrics.enable()
+    yield REGISTRY
+    metrics.disable()
+    REGISTRY.reset()
+
+
+def test_disabled_instrumentation_records_nothing():
+    """
+    Test that decorated functions run untouched and record nothing when disabled.
+    """
+    REGISTRY.reset()
+
+    @instrument_stage("disabled_stage")
+    def stage(x):
+        return x + 1
+
+    assert stage(1) == 2
+    assert REGISTRY.snapshot() == {"stages": {}, "latencies": {}}
+
+
+def test_stage_records_time_calls_and_memory(enabled_metrics):
+    """
+    Test that a stage records calls, wall/CPU time and peak memory when tracked.
+    """
+    metrics.enable(track_memory=True)
+
+    @instrument_stage("allocate")
+    def allocate():
+        return bytearray(2_000_000)
+
+    allocate()
+    allocate()
+
+    stage = enabled_metrics.snapshot()["stages"]["allocate"]
+    assert stage["calls"] == 2
+    assert stage["wall_s"] >= 0 and stage["cpu_s"] >= 0
+    assert stage["peak_bytes"] >= 2_000_000
+
+
+def test_parent_stage_peak_includes_memory_freed_before_child(enabled_metrics):
+    """
+    Test that a parent stage keeps the peak it reached before calling a child stage.
+    """
+    metrics.enable(track_memory=True)
+
+    @instrument_stage("child")
+    def child():
+        return bytearray(1_000)
+
+    @instrument_stage("parent")
+    def parent():
+        buffer = bytearray(20_000_000)
+        del buffer
+        child()
+
+    parent()
+
+    stages = enabled_metrics.snapshot()["stages"]
+    assert stages["parent"]["peak_bytes"] >= 20_000_000
+    assert stages["child"]["peak_bytes"] < 20_000_000
+
+
+def test_pipeline_stages_are_instrumented(enabled_metrics):
+    """
+    Test that the cleaning step functions report as individual stages.
+    """
+    from back_end.data_pipeline.scripts.clean_nutrition_data import clean_nutrition_dataset
+
+    df = pd.DataFrame({
+        "Age": ["25"], "Gender": [" male "], "Height": ["180"], "Weight": ["75"],
+        "Activity Level": ["Moderately Active"], "Fitness Goal": ["Weight Loss"],
+        "Dietary Preference": ["Vegan"], "Daily Calorie Target": ["2000"], "Protein": ["100"],
+        "Carbohydrates": ["250"], "Fat": ["60"],
+    })
+    clean_nutrition_dataset(df)
+
+    stages = enabled_metrics.snapshot()["stages"]
+    assert stages["clean_nutrition_data.clean_nutrition_dataset"]["calls"] == 1
+    assert stages["clean_nutrition_data.validate_nutrition_dataset"]["calls"] == 1
+
+
+def test_call_latency_and_prometheus_output(enabled_metrics):
+    """
+    Test that call latencies are exported as a Prometheus histogram.
+    """
+    from back_end.models.model_utils.calories_calculator import parse_user_input
+
+    parse_user_input("I am 30 years old, 70 kg, 175 cm")
+
+    @instrument_call("s3", "upload")
+    def upload():
+        return None
+
+    upload()
+
+    body = enabled_metrics.render_prometheus()
+    assert "# TYPE fitness_call_latency_seconds histogram" in body
+    assert 'fitness_call_latency_seconds_count{category="model",name="parse_user_input"} 1' in body
+    assert 'fitness_call_latency_seconds_bucket{category="s3",name="upload",le="+Inf"} 1' in body
+
+
+def test_engine_queries_grouped_by_operation(enabled_metrics):
+    """
+    Test that SQLAlchemy queries are timed per operation, failed ones excluded.
+    """
+    engine = instrument_engine(create_engine("sqlite://"))
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE users (id INTEGER)"))
+        conn.execute(text("INSERT INTO users VALUES (1)"))
+        conn.execute(text("SELECT * FROM users")).fetchall()
+        with pytest.raises(Exception):
+            conn.execute(text("SELECT * FROM missing_table"))
+        conn.execute(text("SELECT id FROM users")).fetchall()
+
+    db = enabled_metrics.snapshot()["latencies"]["db"]
+    assert db["CREATE"]["count"] == 1
+    assert db["INSERT"]["count"] == 1
+    assert db["SELECT"]["count"] == 2
+
+
+def test_write_report(enabled_metrics, tmp_path):
+    """
+    Test that the JSON run report holds the recorded stages.
+    """
+    with enabled_metrics.stage("report_stage"):
+        pass
+
+    path = enabled_metrics.write_report(tmp_path / "report.json")
+    report = json.loads(path.read_text())
+    assert report["stages"]["report_stage"]["calls"] == 1
+
+
+def test_metrics_endpoint(enabled_metrics):
+    """
+    Test that the /metrics route serves the registry in the Prometheus format.
+    """
+    from back_end.api.metrics import PROMETHEUS_CONTENT_TYPE, metrics as metrics_route
+
+    with enabled_metrics.stage("endpoint_stage"):
+        pass
+
+    response = metrics_route()
+    assert response.media_type == PROMETHEUS_CONTENT_TYPE
+    assert b'fitness_stage_calls_total{stage="endpoint_stage"} 1' in response.body
@@ -0,0 +1,133 @@
+# tests/back_end/data_pipeline/test_etl.py
+
+import json
+from pathlib import Path
+
+import boto3
+import pandas as pd
+import pytest
+from moto import mock_aws
+from back_end.data_pipeline.scripts import clean_nutrition_data, load_nutrition_dataset
+
+SCRIPTS_DIR = Path(__file__).resolve().parents[3] / "back_end" / "data_pipeline" / "scripts"
+RAW_PATH = SCRIPTS_DIR / "data" / "raw" / "nutrition_raw.csv"
+TEST_BUCKET = "test-bucket"
+
+
+@pytest.fixture
+def raw_in_s3(monkeypatch):
+    """
+    Uploads the committed raw nutrition CSV to an in-memory moto bucket.
+
+    Returns:
+        str: S3 URI of the raw dataset.
+    """
+    monkeypatch.setenv("S3_BUCKET", TEST_BUCKET)
+    monkeypatch.setenv("AWS_REGION", "us-east-1")
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("S3_ENDPOINT_URL", raising=False)
+
+    with mock_aws():
+        client = boto3.client("s3", region_name="us-east-1")
+        client.create_bucket(Bucket=TEST_BUCKET)
+        client.upload_file(str(RAW_PATH), TEST_BUCKET, "raw/nutrition_raw.csv")
+        yield f"s3://{TEST_BUCKET}/raw/nutrition_raw.csv"
+
+
+@pytest.mark.parametrize("chunksize", [None, 64])
+def test_clean_from_s3_matches_local(raw_in_s3, tmp_path, chunksize):
+    """
+    Test that cleaning straight from S3, whole or chunked, gives the same
+    output as cleaning the local raw file.
+    """
+    local_out = tmp_path / "local.csv"
+    s3_out = tmp_path / "s3.csv"
+
+    clean_nutrition_data.run(input_path=str(RAW_PATH), output_path=str(local_out))
+    clean_nutrition_data.run(input_path=raw_in_s3, output_path=str(s3_out), chunksize=chunksize)
+
+    pd.testing.assert_frame_equal(pd.read_csv(s3_out), pd.read_csv(local_out))
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+@pytest.mark.parametrize("chunksize", [None, 100])
+def test_clean_writes_quarantine_and_report(tmp_path, chunksize, fmt):
+    """
+    Test that rejected rows are quarantined with their violations and that the
+    quality report accounts for every input row, for local CSV and Parquet input.
+    """
+    output = tmp_path / "cleaned.csv"
+    input_path = RAW_PATH
+    if fmt == "parquet":
+        input_path = tmp_path / "raw" / "nutrition_raw.parquet"
+        input_path.parent.mkdir()
+        pd.read_csv(RAW_PATH, dtype=str).to_parquet(input_path, index=False)
+
+    report = clean_nutrition_data.run(input_path=str(input_path), output_path=str(output), chunksize=chunksize)
+
+    quarantine = pd.read_csv(tmp_path / clean_nutrition_data.QUARANTINE_NAME)
+    saved = json.loads((tmp_path / clean_nutrition_data.QUALITY_REPORT_NAME).read_text())
+    assert saved == report.to_dict()
+    assert report.rows_in == len(pd.read_csv(RAW_PATH))
+    assert report.rows_kept == len(pd.read_csv(output))
+    assert report.rows_rejected == len(quarantine) == 2
+    assert report.violations["header_echo"] == 2
+    assert quarantine["violations"].str.startswith("header_echo;").all()
+
+    reference = tmp_path / "reference" / "cleaned.csv"
+    clean_nutrition_data.run(input_path=str(RAW_PATH), output_path=str(reference))
+    assert output.read_bytes() == reference.read_bytes()
+
+
+@pytest.fixture
+def local_dataset_dir(tmp_path):
+    """
+    Saves the committed raw CSV as a Hugging Face dataset directory, standing in
+    for the offline dataset cache.
+
+    Returns:
+        str: Directory readable by `load_from_disk`.
+    """
+    from datasets import Dataset
+
+    raw = pd.read_csv(RAW_PATH)
+    raw.loc[0, "Gender"] = "  male "  # exercise normalization
+    Dataset.from_pandas(raw, preserve_index=False).save_to_disk(str(tmp_path / "hf"))
+    return str(tmp_path / "hf")
+
+
+def test_arrow_path_matches_pandas_path(local_dataset_dir):
+    """
+    Test that the Arrow inspection/normalization helpers agree with the pandas ones,
+    loading the dataset offline from a local directory.
+    """
+    table = load_nutrition_dataset.load_nutrition_table(local_dataset_dir)
+    df = table.to_pandas()
+
+    arrow_summary = load_nutrition_dataset.inspect_table(table)
+    pandas_summary = load_nutrition_dataset.inspect_dataset(df)
+    for key in ("shape", "columns", "null_values", "duplicated_rows"):
+        assert arrow_summary[key] == pandas_summary[key]
+
+    assert (load_nutrition_dataset.preview_table_distributions(table)
+            == load_nutrition_dataset.preview_value_distributions(df))
+
+    normalized = load_nutrition_dataset.normalize_categorical_table(table)
+    pd.testing.assert_frame_equal(
+        normalized.to_pandas(),
+        load_nutrition_dataset.normalize_categorical_values(df.copy()),
+    )
+
+
+def test_arrow_run_writes_parquet_snapshot(local_dataset_dir, tmp_path):
+    """
+    Test that the Arrow mode writes a Parquet raw snapshot readable by the clean stage.
+    """
+    parquet_path = tmp_path / "raw" / "nutrition_raw.parquet"
+
+    load_nutrition_dataset.run(arrow=True, local_dir=local_dataset_dir, output_path=str(parquet_path))
+
+    snapshot = clean_nutrition_data.read_raw_dataset(str(parquet_path))
+    assert len(snapshot) == len(pd.read_csv(RAW_PATH))
+    assert snapshot.loc[0, "Gender"] == "Male"
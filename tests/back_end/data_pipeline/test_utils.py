@@ -0,0 +1,138 @@
+# tests/back_end/data_pipeline/test_utils.py
+
+import pandas as pd
+import pytest
+from back_end.data_pipeline.scripts.clean_nutrition_data import clean_nutrition_dataset
+from back_end.data_pipeline.utils import synthetic_data
+from back_end.data_pipeline.utils.quality_rules import (
+    AllowedValuesRule,
+    HeaderEchoRule,
+    NotNullRule,
+    QualityReport,
+    RangeRule,
+    RuleSet,
+)
+
+
+def test_nutrition_rows_follow_source_schema_and_distributions():
+    """
+    Test that generated rows keep the columns, categories and numeric correlations
+    of nutrition_cleaned.csv and survive the cleaning stage untouched.
+    """
+    source = pd.read_csv(synthetic_data.CLEANED_PATH)
+    generated = synthetic_data.generate("nutrition", 20_000, seed=1)
+
+    assert generated.columns.tolist() == source.columns.tolist()
+    for col in synthetic_data.CATEGORICAL_COLUMNS:
+        assert set(generated[col]) <= set(source[col])
+    corr = generated[synthetic_data.NUMERIC_COLUMNS].corr()
+    expected = source[synthetic_data.NUMERIC_COLUMNS].corr()
+    assert (corr - expected).abs().max().max() < 0.1
+    assert len(clean_nutrition_dataset(generated.copy())) == len(generated)
+
+
+def test_dirty_rows_are_removed_by_cleaning():
+    """
+    Test that injected header echoes and outliers are dropped, and padded rows kept.
+    """
+    dirty = synthetic_data.generate("nutrition", 3_000, seed=2, dirty_fraction=0.03)
+
+    cleaned = clean_nutrition_dataset(dirty.copy())
+
+    assert (dirty["Gender"] == "Gender").sum() == 30
+    assert len(cleaned) == 3_000 - 60
+    assert set(cleaned["Gender"]) == {"Male", "Female"}
+
+
+def test_generation_is_seeded():
+    """
+    Test that the same seed gives the same rows and a different seed does not.
+    """
+    first = synthetic_data.generate("diary", 200, seed=5)
+
+    pd.testing.assert_frame_equal(first, synthetic_data.generate("diary", 200, seed=5))
+    assert not first.equals(synthetic_data.generate("diary", 200, seed=6))
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_shards_do_not_depend_on_worker_count(tmp_path, fmt):
+    """
+    Test that sharded output is byte-identical with one or several processes.
+    """
+    single = synthetic_data.write_shards("intents", 2_500, str(tmp_path / "one"), fmt=fmt,
+                                         seed=3, shard_rows=1_000, workers=1)
+    parallel = synthetic_data.write_shards("intents", 2_500, str(tmp_path / "many"), fmt=fmt,
+                                           seed=3, shard_rows=1_000, workers=3)
+
+    assert [p.name for p in single] == ["part-00000." + fmt, "part-00001." + fmt, "part-00002." + fmt]
+    assert [p.read_bytes() for p in single] == [p.read_bytes() for p in parallel]
+    labels = pd.read_csv(single[0]) if fmt == "csv" else pd.read_parquet(single[0])
+    assert set(labels["label"]) == {"store_log", "user_profile", "ask_advice"}
+
+
+@pytest.fixture
+def rules():
+    """
+    Fixture providing a small rule set covering every rule type.
+
+    Returns:
+        RuleSet: Header echo, null policy, range and allowed-values rules.
+    """
+    return RuleSet([
+        HeaderEchoRule(["Gender"]),
+        NotNullRule(["Age"]),
+        RangeRule("Age", 10, 100),
+        AllowedValuesRule("Gender", ["Male", "Female"]),
+    ])
+
+
+def test_rule_set_builds_violation_matrix(rules):
+    """
+    Test the mask matrix, per-rule counts and the accepted/quarantined split.
+    """
+    df = pd.DataFrame({
+        "Age": [25.0, None, 150.0, 30.0, None],
+        "Gender": ["Male", "gender", "Female", "Other", "GENDER"],
+    })
+
+    result = rules.validate(df)
+
+    assert result.mask.shape == (5, 4)
+    assert result.mask.tolist() == [
+        [False, False, False, False],
+        [True, True, False, True],
+        [False, False, True, False],
+        [False, False, False, True],
+        [True, True, False, True],
+    ]
+    assert result.counts == {"header_echo": 2, "not_null": 2, "range:Age": 1, "allowed:Gender": 3}
+    assert result.accepted().index.tolist() == [0]
+
+    quarantine = result.rejected()
+    assert quarantine.index.tolist() == [1, 2, 3, 4]
+    assert quarantine.loc[1, "violations"] == "header_echo;not_null;allowed:Gender"
+    assert quarantine.loc[2, "violations"] == "range:Age"
+
+
+def test_rule_names_must_be_unique():
+    """
+    Test that two rules reporting under the same name are rejected.
+    """
+    with pytest.raises(ValueError):
+        RuleSet([RangeRule("Age", 0, 1), RangeRule("Age", 2, 3)])
+
+
+def test_quality_report_accumulates_chunks(rules):
+    """
+    Test that validating chunk by chunk gives the counts of a single pass.
+    """
+    df = pd.DataFrame({"Age": [25.0, None, 150.0, 30.0] * 5, "Gender": ["Male", "Gender", "Female", "x"] * 5})
+
+    whole = QualityReport().update(rules.validate(df))
+    chunked = QualityReport()
+    for start in range(0, len(df), 6):
+        chunked.update(rules.validate(df.iloc[start:start + 6]))
+
+    assert chunked.to_dict() == whole.to_dict()
+    assert whole.rows_rejected == 15
+
@@ -0,0 +1,202 @@
+# tests/back_end/database/queries/test_user_queries.py
+
+import pytest
+from pathlib import Path
+from sqlalchemy import text
+from back_end.database.connect import DatabaseConnector
+from back_end.database.queries.user_queries import (
+    COHORT_VIEW,
+    COHORT_VIEW_COUNTS_SQL,
+    USER_PROFILE_SQL,
+    USERS_BY_DIET_SQL,
+    USERS_BY_FITNESS_LEVEL_SQL,
+    USERS_BY_GOAL_SQL,
+    cohort_counts,
+    create_cohort_summary_view,
+    explain,
+    get_user_profile,
+    plan_nodes,
+    refresh_cohort_summary,
+    users_by_diet,
+    users_by_fitness_level,
+    users_by_goal,
+)
+
+N_USERS = 20_000
+
+
+@pytest.fixture
+def db():
+    """
+    Fixture providing a session on a database holding N_USERS synthetic users.
+
+    Labels are skewed like real data: 'keto', 'advanced' and 'Improve endurance'
+    are rare (0.4-3% of users), which is where the composite indexes matter.
+    Every user has one goal and every third user also 'Tone muscles'.
+
+    Yields:
+        Session: SQLAlchemy session, closed and emptied after the test.
+    """
+    root_path = Path(__file__).resolve().parents[4]
+    dotenv_path = root_path / "env_folder" / ".env.postgre"
+    connector = DatabaseConnector(dotenv_path=str(dotenv_path))
+    connector.execute_schema()
+
+    session = connector.get_session()
+    session.execute(text(f"DROP MATERIALIZED VIEW IF EXISTS {COHORT_VIEW}"))
+    session.execute(text("TRUNCATE user_goals, users, genders, diet_types, fitness_levels, goals RESTART IDENTITY CASCADE"))
+    session.execute(text("INSERT INTO genders (label) VALUES ('male'), ('female'), ('other')"))
+    session.execute(text("INSERT INTO diet_types (label) VALUES ('vegetarian'), ('vegan'), ('keto'), ('none')"))
+    session.execute(text("INSERT INTO fitness_levels (label) VALUES ('beginner'), ('intermediate'), ('advanced')"))
+    session.execute(text(
+        "INSERT INTO goals (label) VALUES ('Lose weight'), ('Gain muscle'), ('Improve endurance'), ('Tone muscles')"
+    ))
+    session.execute(text("""
+        INSERT INTO users (age, gender_id, height, weight, target_weight, diet_type_id, fitness_level_id)
+        SELECT 18 + i % 60, 1 + i % 3, 150 + i % 50, 50 + i % 60, 55 + i % 40,
+               CASE WHEN i % 200 = 0 THEN 3 WHEN i % 3 = 0 THEN 4 ELSE 1 + i % 2 END,
+               CASE WHEN i % 250 = 0 THEN 3 ELSE 1 + (i / 7) % 2 END
+        FROM generate_series(1, :n) AS i
+    """), {"n": N_USERS})
+    session.execute(text(
+        "INSERT INTO user_goals SELECT user_id, CASE WHEN user_id % 30 = 1 THEN 3 ELSE 1 + user_id % 2 END FROM users"
+    ))
+    session.execute(text("INSERT INTO user_goals SELECT user_id, 4 FROM users WHERE user_id % 3 = 0"))
+    session.commit()
+    session.execute(text("ANALYZE users, user_goals, genders, diet_types, fitness_levels, goals"))
+
+    yield session
+
+    session.rollback()
+    session.execute(text(f"DROP MATERIALIZED VIEW IF EXISTS {COHORT_VIEW}"))
+    session.execute(text("TRUNCATE user_goals, users RESTART IDENTITY CASCADE"))
+    session.commit()
+    session.close()
+
+
+def assert_index_plan(plan: dict, index_name: str):
+    """
+    Checks that a plan reads `users` / `user_goals` through indexes only and
+    uses `index_name` (plain or bitmap index scan).
+    """
+    nodes = list(plan_nodes(plan))
+    seq_scanned = {node.get("Relation Name") for node in nodes if node["Node Type"] == "Seq Scan"}
+    assert not seq_scanned & {"users", "user_goals"}, seq_scanned
+    assert index_name in {node.get("Index Name") for node in nodes}
+
+
+@pytest.mark.parametrize("sql, ref_id, index_name", [
+    (USERS_BY_DIET_SQL, 3, "idx_users_diet_type_user"),             # keto
+    (USERS_BY_FITNESS_LEVEL_SQL, 3, "idx_users_fitness_level_user"),  # advanced
+    (USERS_BY_GOAL_SQL, 3, "idx_user_goals_goal_user"),              # Improve endurance
+], ids=["diet", "fitness_level", "goal"])
+def test_listing_plans_use_keyset_index(db, sql, ref_id, index_name):
+    """
+    Test that first and deep pages of a selective listing are both served by
+    the composite index, never by a sequential scan.
+    """
+    for after in (0, N_USERS // 2):
+        plan = explain(db, sql, {"ref_id": ref_id, "after": after, "limit": 51})
+        assert_index_plan(plan, index_name)
+
+
+def test_common_label_plan_never_scans_whole_table(db):
+    """
+    Test that a listing on a frequent label still reads users in key order
+    from the cursor on (any index, no sequential scan, no sort).
+    """
+    plan = explain(db, USERS_BY_DIET_SQL, {"ref_id": 1, "after": N_USERS // 2, "limit": 51})
+    nodes = list(plan_nodes(plan))
+    assert not any(node["Node Type"] == "Seq Scan" and node.get("Relation Name") == "users" for node in nodes)
+    assert not any(node["Node Type"] in ("Sort", "Incremental Sort") for node in nodes)
+
+
+def test_profile_plan_uses_primary_keys(db):
+    """
+    Test that a profile lookup goes through the users and user_goals primary keys.
+    """
+    plan = explain(db, USER_PROFILE_SQL, {"user_id": 1234})
+    nodes = list(plan_nodes(plan))
+    index_names = {node.get("Index Name") for node in nodes}
+    assert {"users_pkey", "user_goals_pkey"} <= index_names
+    assert not any(
+        node["Node Type"] == "Seq Scan" and node.get("Relation Name") in ("users", "user_goals")
+        for node in nodes
+    )
+
+
+def test_keyset_pagination_walks_every_user_once(db):
+    """
+    Test that following the cursors returns each matching user exactly once, in order.
+    """
+    seen, after = [], None
+    while True:
+        page = users_by_diet(db, "keto", after=after, limit=500)
+        seen += [row["user_id"] for row in page.items]
+        if page.next_cursor is None:
+            break
+        after = page.next_cursor
+
+    expected = db.execute(text(
+        "SELECT user_id FROM users WHERE diet_type_id = 3 ORDER BY user_id"
+    )).scalars().all()
+    assert seen == expected
+    assert all(row["diet_type"] == "keto" for row in page.items)
+
+
+def test_listing_filters_and_labels(db):
+    """
+    Test goal and fitness-level listings return labelled rows of the right cohort.
+    """
+    page = users_by_goal(db, "Improve endurance", limit=10)
+    assert len(page.items) == 10 and page.next_cursor == page.items[-1]["user_id"]
+    assert all(row["user_id"] % 30 == 1 for row in page.items)
+
+    page = users_by_fitness_level(db, "advanced", limit=5)
+    assert [row["user_id"] for row in page.items] == [250, 500, 750, 1000, 1250]
+    assert {row["fitness_level"] for row in page.items} == {"advanced"}
+    assert set(page.items[0]) == {
+        "user_id", "age", "gender", "height", "weight", "target_weight", "diet_type", "fitness_level"
+    }
+
+    assert users_by_diet(db, "paleo").items == []
+
+
+def test_get_user_profile(db):
+    """
+    Test that a profile carries every label and the sorted list of goals.
+    """
+    profile = get_user_profile(db, 3)
+    assert profile["gender"] == "male"
+    assert profile["diet_type"] == "none"
+    assert profile["fitness_level"] == "beginner"
+    assert profile["goals"] == ["Gain muscle", "Tone muscles"]
+    assert get_user_profile(db, N_USERS + 1) is None
+
+
+def test_cohort_view_matches_live_counts_after_concurrent_refresh(db):
+    """
+    Test the materialized cohort summary: same counts as the live aggregate,
+    read without touching the base tables, and refreshable concurrently.
+    """
+    create_cohort_summary_view(db)
+    db.commit()
+
+    live = cohort_counts(db)
+    assert sum(row["user_count"] for row in live) == N_USERS + N_USERS // 3
+    assert cohort_counts(db, use_view=True) == live
+
+    relations = {node.get("Relation Name") for node in plan_nodes(explain(db, COHORT_VIEW_COUNTS_SQL))}
+    assert relations - {None} == {COHORT_VIEW}
+
+    db.execute(text("INSERT INTO users (age, gender_id, height, weight, target_weight, diet_type_id, fitness_level_id) "
+                    "VALUES (40, 3, 170, 70, 65, 2, 3)"))
+    db.commit()
+    assert cohort_counts(db, use_view=True) == live
+
+    refresh_cohort_summary(db, concurrently=True)
+    db.commit()
+    refreshed = cohort_counts(db, use_view=True)
+    assert refreshed == cohort_counts(db)
+    assert {"gender": "other", "diet_type": "vegan", "fitness_level": "advanced", "goal": None,
+            "user_count": 1} in refreshed
@@ -0,0 +1,218 @@
+# tests/back_end/models/test_nlp.py
+
+import pytest
+from back_end.models.model_utils.calories_calculator import calculate_caloric_needs, parse_user_input
+from back_end.models.nlp.food_gazetteer import (
+    FoodGazetteer,
+    build_gazetteer,
+    diary_sentences,
+    extract_foods,
+    food_phrases,
+)
+from back_end.models.nlp.plan_evaluation import (
+    GenerationCache,
+    evaluate_plans,
+    plan_structure,
+    rouge_scores,
+    score_plans,
+)
+
+
+def test_parse_user_input_extracts_profile():
+    """
+    Test that the notebook example message is parsed into calculator arguments.
+    """
+    parsed = parse_user_input(
+        "I am a 29 years old woman, 56 kg., 163 cm., moderately active. I want to lose 2 kg in 2 months."
+    )
+
+    assert parsed == {
+        "weight_kg": 56.0,
+        "height_cm": 163.0,
+        "age": 29,
+        "sex": "female",
+        "activity_level": "moderate",
+        "goal": "lose",
+        "target_weight_change_kg": 2.0,
+        "duration_weeks": 8,
+    }
+
+
+def test_calculate_caloric_needs_weight_loss():
+    """
+    Test BMR (Mifflin-St Jeor), TDEE and the daily deficit for a weight-loss goal.
+    """
+    result = calculate_caloric_needs(56.0, 163.0, 29, "female", "moderate", "lose", 2.0, 8)
+
+    assert result == {
+        "BMR": 1272.75,
+        "TDEE": 1972.76,
+        "Daily Caloric Adjustment": -275.0,
+        "Recommended Daily Calories": 1697.76,
+    }
+
+
+def test_calculate_caloric_needs_requires_duration_for_goal():
+    """
+    Test that a loss/gain goal without a timeframe is rejected.
+    """
+    with pytest.raises(ValueError):
+        calculate_caloric_needs(80.0, 180.0, 40, "male", "active", "gain")
+
+
+@pytest.fixture
+def gazetteer():
+    """
+    Gazetteer built from two meal suggestions and one diary sentence.
+    """
+    meals = ["1 cup oatmeal with berries and nuts", "Black bean burger with sweet potato fries"]
+    diary = ["Had greek yogurt with honey for breakfast.", "Ran 5 miles this morning."]
+    return build_gazetteer(meals, diary)
+
+
+def test_food_phrases_split_meal_descriptions():
+    """
+    Test that connectors, quantities and determiners are stripped from meal descriptions.
+    """
+    assert food_phrases("1 cup oatmeal with berries and nuts") == ["oatmeal", "berries", "nuts"]
+    assert food_phrases("A banana and a handful of almonds") == ["banana", "almonds"]
+
+
+def test_gazetteer_matches_longest_whole_phrases(gazetteer):
+    """
+    Test leftmost-longest matching on whole tokens, with offsets into the raw sentence.
+    """
+    assert "greek yogurt" in gazetteer
+    assert "ran 5 miles this morning" not in gazetteer
+
+    sentence = "Had Sweet-Potato fries, nuts and peanuts after the black bean burger."
+    entities = gazetteer.find(sentence)
+
+    assert [entity.text for entity in entities] == ["Sweet-Potato fries", "nuts", "black bean burger"]
+    assert all(sentence[e.start:e.end] == e.text and e.source == "gazetteer" for e in entities)
+    assert FoodGazetteer(["a b", "b c d", "c"]).find("a b c d")[1].text == "c"
+
+
+def test_extract_foods_sends_only_misses_to_ner_in_batches(gazetteer):
+    """
+    Test that the NER fallback only sees distinct sentences without a gazetteer match.
+    """
+    calls = []
+
+    def stub_ner(batch):
+        calls.append(list(batch))
+        return [[{"entity_group": "FOOD", "start": 4, "end": 9}, {"entity_group": "TIME", "start": 0, "end": 3}]
+                for _ in batch]
+
+    sentences = ["Had oatmeal with berries for breakfast.", "Ate pasta late.", "Ate pizza now.",
+                 "Ate pasta late.", "Ate tacos today.", "Did yoga."]
+    result = extract_foods(sentences, gazetteer, ner=stub_ner, batch_size=2, labels=["FOOD"])
+
+    assert calls == [["Ate pasta late.", "Ate pizza now."], ["Ate tacos today.", "Did yoga."]]
+    assert [[e.text for e in entities] for entities in result.entities] == [
+        ["oatmeal", "berries"], ["pasta"], ["pizza"], ["pasta"], ["tacos"], ["yoga."]]
+    assert result.entities[1][0].source == "ner"
+
+    report = result.report.to_dict()
+    assert report["sentences"] == 6
+    assert report["distinct_sentences"] == 5
+    assert report["gazetteer_matched"] == 1
+    assert report["ner_sentences"] == 4
+    assert report["coverage"] == 1.0
+    assert report["gazetteer_coverage"] == 0.2
+
+
+def test_diary_meal_sentences_are_covered_by_gazetteer():
+    """
+    Test that every meal sentence of the diary corpus is matched without the NER model.
+    """
+    sentences = diary_sentences()
+    gazetteer = build_gazetteer(diary=sentences)
+    meals = [sentence for sentence in set(sentences) if sentence.startswith("Had ")]
+
+    result = extract_foods(meals, gazetteer)
+
+    assert meals and all(result.entities)
+    assert result.report.ner_sentences == 0
+
+
+REFERENCE_PLAN = (
+    "Monday:\n- Squats: 3 sets of 10 reps\n- Planks: 3 sets of 20 reps\nTuesday:\n- Rest Day\n"
+    "Wednesday:\n- Burpees: 3 sets of 6 reps\nThursday:\n- Rest Day\nFriday:\n- Pull-ups: 3x8\n"
+    "Saturday:\n- Walking: 30 minutes\nSunday:\n- Rest Day"
+)
+
+
+class StubPlanModel:
+    """
+    Tiny local stand-in for the plan model: echoes the reference plan, cut to
+    `max_new_tokens` lines, and records every batch it receives.
+    """
+
+    def __init__(self):
+        self.batches = []
+
+    def __call__(self, prompts, max_new_tokens=512, do_sample=False):
+        self.batches.append(list(prompts))
+        return ["\n".join(REFERENCE_PLAN.splitlines()[:max_new_tokens]) for _ in prompts]
+
+
+@pytest.fixture
+def plan_examples():
+    """
+    Five prompts, one of them repeated.
+    """
+    prompts = [f"I am {age} years old, create a 7-day workout plan." for age in (20, 30, 40, 50)]
+    return [{"prompt": prompt, "reference": REFERENCE_PLAN} for prompt in prompts + prompts[:1]]
+
+
+def test_plan_structure_and_rouge():
+    """
+    Test the structure checks and that ROUGE is 1 on identical plans, 0 on disjoint ones.
+    """
+    structure = plan_structure(REFERENCE_PLAN)
+
+    assert structure["days_present"] == 7 and structure["all_days"]
+    assert structure["rest_days"] == 3
+    assert structure["exercises"] == 5
+    assert structure["sets_reps_parsed"] == 4
+    assert rouge_scores(REFERENCE_PLAN, REFERENCE_PLAN) == {"rouge1": 1.0, "rouge2": 1.0, "rougeL": 1.0}
+    assert rouge_scores("lunges today", REFERENCE_PLAN)["rouge1"] == 0.0
+    assert rouge_scores("b a c", "a b c")["rougeL"] == pytest.approx(2 / 3)
+
+
+def test_evaluation_generates_in_batches_and_rescoring_hits_cache(plan_examples, tmp_path):
+    """
+    Test batched generation of the distinct prompts, then a rerun served
+    entirely from the disk cache; new generation params are a cache miss.
+    """
+    cache = GenerationCache(tmp_path / "generations")
+    model = StubPlanModel()
+
+    first = evaluate_plans(plan_examples, model, "stub", cache=cache, batch_size=3, workers=1)
+    assert [len(batch) for batch in model.batches] == [3, 1]
+    assert first.summary["generated"] == 4 and first.summary["cache_hits"] == 0
+    assert first.summary["rouge1"] == 1.0 and first.summary["all_days"] == 1.0
+
+    rerun = evaluate_plans(plan_examples, model, "stub", cache=GenerationCache(tmp_path / "generations"),
+                           batch_size=3, workers=1)
+    assert len(model.batches) == 2
+    assert rerun.summary["cache_hits"] == 4 and rerun.summary["generated"] == 0
+    assert rerun.scores == first.scores
+
+    short = evaluate_plans(plan_examples, model, "stub", params={"max_new_tokens": 4}, cache=cache, workers=1)
+    assert short.summary["generated"] == 4
+    assert short.summary["days_present"] == 2.0
+    assert short.summary["rouge1"] < 1.0
+
+
+def test_parallel_scoring_matches_inline():
+    """
+    Test that scoring in worker processes returns the inline scores, in order.
+    """
+    predictions = ["\n".join(REFERENCE_PLAN.splitlines()[:n]) for n in range(1, 13)]
+    references = [REFERENCE_PLAN] * len(predictions)
+
+    assert score_plans(predictions, references, workers=2) == score_plans(predictions, references, workers=1)
+    with pytest.raises(ValueError):
+        score_plans(predictions, references[:1])
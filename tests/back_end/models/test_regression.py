@@ -0,0 +1,89 @@
+# tests/back_end/models/test_regression.py
+
+import numpy as np
+import pandas as pd
+import pytest
+from back_end.models.regression.cohort_table import CohortTable
+
+
+@pytest.fixture
+def nutrition_df():
+    """
+    Cleaned-like rows: one well-populated cohort, one single-row cohort and a
+    row with an unknown category (ignored by the table).
+    """
+    rows = [("Female", "Sedentary", "Weight Loss", "Vegan", 1500 + 100 * i, 60 + i, 150, 40) for i in range(6)]
+    rows += [("Female", "Sedentary", "Weight Loss", "Omnivore", 1800, 90, 180, 60)]
+    rows += [("Male", "Very Active", "Muscle Gain", "Omnivore", 3000, 180, 350, 90)]
+    rows += [("Other", "Very Active", "Muscle Gain", "Omnivore", 9999, 999, 999, 999)]
+    return pd.DataFrame(rows, columns=["Gender", "Activity Level", "Fitness Goal", "Dietary Preference",
+                                       "Daily Calorie Target", "Protein", "Carbohydrates", "Fat"])
+
+
+def test_lookup_matches_pandas_aggregates(nutrition_df):
+    """
+    Test that a populated cohort returns the exact mean and percentiles of its rows.
+    """
+    table = CohortTable.from_frame(nutrition_df)
+    result = table.lookup("Female", "Sedentary", "Weight Loss", "Vegan")
+    calories = nutrition_df["Daily Calorie Target"].iloc[:6]
+
+    assert result["cohort_size"] == 6
+    assert result["fallback_level"] == 0
+    assert result["Daily Calorie Target"]["mean"] == calories.mean()
+    assert result["Daily Calorie Target"]["median"] == calories.median()
+    assert result["Daily Calorie Target"]["p90"] == calories.quantile(0.9)
+    assert table.counts[-1, -1, -1, -1] == 8
+
+
+def test_sparse_and_missing_cohorts_fall_back(nutrition_df):
+    """
+    Test that sparse cohorts use the first coarser cohort with enough rows and
+    that missing labels are treated as "any".
+    """
+    table = CohortTable.from_frame(nutrition_df)
+    result = table.lookup_batch({
+        "Gender": ["Female", "Male", "Female"],
+        "Activity Level": ["Sedentary", "Very Active", "Sedentary"],
+        "Fitness Goal": ["Weight Loss", "Muscle Gain", "Weight Loss"],
+        "Dietary Preference": ["Omnivore", "Omnivore", None],
+    }, min_count=5)
+
+    # Without its diet, the Female cohort has 7 rows; the Male one never reaches 5.
+    # A missing diet already reads the "any diet" cell at level 0.
+    assert result.levels.tolist() == [1, 4, 0]
+    assert result.counts.tolist() == [7, 8, 7]
+    frame = result.to_frame()
+    assert frame.loc[2, "Protein mean"] == nutrition_df["Protein"].iloc[:7].mean()
+    assert list(frame.columns[:3]) == ["cohort_size", "fallback_level", "Daily Calorie Target mean"]
+
+
+@pytest.mark.parametrize("labels", [
+    ("Female", "Sedentary", "Weight Loss", "Paleo"),
+    ("Female", "Sedentary", "Weight Loss", "Vegatarian"),
+    ("female", "Sedentary", "Weight Loss", "Vegan"),
+])
+def test_unknown_labels_are_rejected(nutrition_df, labels):
+    """
+    Test that an unknown or misspelled label raises instead of answering with
+    the whole population as if it were an exact cohort.
+    """
+    table = CohortTable.from_frame(nutrition_df)
+
+    with pytest.raises(ValueError, match="Unknown"):
+        table.lookup(*labels)
+
+
+def test_save_and_memory_mapped_load(nutrition_df, tmp_path):
+    """
+    Test that a saved table loads memory-mapped and answers identically.
+    """
+    table = CohortTable.from_frame(nutrition_df)
+    table.save(tmp_path / "cohorts")
+    loaded = CohortTable.load(tmp_path / "cohorts", mmap=True)
+
+    assert isinstance(loaded.stats, np.memmap)
+    assert loaded.lookup("Male", "Very Active", "Muscle Gain", "Omnivore", min_count=1) == \
+        table.lookup("Male", "Very Active", "Muscle Gain", "Omnivore", min_count=1)
+    with pytest.raises(ValueError):
+        CohortTable(table.stats[:1], table.counts)
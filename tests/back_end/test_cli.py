@@ -0,0 +1,106 @@
+# tests/back_end/test_cli.py
+
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from back_end import cli
+from back_end.data_pipeline.scripts import clean_nutrition_data
+
+PROJECT_ROOT = Path(__file__).resolve().parents[2]
+
+# Modules the `--help` path must not pull in
+HEAVY_MODULES = ["pandas", "numpy", "sqlalchemy", "boto3", "dotenv", "matplotlib", "sklearn", "datasets"]
+
+
+def test_help_imports_no_heavy_dependency(tmp_path):
+    """
+    Test that `--help` of every command works outside the project root (with
+    the root on PYTHONPATH) without importing pandas, SQLAlchemy, boto3 & co.
+    """
+    code = (
+        "import sys\n"
+        "from back_end import cli\n"
+        "for argv in (['--help'], ['clean', '--help'], ['s3', 'sync', '--help']):\n"
+        "    try:\n"
+        "        cli.main(argv)\n"
+        "    except SystemExit:\n"
+        "        pass\n"
+        f"print(sorted(m for m in {HEAVY_MODULES!r} if m in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=tmp_path, capture_output=True, text=True,
+        env={"PYTHONPATH": str(PROJECT_ROOT), "PATH": ""}, check=True,
+    )
+    assert "migrate" in result.stdout
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_importing_scripts_has_no_side_effects(tmp_path, monkeypatch):
+    """
+    Test that the pipeline and database modules import without creating
+    folders in the working directory or connecting to a database.
+    """
+    monkeypatch.chdir(tmp_path)
+    code = (
+        "import back_end.data_pipeline.scripts.analyze_cleaned_data, "
+        "back_end.database.seed_postgres, back_end.database.reset_db, Infrastructure.aws.s3.config"
+    )
+    subprocess.run([sys.executable, "-c", code], env={"PYTHONPATH": str(PROJECT_ROOT), "PATH": "",
+                                                      "POSTGRES_HOST": "unreachable.invalid"}, check=True)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_clean_command_uses_project_paths_and_arguments(tmp_path, monkeypatch):
+    """
+    Test that `clean` forwards its options and keeps the module defaults otherwise.
+    """
+    calls = []
+    monkeypatch.setattr(clean_nutrition_data, "run", lambda **kwargs: calls.append(kwargs))
+
+    assert cli.main(["clean", "--chunksize", "500", "--output", str(tmp_path / "out.csv")]) == 0
+    assert calls == [{"chunksize": 500, "output_path": str(tmp_path / "out.csv")}]
+    assert Path(clean_nutrition_data.INPUT_PATH).is_absolute()
+    assert Path(clean_nutrition_data.INPUT_PATH).exists()
+
+
+def test_clean_command_end_to_end(tmp_path, monkeypatch):
+    """
+    Test a real `clean` run from an unrelated working directory.
+    """
+    monkeypatch.chdir(tmp_path)
+    output = tmp_path / "cleaned.csv"
+
+    assert cli.main(["clean", "--output", str(output)]) == 0
+    assert len(pd.read_csv(output)) == 498
+
+
+def test_cohort_table_command_builds_loadable_table(tmp_path):
+    """
+    Test that `cohort-table` saves a table that loads memory-mapped.
+    """
+    from back_end.models.regression.cohort_table import CohortTable
+
+    assert cli.main(["cohort-table", "--output", str(tmp_path / "cohorts")]) == 0
+    table = CohortTable.load(tmp_path / "cohorts")
+    assert table.counts[-1, -1, -1, -1] == 498
+
+
+def test_reset_requires_confirmation(capsys):
+    """
+    Test that `reset` refuses to drop tables without --yes.
+    """
+    assert cli.main(["reset"]) == 1
+    assert "--yes" in capsys.readouterr().out
+
+
+def test_unknown_command_exits():
+    """
+    Test that a missing or unknown command is a usage error.
+    """
+    with pytest.raises(SystemExit):
+        cli.main([])
+    with pytest.raises(SystemExit):
+        cli.main(["deploy"])
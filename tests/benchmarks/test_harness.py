@@ -0,0 +1,61 @@
+# tests/benchmarks/test_harness.py
+
+from benchmarks.harness import compare, environment_mismatch, measure, normalize
+
+
+def _doc(**timings):
+    return {"benchmarks": {name: {"min_s": value} for name, value in timings.items()}}
+
+
+def test_measure_reports_throughput():
+    """
+    Test that measure() runs warmup + repeat calls and derives items per second.
+    """
+    calls = []
+    result = measure(lambda: calls.append(1), repeat=4, warmup=2, items=100)
+
+    assert len(calls) == 6
+    assert result["repeat"] == 4
+    assert result["min_s"] <= result["median_s"]
+    assert result["items"] == 100 and result["items_per_s"] > 0
+
+
+def test_compare_flags_only_slowdowns_beyond_threshold():
+    """
+    Test that regressions respect the default and per-benchmark thresholds,
+    and that benchmarks missing from the baseline are ignored.
+    """
+    baseline = {**_doc(clean=1.0, parse=1.0, stats=1.0), "thresholds": {"stats": 1.0}}
+    results = _doc(clean=1.3, parse=1.1, stats=1.9, new=5.0)
+
+    regressions = compare(results, baseline, threshold=0.25)
+
+    assert [r["name"] for r in regressions] == ["clean"]
+    assert regressions[0]["ratio"] == 1.3
+
+
+def test_compare_uses_calibration_units_when_available():
+    """
+    Test that a uniformly slower machine is not flagged once timings are
+    normalized, and that the current best run is compared with the baseline median.
+    """
+    baseline = {"benchmarks": normalize({"clean": {"min_s": 0.8, "median_s": 1.0}}, calibration_s=0.02)}
+    slower_machine = {"benchmarks": normalize({"clean": {"min_s": 1.6, "median_s": 2.0}}, calibration_s=0.04)}
+    regressed = {"benchmarks": normalize({"clean": {"min_s": 1.4, "median_s": 1.5}}, calibration_s=0.02)}
+
+    assert baseline["benchmarks"]["clean"] == {"min_s": 0.8, "median_s": 1.0, "min_units": 40.0, "median_units": 50.0}
+    assert compare(slower_machine, baseline, threshold=0.25) == []
+    assert [r["ratio"] for r in compare(regressed, baseline, threshold=0.25)] == [1.4]
+
+
+def test_environment_mismatch_lists_differing_fields():
+    """
+    Test that platform/processor/python differences are reported and that an
+    older baseline without metadata is considered comparable.
+    """
+    current = {"platform": "Linux-x86_64", "processor": "x86_64", "python": "3.11.9", "timestamp": "now"}
+    baseline = {**current, "processor": "arm", "timestamp": "then"}
+
+    assert environment_mismatch(current, baseline) == {"processor": {"baseline": "arm", "current": "x86_64"}}
+    assert environment_mismatch(current, {**current, "timestamp": "then"}) == {}
+    assert environment_mismatch(current, {}) == {}